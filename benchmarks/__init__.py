@@ -0,0 +1 @@
+"""Benchmark suite for jrnl. Run with: python -m benchmarks.run --help"""
@@ -0,0 +1,61 @@
+"""
+Compare two benchmark result files.
+
+    python -m benchmarks.compare old.json new.json [--threshold 0.1]
+
+Prints every timing median and throughput side by side and exits with 1 if
+any got worse by more than the threshold.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, Tuple
+
+# Leaf keys that are compared, and whether a larger value is better
+METRICS = {'median': False, 'p95': False, 'rows_per_sec': True}
+
+
+def flatten(data: Dict, prefix: str = '') -> Iterator[Tuple[str, str, float]]:
+    """Yield (path, metric, value) for every comparable leaf."""
+    for key, value in data.items():
+        if key == 'meta':
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten(value, path)
+        elif key in METRICS and isinstance(value, (int, float)):
+            yield prefix, key, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare jrnl benchmark results')
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative change counted as a regression (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    with open(args.old) as f:
+        old = {(path, metric): value for path, metric, value in flatten(json.load(f))}
+    with open(args.new) as f:
+        new = {(path, metric): value for path, metric, value in flatten(json.load(f))}
+
+    regressions = 0
+    width = max((len(path) + len(metric) + 1 for path, metric in new), default=20)
+    for (path, metric), new_value in sorted(new.items()):
+        old_value = old.get((path, metric))
+        if old_value is None or old_value == 0:
+            print(f"{path}.{metric:{width - len(path) - 1}}  {'-':>10}  {new_value:10.4f}")
+            continue
+        change = (new_value - old_value) / old_value
+        worse = change < -args.threshold if METRICS[metric] else change > args.threshold
+        regressions += worse
+        flag = '  REGRESSION' if worse else ''
+        print(f"{path}.{metric:{width - len(path) - 1}}  {old_value:10.4f}  {new_value:10.4f}  {change:+7.1%}{flag}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""
+Local stand-in for the Anthropic and Ollama HTTP APIs.
+
+Serves the endpoints jrnl calls, with configurable latency and error rate,
+so provider-bound paths can be benchmarked offline and deterministically:
+
+    POST /v1/messages     Anthropic Messages API, incl. streaming
+    POST /v1/chat/completions  OpenAI-compatible chat (llama.cpp, vLLM), incl. streaming
+    GET  /v1/models       OpenAI-compatible health check
+    POST /api/generate    Ollama generate, incl. streaming
+    POST /api/embed       Ollama embeddings
+    GET  /api/tags        Ollama health check
+
+Run standalone with: python -m benchmarks.fake_llm_server --port 8765 --latency 0.5
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+EMBEDDING_DIM = 64
+
+
+class FakeLLMConfig:
+    """Behaviour knobs shared by all request handlers."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None,
+                 token_delay: float = 0.0):
+        self.latency = latency
+        self.token_delay = token_delay
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def next_delay_and_error(self):
+        with self.lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay, failed
+
+
+def fake_summary(prompt: str) -> str:
+    """Deterministic short reply derived from the prompt."""
+    digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:8]
+    return f"Completed work item {digest} ({len(prompt)} prompt chars)"
+
+
+def fake_embedding(text: str):
+    """Deterministic bag-of-words vector."""
+    vector = [0.0] * EMBEDDING_DIM
+    for word in text.lower().split():
+        vector[int(hashlib.md5(word.encode('utf-8')).hexdigest(), 16) % EMBEDDING_DIM] += 1.0
+    return vector
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Request handler; the server's `fake_config` holds latency/error settings."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get('Content-Length', 0))
+        raw = self.rfile.read(length) if length else b'{}'
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return {}
+
+    def _send_chunked(self, content_type: str, pieces):
+        """Stream encoded pieces with chunked transfer encoding."""
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for piece in pieces:
+            data = piece.encode('utf-8')
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_sse(self, chunks):
+        """Stream server-sent events; chunks are data strings or (event, data) pairs."""
+        def encode():
+            for chunk in chunks:
+                if isinstance(chunk, tuple):
+                    yield f"event: {chunk[0]}\ndata: {chunk[1]}\n\n"
+                else:
+                    yield f"data: {chunk}\n\n"
+        self._send_chunked('text/event-stream', encode())
+
+    def _stream_words(self, text: str):
+        """Split text into word pieces, pausing token_delay between them."""
+        token_delay = self.server.fake_config.token_delay
+        for index, word in enumerate(text.split(' ')):
+            if index and token_delay:
+                time.sleep(token_delay)
+            yield word if index == 0 else ' ' + word
+
+    def _chat_completion(self, request: dict):
+        prompt = ''.join(str(message.get('content', '')) for message in request.get('messages', []))
+        text = fake_summary(prompt)
+        model = request.get('model', 'fake')
+        if not request.get('stream'):
+            self._send_json(200, {
+                'id': 'chatcmpl-fake',
+                'object': 'chat.completion',
+                'model': model,
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': len(prompt) // 4, 'completion_tokens': len(text) // 4,
+                          'total_tokens': (len(prompt) + len(text)) // 4}
+            })
+            return
+
+        def events():
+            words = 0
+            for piece in self._stream_words(text):
+                words += 1
+                yield json.dumps({
+                    'id': 'chatcmpl-fake',
+                    'object': 'chat.completion.chunk',
+                    'model': model,
+                    'choices': [{'index': 0, 'delta': {'content': piece}, 'finish_reason': None}]
+                })
+            yield json.dumps({
+                'id': 'chatcmpl-fake',
+                'object': 'chat.completion.chunk',
+                'model': model,
+                'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': len(prompt) // 4, 'completion_tokens': words}
+            })
+            yield '[DONE]'
+
+        self._send_sse(events())
+
+    def _messages(self, request: dict):
+        prompt = ''.join(
+            block.get('text', '')
+            for message in request.get('messages', [])
+            for block in (message.get('content') if isinstance(message.get('content'), list) else [{'text': message.get('content', '')}])
+        )
+        text = fake_summary(prompt)
+        model = request.get('model', 'fake')
+        if not request.get('stream'):
+            self._send_json(200, {
+                'id': 'msg_fake',
+                'type': 'message',
+                'role': 'assistant',
+                'model': model,
+                'content': [{'type': 'text', 'text': text}],
+                'stop_reason': 'end_turn',
+                'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': len(text) // 4}
+            })
+            return
+
+        def events():
+            yield ('message_start', json.dumps({
+                'type': 'message_start',
+                'message': {'id': 'msg_fake', 'type': 'message', 'role': 'assistant', 'model': model,
+                            'content': [], 'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': 1}}
+            }))
+            yield ('content_block_start', json.dumps({
+                'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}
+            }))
+            words = 0
+            for piece in self._stream_words(text):
+                words += 1
+                yield ('content_block_delta', json.dumps({
+                    'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': piece}
+                }))
+            yield ('content_block_stop', json.dumps({'type': 'content_block_stop', 'index': 0}))
+            yield ('message_delta', json.dumps({
+                'type': 'message_delta', 'delta': {'stop_reason': 'end_turn'}, 'usage': {'output_tokens': words}
+            }))
+            yield ('message_stop', json.dumps({'type': 'message_stop'}))
+
+        self._send_sse(events())
+
+    def _generate(self, request: dict):
+        prompt = request.get('prompt', '')
+        text = fake_summary(prompt)
+        model = request.get('model', 'fake')
+        if not request.get('stream', True):
+            self._send_json(200, {'model': model, 'response': text, 'done': True})
+            return
+
+        def lines():
+            words = 0
+            for piece in self._stream_words(text):
+                words += 1
+                yield json.dumps({'model': model, 'response': piece, 'done': False}) + '\n'
+            yield json.dumps({'model': model, 'response': '', 'done': True,
+                              'prompt_eval_count': len(prompt) // 4, 'eval_count': words}) + '\n'
+
+        self._send_chunked('application/x-ndjson', lines())
+
+    def do_GET(self):
+        if self.path == '/api/tags':
+            self._send_json(200, {'models': []})
+        elif self.path == '/v1/models':
+            self._send_json(200, {'object': 'list', 'data': [{'id': 'fake', 'object': 'model'}]})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        request = self._read_json()
+        delay, failed = self.server.fake_config.next_delay_and_error()
+        time.sleep(delay)
+
+        if failed:
+            if self.path == '/v1/messages':
+                self._send_json(529, {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'Overloaded'}})
+            elif self.path == '/v1/chat/completions':
+                self._send_json(503, {'error': {'type': 'server_error', 'message': 'Service unavailable'}})
+            else:
+                self._send_json(500, {'error': 'injected failure'})
+            return
+
+        if self.path == '/v1/messages':
+            self._messages(request)
+        elif self.path == '/v1/chat/completions':
+            self._chat_completion(request)
+        elif self.path == '/api/generate':
+            self._generate(request)
+        elif self.path == '/api/embed':
+            inputs = request.get('input', [])
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            self._send_json(200, {
+                'model': request.get('model', 'fake'),
+                'embeddings': [fake_embedding(text) for text in inputs]
+            })
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+
+class FakeLLMServer:
+    """Threaded fake server that can be started and stopped from a benchmark."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **config):
+        self.httpd = ThreadingHTTPServer((host, port), FakeLLMHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake_config = FakeLLMConfig(**config)
+        self.thread = None
+
+    @property
+    def config(self) -> FakeLLMConfig:
+        return self.httpd.fake_config
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeLLMServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fake Anthropic/Ollama server for jrnl benchmarks')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Uniform +/- seconds around latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests that fail')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible failures')
+    parser.add_argument('--token-delay', type=float, default=0.0,
+                        help='Seconds between streamed tokens')
+    args = parser.parse_args()
+
+    server = FakeLLMServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, seed=args.seed, token_delay=args.token_delay)
+    print(f"Fake LLM server listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+"""
+jrnl benchmark runner.
+
+Builds synthetic journals in a scratch directory, points jrnl at a fake
+LLM server and measures:
+
+    hook_e2e          `jrnl new --git` wall time for a real commit
+    logs_first_line   `jrnl logs --days 365` time to first entry and to exit
+    daily_prompt      Journal.generate_daily time outside the provider call,
+                      and end to end with the fake LLM
+    compress_prompt   compress_commit on synthetic diffs, with the fake LLM
+    db_writes         insert throughput with concurrent writer processes
+
+Every scenario runs in its own HOME so the user's ~/.jrnl is never touched.
+Results are written as JSON; compare two runs with benchmarks.compare.
+
+    python -m benchmarks.run --sizes 10k,100k --latency 0.3 -o bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from .fake_llm_server import FakeLLMServer
+from .synthetic import generate_journal, create_git_repo, realistic_diff
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SIZE_SUFFIXES = {'k': 1000, 'm': 1000000}
+
+
+def parse_size(text: str) -> int:
+    """Parse '10k', '1m' or '5000'."""
+    text = text.strip().lower()
+    if text[-1:] in SIZE_SUFFIXES:
+        return int(float(text[:-1]) * SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summary statistics in seconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        'runs': len(ordered),
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        'p95': p95,
+        'mean': statistics.fmean(ordered),
+    }
+
+
+def make_home(root: Path, name: str, provider: str, server_url: str) -> Path:
+    """Create a HOME with a jrnl config pointing at the fake server."""
+    home = root / name
+    jrnl_dir = home / '.jrnl'
+    (jrnl_dir / 'logs').mkdir(parents=True, exist_ok=True)
+    config = {
+        'active_llm_provider': provider,
+        'llm_providers': {
+            'anthropic': {'api_key': 'bench-key', 'url': server_url},
+            'ollama': {'url': server_url}
+        },
+        'embeddings': {'url': server_url}
+    }
+    (jrnl_dir / 'config.json').write_text(json.dumps(config))
+    return home
+
+
+def jrnl_env(home: Path) -> Dict[str, str]:
+    """Environment for running the jrnl CLI from this checkout."""
+    env = dict(os.environ)
+    env['HOME'] = str(home)
+    env['PYTHONPATH'] = str(REPO_ROOT) + os.pathsep + env.get('PYTHONPATH', '')
+    env['PAGER'] = 'cat'
+    return env
+
+
+def bench_hook_e2e(home: Path, repo: Path, hashes: List[str]) -> Dict:
+    """Time `jrnl new --git` for each commit, as the hook would run it."""
+    env = jrnl_env(home)
+    samples = []
+    for commit_hash in hashes:
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-m', 'jrnl', 'new', '--git', '--repo-path', str(repo), '--commit-hash', commit_hash],
+            env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_logs_first_line(home: Path, runs: int, days: int = 365) -> Dict:
+    """Time to the first printed entry and to process exit for `jrnl logs --days N`."""
+    env = jrnl_env(home)
+    first_line, total = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, '-m', 'jrnl', 'logs', '--days', str(days), '--no-pager'],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        seen = None
+        for line in proc.stdout:
+            if seen is None and line.startswith('['):
+                seen = time.perf_counter() - start
+        proc.wait()
+        total.append(time.perf_counter() - start)
+        first_line.append(seen if seen is not None else total[-1])
+    return {'first_line': summarize(first_line), 'total': summarize(total)}
+
+
+def _use_home(home: str):
+    """Point an already-imported jrnl at the benchmark HOME (child processes only)."""
+    from jrnl.database import connection
+    os.environ['HOME'] = home
+    connection.DB_PATH = Path(home) / '.jrnl' / 'jrnl.db'
+    connection._schema_ready = False
+
+
+def load_config(home: Path) -> Dict:
+    """The config written by make_home."""
+    with open(home / '.jrnl' / 'config.json') as f:
+        return json.load(f)
+
+
+class _TimedProvider:
+    """Wraps the configured provider and records time spent waiting on it."""
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.seconds = 0.0
+
+    def generate_daily(self, logs, days=1):
+        start = time.perf_counter()
+        try:
+            return self.provider.generate_daily(logs=logs, days=days)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+def _daily_prompt_worker(home: str, runs: int, queue):
+    """Runs in a child process so the benchmark HOME never leaks into the runner."""
+    _use_home(home)
+    from jrnl import api
+    from jrnl.llm_providers import get_provider
+    from jrnl.utils.date_utils import get_datetime_ago
+
+    config = load_config(Path(home))
+    normal_cutoff = api.get_normal_cutoff
+    results = {}
+    with api.Journal(Path(home) / '.jrnl' / 'jrnl.db', config=config) as journal:
+        for name, cutoff_fn in (('since_last_daily', normal_cutoff),
+                                ('last_7_days', lambda: get_datetime_ago(days=7))):
+            # Only the cutoff is swapped; collection, collapse and the prompt take the real path
+            api.get_normal_cutoff = cutoff_fn
+            local, total, counts = [], [], []
+            for _ in range(runs):
+                provider = _TimedProvider(get_provider(config))
+                start = time.perf_counter()
+                journal.generate_daily(save=False, provider=provider,
+                                       progress=lambda found, sent: counts.append((found, sent)))
+                total.append(time.perf_counter() - start)
+                local.append(total[-1] - provider.seconds)
+            found, sent = counts[-1] if counts else (0, 0)
+            results[name] = dict(summarize(local), total=summarize(total), logs=found, logs_sent=sent)
+    queue.put(results)
+
+
+def bench_daily_prompt(home: Path, runs: int) -> Dict:
+    """Time Journal.generate_daily up to the provider call, and end to end with the fake LLM."""
+    queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_daily_prompt_worker, args=(str(home), runs, queue))
+    proc.start()
+    results = queue.get()
+    proc.join()
+    return results
+
+
+def bench_compress_prompt(home: Path, runs: int) -> Dict:
+    """Time compress_commit on synthetic diffs of increasing size against the fake LLM."""
+    from jrnl.llm_providers import get_provider
+
+    provider = get_provider(load_config(home))
+    results = {}
+    for name, n_files, lines_per_file in (('small', 5, 40), ('large', 40, 200)):
+        diff = realistic_diff(n_files=n_files, lines_per_file=lines_per_file)
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            provider.compress_commit('Benchmark commit', diff)
+            samples.append(time.perf_counter() - start)
+        results[name] = dict(summarize(samples), diff_chars=len(diff))
+    return results
+
+
+def _writer(home: str, rows: int, queue):
+    _use_home(home)
+    import sqlite3
+    from jrnl.database.models import Log
+    from jrnl.database.operations import insert_log
+    from jrnl.utils.date_utils import get_utc_now
+
+    errors = 0
+    pid = os.getpid()
+    for i in range(rows):
+        try:
+            insert_log(Log(timestamp=get_utc_now(), log_message=f"bench write {i}",
+                           type='manual', label=f"w{pid}-{i}"))
+        except sqlite3.OperationalError:
+            errors += 1
+    queue.put(errors)
+
+
+def bench_db_writes(home: Path, writers: int, rows_per_writer: int) -> Dict:
+    """Insert throughput with `writers` concurrent processes using insert_log."""
+    queue = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_writer, args=(str(home), rows_per_writer, queue))
+             for _ in range(writers)]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    errors = sum(queue.get() for _ in procs)
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+    total = writers * rows_per_writer
+    return {
+        'writers': writers,
+        'rows': total,
+        'seconds': elapsed,
+        'rows_per_sec': (total - errors) / elapsed if elapsed else 0.0,
+        'lock_errors': errors,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', '-C', str(REPO_ROOT), 'rev-parse', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run jrnl benchmarks')
+    parser.add_argument('--sizes', default='10k,100k',
+                        help='Comma separated journal sizes, e.g. 10k,100k,1m (default: 10k,100k)')
+    parser.add_argument('--provider', choices=['anthropic', 'ollama'], default='ollama',
+                        help='Provider used against the fake server (default: ollama)')
+    parser.add_argument('--latency', type=float, default=0.2, help='Fake LLM latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Fake LLM latency jitter in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of fake LLM requests that fail')
+    parser.add_argument('--runs', type=int, default=5, help='Repetitions per timing (default: 5)')
+    parser.add_argument('--commits', type=int, default=5, help='Commits for the hook benchmark (default: 5)')
+    parser.add_argument('--writers', type=int, default=4, help='Concurrent writer processes (default: 4)')
+    parser.add_argument('--rows-per-writer', type=int, default=200, help='Inserts per writer (default: 200)')
+    parser.add_argument('--workdir', help='Scratch directory (default: a temp dir, removed afterwards)')
+    parser.add_argument('-o', '--output', help='Write results JSON here (default: stdout)')
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(',') if s.strip()]
+    scratch = tempfile.TemporaryDirectory(prefix='jrnl-bench-') if not args.workdir else None
+    root = Path(args.workdir or scratch.name)
+
+    results = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'args': vars(args),
+        },
+        'journals': {},
+    }
+
+    try:
+        with FakeLLMServer(latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, seed=0) as server:
+            for size in sizes:
+                print(f"[bench] journal with {size} logs", file=sys.stderr)
+                home = make_home(root, f'journal-{size}', args.provider, server.url)
+                start = time.perf_counter()
+                generate_journal(home / '.jrnl' / 'jrnl.db', size)
+                generation = time.perf_counter() - start
+
+                results['journals'][str(size)] = {
+                    'generate_seconds': generation,
+                    'logs_first_line': bench_logs_first_line(home, args.runs),
+                    'daily_prompt': bench_daily_prompt(home, args.runs),
+                }
+
+            print("[bench] hook end-to-end", file=sys.stderr)
+            home = make_home(root, 'hook', args.provider, server.url)
+            repo = root / 'repo'
+            hashes = create_git_repo(repo, n_commits=args.commits)
+            results['hook_e2e'] = bench_hook_e2e(home, repo, hashes)
+
+            print("[bench] compress prompt", file=sys.stderr)
+            results['compress_prompt'] = bench_compress_prompt(home, args.runs)
+            results['fake_llm'] = {'requests': server.config.requests, 'errors': server.config.errors}
+
+            print("[bench] concurrent writers", file=sys.stderr)
+            home = make_home(root, 'writes', args.provider, server.url)
+            results['db_writes'] = bench_db_writes(home, args.writers, args.rows_per_writer)
+    finally:
+        if scratch is not None:
+            scratch.cleanup()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+        print(f"[bench] results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
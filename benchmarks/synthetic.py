@@ -0,0 +1,153 @@
+"""Synthetic journals, diffs and git repositories for benchmarks."""
+
+import random
+import sqlite3
+import subprocess
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+from jrnl.database.connection import apply_schema
+
+VERBS = ['Fixed', 'Added', 'Refactored', 'Updated', 'Removed', 'Improved', 'Documented', 'Tested']
+AREAS = ['authentication', 'login flow', 'settings page', 'database layer', 'API client', 'CI pipeline',
+         'README', 'caching', 'error handling', 'search', 'billing', 'notifications', 'build scripts']
+DETAILS = ['for edge cases', 'after review comments', 'to reduce latency', 'behind a feature flag',
+           'with new tests', 'for the mobile client', 'to fix flaky test', 'ahead of release']
+REPOS = [f'/home/dev/src/project-{i}' for i in range(12)]
+EXTENSIONS = ['py', 'ts', 'go', 'md', 'yaml', 'sql']
+
+# Rows written per executemany() when generating journals
+INSERT_CHUNK = 50000
+
+
+def log_message(rng: random.Random) -> str:
+    """One plausible compressed log line."""
+    return f"{rng.choice(VERBS)} {rng.choice(AREAS)} {rng.choice(DETAILS)}"
+
+
+def generate_journal(db_path: Path, n_logs: int, days: int = 730, git_ratio: float = 0.8,
+                     seed: int = 0) -> Path:
+    """
+    Create a journal database with n_logs entries spread over the last `days`
+    days (weekday working hours weighted) and one daily per weekday.
+    """
+    rng = random.Random(seed)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_path.exists():
+        db_path.unlink()
+
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    start = now - timedelta(days=days)
+    span = int((now - start).total_seconds())
+
+    conn = sqlite3.connect(db_path)
+    try:
+        apply_schema(conn)
+        offsets = sorted(rng.randrange(span) for _ in range(n_logs))
+
+        def rows():
+            for i, offset in enumerate(offsets):
+                ts = start + timedelta(seconds=offset)
+                is_git = rng.random() < git_ratio
+                yield (
+                    ts.isoformat(),
+                    log_message(rng),
+                    'git-hook' if is_git else 'manual',
+                    f"{i:08x}",
+                    rng.choice(REPOS) if is_git else None
+                )
+
+        iterator = rows()
+        while True:
+            chunk = [row for _, row in zip(range(INSERT_CHUNK), iterator)]
+            if not chunk:
+                break
+            conn.executemany(
+                'INSERT INTO logs (timestamp, log_message, type, label, repo) VALUES (?, ?, ?, ?, ?)',
+                chunk
+            )
+            conn.commit()
+
+        dailies = []
+        day = start.date()
+        while day < now.date():
+            if day.weekday() < 5:
+                stamp = datetime(day.year, day.month, day.day, 8, 30, tzinfo=timezone.utc)
+                dailies.append((stamp.isoformat(), day.isoformat(),
+                                ' '.join(log_message(rng) + '.' for _ in range(4))))
+            day += timedelta(days=1)
+        conn.executemany(
+            'INSERT OR REPLACE INTO dailies (timestamp, daily_date, daily_message) VALUES (?, ?, ?)',
+            dailies
+        )
+        conn.commit()
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+    return db_path
+
+
+def source_lines(rng: random.Random, n: int) -> List[str]:
+    """Lines that look like code, with the odd TODO."""
+    lines = []
+    for i in range(n):
+        if rng.random() < 0.02:
+            lines.append(f"    # TODO: handle {rng.choice(AREAS)} {rng.choice(DETAILS)}")
+        else:
+            lines.append(f"    value_{i} = compute_{rng.choice(VERBS).lower()}(item_{i % 7}, {rng.randrange(1000)})")
+    return lines
+
+
+def realistic_diff(n_files: int = 5, lines_per_file: int = 40, seed: int = 0) -> str:
+    """A `git show`-shaped diff touching n_files files."""
+    rng = random.Random(seed)
+    parts = [
+        f"commit {rng.getrandbits(160):040x}",
+        "Author: Dev <dev@example.com>",
+        "Date:   Mon Dec 9 10:00:00 2024 +0000",
+        "",
+        f"    {log_message(rng)}",
+        ""
+    ]
+    for f in range(n_files):
+        path = f"src/{rng.choice(AREAS).replace(' ', '_')}/module_{f}.{rng.choice(EXTENSIONS)}"
+        parts += [
+            f"diff --git a/{path} b/{path}",
+            f"index {rng.getrandbits(28):07x}..{rng.getrandbits(28):07x} 100644",
+            f"--- a/{path}",
+            f"+++ b/{path}",
+            f"@@ -1,{lines_per_file} +1,{lines_per_file} @@",
+        ]
+        for line in source_lines(rng, lines_per_file):
+            marker = rng.choice([' ', ' ', ' ', '+', '-'])
+            parts.append(marker + line)
+    return '\n'.join(parts) + '\n'
+
+
+def create_git_repo(path: Path, n_commits: int = 5, files_per_commit: int = 5,
+                    lines_per_file: int = 200, seed: int = 0) -> List[str]:
+    """Create a git repository with realistic commits. Returns commit hashes, oldest first."""
+    rng = random.Random(seed)
+    path.mkdir(parents=True, exist_ok=True)
+
+    def git(*args):
+        return subprocess.run(['git', '-C', str(path), *args], check=True,
+                              capture_output=True, text=True).stdout.strip()
+
+    git('init', '-q')
+    git('config', 'user.email', 'bench@example.com')
+    git('config', 'user.name', 'Bench')
+    git('config', 'commit.gpgsign', 'false')
+    git('config', 'core.hooksPath', '/dev/null')  # Don't trigger a real jrnl install
+
+    hashes = []
+    for c in range(n_commits):
+        for f in range(files_per_commit):
+            target = path / 'src' / f'module_{(c + f) % (files_per_commit * 2)}.py'
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text('\n'.join(source_lines(rng, lines_per_file)) + '\n')
+        git('add', '-A')
+        git('commit', '-q', '--no-verify', '-m', log_message(rng))
+        hashes.append(git('rev-parse', 'HEAD'))
+    return hashes
@@ -35,6 +35,7 @@ check_python() {
 # Create directory structure
 setup_directories() {
     mkdir -p "$JRNL_DIR/logs"
+    mkdir -p "$JRNL_DIR/queue"
     mkdir -p "$LOCAL_BIN"
     echo "✓ Created directories"
 }
@@ -97,6 +98,37 @@ EOF
     fi
 }
 
+# Install one hook from hooks/<name>.template into the hooks path
+install_hook() {
+    HOOKS_PATH="$1"
+    HOOK_NAME="$2"
+    HOOK_FILE="$HOOKS_PATH/$HOOK_NAME"
+
+    # Check if the hook exists
+    if [ -f "$HOOK_FILE" ]; then
+        # Check if jrnl is already in the hook
+        if grep -q "JRNL" "$HOOK_FILE"; then
+            echo "✓ JRNL already configured in $HOOK_NAME hook"
+        else
+            echo "Appending JRNL to existing $HOOK_NAME hook..."
+            mkdir -p "$JRNL_DIR/hooks"
+            cp "$REPO_DIR/hooks/$HOOK_NAME.template" "$JRNL_DIR/hooks/$HOOK_NAME"
+            chmod +x "$JRNL_DIR/hooks/$HOOK_NAME"
+            cat >> "$HOOK_FILE" << HOOKEOF
+
+# JRNL - Automatic commit logging
+"\$HOME/.jrnl/hooks/$HOOK_NAME" "\$@"
+HOOKEOF
+            echo "✓ Added JRNL to existing $HOOK_NAME hook"
+        fi
+    else
+        # Create new hook from template
+        cp "$REPO_DIR/hooks/$HOOK_NAME.template" "$HOOK_FILE"
+        chmod +x "$HOOK_FILE"
+        echo "✓ Created $HOOK_NAME hook"
+    fi
+}
+
 # Install git hooks
 install_git_hooks() {
     echo
@@ -117,39 +149,8 @@ install_git_hooks() {
             echo "✓ Set global hooks path to $HOOKS_PATH"
         fi
 
-        POST_COMMIT="$HOOKS_PATH/post-commit"
-
-        # Check if post-commit exists
-        if [ -f "$POST_COMMIT" ]; then
-            # Check if jrnl is already in the hook
-            if grep -q "JRNL" "$POST_COMMIT"; then
-                echo "✓ JRNL already configured in post-commit hook"
-            else
-                echo "Appending JRNL to existing post-commit hook..."
-                cat >> "$POST_COMMIT" << 'HOOKEOF'
-
-# JRNL - Automatic commit logging
-JRNL_CMD="$HOME/.local/bin/jrnl"
-if [ -f "$JRNL_CMD" ]; then
-    REPO_PATH=$(git rev-parse --show-toplevel 2>/dev/null)
-    COMMIT_HASH=$(git rev-parse HEAD 2>/dev/null)
-    if [ -n "$REPO_PATH" ] && [ -n "$COMMIT_HASH" ]; then
-        "$JRNL_CMD" new --git \
-            --repo-path "$REPO_PATH" \
-            --commit-hash "$COMMIT_HASH" \
-            >> "$HOME/.jrnl/logs/hook.log" 2>&1 &
-        disown
-    fi
-fi
-HOOKEOF
-                echo "✓ Added JRNL to existing post-commit hook"
-            fi
-        else
-            # Create new hook from template
-            cp "$REPO_DIR/hooks/post-commit.template" "$POST_COMMIT"
-            chmod +x "$POST_COMMIT"
-            echo "✓ Created post-commit hook"
-        fi
+        install_hook "$HOOKS_PATH" post-commit
+        install_hook "$HOOKS_PATH" post-rewrite
     else
         echo "Skipping git hooks installation"
     fi
@@ -0,0 +1,5 @@
+"""Work analytics over the journal."""
+
+from .engine import WorkStats, compute_stats
+
+__all__ = ['WorkStats', 'compute_stats']
@@ -0,0 +1,114 @@
+"""
+Vectorized work-analytics engine.
+
+SQL reduces the logs table to per-hour counts; everything else (per day,
+hour of day, weekday, streaks, standup coverage) is derived from those
+arrays with NumPy, so cost grows with active hours, not with log rows.
+NumPy is optional: install with `pip install 'jrnl[semantic]'`.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from ..utils.date_utils import get_datetime_ago
+from ..database.operations import (
+    get_hourly_log_counts,
+    get_log_counts_by_repo,
+    get_daily_day_numbers
+)
+
+# 1970-01-01 was a Thursday; Monday-based weekday of epoch day 0
+EPOCH_WEEKDAY = 3
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("jrnl stats requires numpy. Install it with: pip install 'jrnl[semantic]'")
+    return numpy
+
+
+@dataclass
+class WorkStats:
+    """Aggregate view of the journal."""
+    total: int = 0
+    git_hook: int = 0
+    manual: int = 0
+    first_day: Optional[int] = None  # Days since epoch (local)
+    last_day: Optional[int] = None
+    per_day: List[int] = field(default_factory=list)  # first_day..today inclusive
+    per_hour: List[int] = field(default_factory=lambda: [0] * 24)
+    per_weekday: List[int] = field(default_factory=lambda: [0] * 7)  # Monday first
+    per_repo: List[Tuple[str, int]] = field(default_factory=list)
+    active_days: int = 0
+    longest_streak: int = 0
+    current_streak: int = 0
+    dailies: int = 0
+    commit_days: int = 0
+    unreported_commit_days: int = 0
+    median_report_lag: Optional[float] = None
+    max_report_lag: Optional[int] = None
+
+
+def compute_stats(days: Optional[int] = None, now: Optional[datetime] = None) -> WorkStats:
+    """Compute statistics over the last `days` days, or all time."""
+    np = _numpy()
+    now = (now or datetime.now()).astimezone()
+    utc_offset = int(now.utcoffset().total_seconds())
+    today = (int(now.timestamp()) + utc_offset) // 86400
+
+    since = since_date = None
+    if days:
+        since = get_datetime_ago(days=days)
+        since_date = (now - timedelta(days=days)).date().isoformat()
+
+    stats = WorkStats()
+    stats.per_repo = get_log_counts_by_repo(since)
+
+    rows = get_hourly_log_counts(since, utc_offset)
+    if not rows:
+        return stats
+
+    hourly = np.array(rows, dtype=np.int64)
+    hour_index, counts, git_counts = hourly[:, 0], hourly[:, 1], hourly[:, 2]
+
+    stats.total = int(counts.sum())
+    stats.git_hook = int(git_counts.sum())
+    stats.manual = stats.total - stats.git_hook
+
+    day_index = hour_index // 24
+    stats.first_day = int(day_index[0])
+    stats.last_day = int(day_index[-1])
+    span_end = max(today, stats.last_day)
+    stats.per_day = np.bincount(day_index - stats.first_day, weights=counts,
+                                minlength=span_end - stats.first_day + 1).astype(np.int64).tolist()
+    stats.per_hour = np.bincount(hour_index % 24, weights=counts, minlength=24).astype(np.int64).tolist()
+    stats.per_weekday = np.bincount((day_index + EPOCH_WEEKDAY) % 7, weights=counts,
+                                    minlength=7).astype(np.int64).tolist()
+
+    # Streaks over days with any entry
+    active = np.unique(day_index)
+    stats.active_days = int(active.size)
+    breaks = np.flatnonzero(np.diff(active) != 1)
+    run_starts = np.concatenate(([0], breaks + 1))
+    run_ends = np.concatenate((breaks, [active.size - 1]))
+    run_lengths = run_ends - run_starts + 1
+    stats.longest_streak = int(run_lengths.max())
+    stats.current_streak = int(run_lengths[-1]) if active[-1] >= today - 1 else 0
+
+    # Standup coverage: days from each commit day to the first daily on or after it
+    daily_days = np.array(get_daily_day_numbers(since_date), dtype=np.int64)
+    commit_days = np.unique(day_index[git_counts > 0])
+    stats.dailies = int(daily_days.size)
+    stats.commit_days = int(commit_days.size)
+    if commit_days.size:
+        next_daily = np.searchsorted(daily_days, commit_days, side='left')
+        reported = next_daily < daily_days.size
+        stats.unreported_commit_days = int((~reported).sum())
+        if reported.any():
+            lags = daily_days[next_daily[reported]] - commit_days[reported]
+            stats.median_report_lag = float(np.median(lags))
+            stats.max_report_lag = int(lags.max())
+
+    return stats
@@ -0,0 +1,230 @@
+"""
+Library interface for using jrnl from other programs.
+
+    from jrnl.api import Journal
+
+    with Journal() as journal:
+        journal.add("Reviewed the billing migration")
+        for log in journal.iter_logs(since='2024-06-01', log_type='git-hook'):
+            print(log.timestamp, log.log_message)
+
+A Journal keeps one database connection open for its lifetime, so each
+call costs a query instead of a process start, argparse run and connect.
+The CLI commands are thin layers over these methods.
+"""
+
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .config import Config
+from .database import connection
+from .database import operations
+from .database.models import Daily, Log, LogRow, is_degraded, strip_degraded_prefix
+from .llm_providers import LLMProvider, get_provider
+from .utils import tracing
+from .utils.date_utils import get_current_date, get_datetime_ago, get_utc_now
+from .utils.minhash import DEFAULT_THRESHOLD, collapse_similar_logs
+
+
+class Journal:
+    """
+    A journal database opened for in-process use.
+
+    Safe to share between threads; calls are serialized on the one
+    connection. Use as a context manager or call close() when done.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None, config: Optional[Dict] = None):
+        """
+        Args:
+            db_path: Journal database (default: ~/.jrnl/jrnl.db)
+            config: Configuration dict used instead of ~/.jrnl/config.json,
+                e.g. to pick the LLM provider for generate_daily
+        """
+        path = Path(os.path.expanduser(str(db_path))) if db_path is not None else None
+        self._conn = connection.open_session(path)
+        self._lock = threading.RLock()
+        self._config = config
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> 'Journal':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def config(self) -> Dict:
+        return self._config if self._config is not None else Config.load()
+
+    @contextmanager
+    def _session(self):
+        with self._lock:
+            if self._conn is None:
+                raise ValueError("Journal is closed")
+            with connection.use_session(self._conn):
+                yield
+
+    def add(self, message: str, label: Optional[str] = None,
+            timestamp: Optional[str] = None) -> Log:
+        """Add a manual log entry and return it with its id set."""
+        if not message or not message.strip():
+            raise ValueError("Log message must not be empty")
+        log = Log(
+            timestamp=timestamp or get_utc_now(),
+            log_message=message,
+            type='manual',
+            label=label or str(uuid.uuid4())[:8]
+        )
+        with self._session():
+            log.id = operations.insert_log(log)
+        return log
+
+    def add_many(self, entries: Iterable[Union[str, Log]]) -> int:
+        """
+        Add many entries in bulk transactions.
+
+        Entries are messages (stored as manual logs) or Log objects. Logs
+        whose label already exists are skipped. Returns the number added.
+        """
+        def to_log(entry):
+            if isinstance(entry, Log):
+                return entry
+            return Log(timestamp=get_utc_now(), log_message=entry, type='manual',
+                       label=str(uuid.uuid4())[:8])
+
+        with self._session():
+            return operations.insert_logs_bulk(to_log(entry) for entry in entries)
+
+    def get(self, label: str) -> Optional[Log]:
+        """The log with a label (commit hash prefix for git entries), if any."""
+        with self._session():
+            return operations.get_log_by_label(label)
+
+    def delete(self, label: str) -> bool:
+        """Delete a log by label. Returns False if there was none."""
+        with self._session():
+            return operations.delete_log(label)
+
+    def iter_logs(self, since: Optional[str] = None, until: Optional[str] = None,
+                  log_type: Optional[str] = None, repo: Optional[str] = None,
+                  newest_first: bool = True, limit: Optional[int] = None,
+                  include_archived: bool = False) -> Iterator[LogRow]:
+        """
+        Stream logs matching the filters, newest first unless newest_first is False.
+
+        since/until are ISO timestamps or dates (since inclusive, until
+        exclusive); log_type is 'manual' or 'git-hook'. Rows are fetched a
+        page at a time, so stopping early reads nothing further.
+        """
+        rows = operations.iter_logs(
+            since=since, until=until, log_type=log_type, repo=repo,
+            newest_first=newest_first, limit=limit, include_archived=include_archived
+        )
+        while True:
+            with self._session():
+                row = next(rows, None)
+            if row is None:
+                return
+            yield row
+
+    def count_logs(self, since: Optional[str] = None, include_archived: bool = False) -> int:
+        """Number of logs, optionally only those since a timestamp."""
+        with self._session():
+            return operations.count_logs(since=since, include_archived=include_archived)
+
+    def count_degraded(self) -> int:
+        """Number of logs holding an LLM error placeholder (see `jrnl repair`)."""
+        with self._session():
+            return operations.count_degraded_logs()
+
+    def search(self, query: str, limit: int = 50, include_archived: bool = False) -> List[LogRow]:
+        """Logs whose message or label contains query, newest first."""
+        with self._session():
+            return operations.search_logs(query, limit=limit, include_archived=include_archived)
+
+    def generate_daily(self, days: int = 1, regenerate: bool = False, save: bool = True,
+                       provider: Optional[LLMProvider] = None,
+                       progress: Optional[Callable[[int, int], None]] = None) -> Optional[Daily]:
+        """
+        Generate a standup from the logs since the last daily.
+
+        With regenerate, today's daily is rebuilt from the logs since the
+        one before it. Near-duplicate logs are collapsed before the prompt
+        unless `collapse_similar_logs` is off. progress, if given, is called
+        with (logs found, logs sent) before the provider is. Returns None
+        when there are no logs; raises RuntimeError if the provider fails.
+        """
+        config = self.config
+        with self._session():
+            cutoff = get_regenerate_cutoff() if regenerate else get_normal_cutoff()
+            logs = [log.to_dict() for log in operations.iter_logs_since(cutoff)]
+            if not logs:
+                return None
+            # A failure placeholder still holds the commit message; the prefix must not reach the standup
+            for log in logs:
+                if log['type'] == 'git-hook' and is_degraded(log['log_message']):
+                    log['log_message'] = strip_degraded_prefix(log['log_message'])
+            prompt_logs = logs
+            if config.get('collapse_similar_logs', True):
+                prompt_logs = collapse_logs(
+                    logs, float(config.get('similar_logs_threshold', DEFAULT_THRESHOLD))
+                )
+
+        if progress:
+            progress(len(logs), len(prompt_logs))
+        if provider is None:
+            provider = get_provider(config)
+        with tracing.span('generate_daily', cat='provider', provider=type(provider).__name__, logs=len(prompt_logs)):
+            message = provider.generate_daily(logs=prompt_logs, days=days)
+
+        daily = Daily(timestamp=get_utc_now(), daily_date=get_current_date(), daily_message=message)
+        if save:
+            with self._session():
+                daily.id = operations.insert_daily(daily)
+        return daily
+
+
+def collapse_logs(logs: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Collapse near-duplicate log dicts using their stored signatures."""
+    with tracing.span('collapse_similar_logs', logs=len(logs)):
+        signatures = operations.get_log_signatures([log['id'] for log in logs])
+        return collapse_similar_logs(logs, [signatures.get(log['id']) for log in logs], threshold)
+
+
+def get_normal_cutoff():
+    """Get cutoff timestamp for normal daily generation."""
+    latest_daily = operations.get_latest_daily()
+    if latest_daily:
+        return latest_daily.timestamp
+    else:
+        # No previous daily - get logs from 24 hours ago
+        return get_datetime_ago(hours=24)
+
+
+def get_regenerate_cutoff():
+    """Get cutoff timestamp for regenerating today's daily."""
+    today = get_current_date()
+    latest_daily = operations.get_latest_daily()
+
+    if latest_daily and latest_daily.daily_date == today:
+        # Today's daily exists - get previous daily's timestamp
+        prev_daily = operations.get_previous_daily_before(today)
+        if prev_daily:
+            return prev_daily.timestamp
+
+    # Fallback: 24 hours ago
+    return get_datetime_ago(hours=24)
+
+
+__all__ = ['Journal']
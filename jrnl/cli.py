@@ -2,7 +2,8 @@
 
 import sys
 import argparse
-from .commands import new, daily, logs, config_cmd, uninstall_cmd
+from .commands import new, daily, logs, config_cmd, uninstall_cmd, export_cmd, import_cmd, archive_cmd, search, worker, report, stats, sync, serve, push, replicate, repair, completion, bench
+from .utils import tracing
 from .version import __version__
 
 
@@ -14,6 +15,8 @@ def create_parser():
         epilog='Run "jrnl <command> --help" for more information on a specific command.'
     )
     parser.add_argument('--version', action='version', version=f'jrnl {__version__}')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase timings to ~/.jrnl/logs/ (also enabled by JRNL_TRACE=1)')
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
@@ -73,6 +76,52 @@ Examples:
     daily_parser.add_argument('--delete', metavar='DATE',
                              help='Delete a daily entry (DATE: YYYY-MM-DD, "today", or "latest")')
 
+    # jrnl report
+    report_parser = subparsers.add_parser(
+        'report',
+        help='Weekly or monthly summary of your work',
+        epilog='''
+Examples:
+  # This week's summary (rebuilt only if its logs or dailies changed)
+  jrnl report --week
+
+  # Last month
+  jrnl report --month --ago 1
+
+  # The last four weeks
+  jrnl report --week --last 4
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    period_group = report_parser.add_mutually_exclusive_group()
+    period_group.add_argument('--week', action='store_true', help='Weekly summary (default)')
+    period_group.add_argument('--month', action='store_true', help='Monthly summary')
+    report_parser.add_argument('--ago', type=int, default=0,
+                              help='Periods back from the current one (default: 0)')
+    report_parser.add_argument('--last', type=int, default=1,
+                              help='Number of periods to show (default: 1)')
+    report_parser.add_argument('--rebuild', action='store_true',
+                              help='Regenerate even if the stored summary is up to date')
+
+    # jrnl stats
+    stats_parser = subparsers.add_parser(
+        'stats',
+        help='Show activity statistics',
+        epilog='''
+Examples:
+  # All-time statistics
+  jrnl stats
+
+  # Last 90 days
+  jrnl stats --days 90
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    stats_parser.add_argument('-d', '--days', type=int,
+                             help='Only count the last N days (default: all time)')
+    stats_parser.add_argument('--top', type=int, default=10,
+                             help='Number of repositories to list (default: 10)')
+
     # jrnl logs
     logs_parser = subparsers.add_parser(
         'logs',
@@ -90,6 +139,12 @@ Examples:
 
   # Delete a log entry by hash/label
   jrnl logs --delete 5a546f30
+
+  # Dump a year of logs without the pager
+  jrnl logs --days 365 --no-pager
+
+  # Watch new entries arrive from git hooks
+  jrnl logs --follow -n 10
         ''',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -99,6 +154,256 @@ Examples:
                             help='Maximum number of logs to show (default: 50)')
     logs_parser.add_argument('--delete', metavar='HASH',
                             help='Delete a log entry by its hash/label')
+    logs_parser.add_argument('--no-pager', action='store_true',
+                            help='Print directly instead of piping through $PAGER')
+    logs_parser.add_argument('--archived', action='store_true',
+                            help='Include entries moved to archive databases')
+    logs_parser.add_argument('-f', '--follow', action='store_true',
+                            help='Keep running and print new entries as they are logged')
+
+    # jrnl search
+    search_parser = subparsers.add_parser(
+        'search',
+        help='Search log entries by keyword',
+        epilog='''
+Examples:
+  # Find logs mentioning "login"
+  jrnl search login
+
+  # Include archived years
+  jrnl search login --archived
+
+  # Semantic search (needs numpy and an Ollama embedding model)
+  jrnl search --semantic "auth"
+
+  # Logs about similar work to an existing entry
+  jrnl search --related 5a546f30
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    search_parser.add_argument('query', nargs='?', help='Text to look for in log messages and labels')
+    search_parser.add_argument('-n', '--limit', type=int, default=50,
+                              help='Maximum number of results (default: 50)')
+    search_parser.add_argument('--archived', action='store_true',
+                              help='Include entries moved to archive databases')
+    search_parser.add_argument('-s', '--semantic', action='store_true',
+                              help='Rank by meaning using the embedding index')
+    search_parser.add_argument('--related', metavar='LABEL',
+                              help='Find logs similar to the entry with this hash/label')
+
+    # jrnl archive
+    archive_parser = subparsers.add_parser(
+        'archive',
+        help='Move old entries to per-year archives and compact the database',
+        epilog='''
+Examples:
+  # Archive everything older than 180 days
+  jrnl archive --older-than 180d
+
+  # Archive older than a year, skip VACUUM
+  jrnl archive --older-than 1y --no-compact
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    archive_parser.add_argument('--older-than', metavar='AGE', default='180d',
+                               help='Archive entries older than AGE, e.g. 180d, 12w, 6m, 1y (default: 180d)')
+    archive_parser.add_argument('--no-compact', action='store_true',
+                               help='Skip VACUUM/ANALYZE after archiving')
+
+    # jrnl export
+    export_parser = subparsers.add_parser(
+        'export',
+        help='Export log entries as JSONL or CSV',
+        epilog='''
+Examples:
+  # Export everything as JSON Lines to stdout
+  jrnl export
+
+  # Export to a CSV file
+  jrnl export --format csv -o journal.csv
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    export_parser.add_argument('-f', '--format', choices=export_cmd.FORMATS, default='jsonl',
+                              help='Output format (default: jsonl)')
+    export_parser.add_argument('-o', '--output', metavar='FILE',
+                              help='Write to FILE instead of stdout')
+
+    # jrnl import
+    import_parser = subparsers.add_parser(
+        'import',
+        help='Import log entries from a JSONL or CSV export',
+        epilog='''
+Examples:
+  # Import a previous export (entries whose labels exist, live or archived, are skipped)
+  jrnl import journal.jsonl
+  jrnl import journal.csv
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    import_parser.add_argument('file', metavar='FILE', help='File to import')
+    import_parser.add_argument('-f', '--format', choices=export_cmd.FORMATS,
+                              help='Input format (default: detect from extension)')
+
+    # jrnl sync
+    sync_parser = subparsers.add_parser(
+        'sync',
+        help='Log new commits from all repositories under your workspace roots',
+        epilog='''
+Examples:
+  # Sync the roots listed in workspace_roots in config.json
+  jrnl sync
+
+  # Sync specific directories
+  jrnl sync ~/code ~/work
+
+  # Show what would be logged, looking back 30 days for new repositories
+  jrnl sync --dry-run --days 30
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    sync_parser.add_argument('roots', nargs='*', metavar='ROOT',
+                            help='Directories to scan (default: workspace_roots config)')
+    sync_parser.add_argument('--days', type=int,
+                            help='History to look back for repositories not synced before (default: sync_initial_days config)')
+    sync_parser.add_argument('-j', '--jobs', type=int,
+                            help='Repositories scanned at once (default: sync_max_concurrency config)')
+    sync_parser.add_argument('--dry-run', action='store_true',
+                            help='List new commits without logging them')
+
+    # jrnl sync-push / sync-pull
+    for name, help_text in (
+        ('sync-push', 'Write local changes to the shared sync directory'),
+        ('sync-pull', 'Apply changes from other machines in the shared sync directory'),
+    ):
+        replicate_parser = subparsers.add_parser(
+            name,
+            help=help_text,
+            epilog='''
+Examples:
+  # On each machine, after setting replication_dir in config.json
+  jrnl sync-push && jrnl sync-pull
+
+  # Use a specific shared directory
+  jrnl {} --dir ~/Dropbox/jrnl
+            '''.format(name),
+            formatter_class=argparse.RawDescriptionHelpFormatter
+        )
+        replicate_parser.add_argument('--dir', metavar='DIR',
+                                     help='Shared directory (default: replication_dir config)')
+
+    # jrnl repair
+    repair_parser = subparsers.add_parser(
+        'repair',
+        help='Re-compress entries saved with an LLM error placeholder',
+        epilog='''
+Examples:
+  # List entries whose summary is an error placeholder such as "[LLM Error] ..."
+  jrnl repair --dry-run
+
+  # Re-compress them, four at a time
+  jrnl repair -j 4
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    repair_parser.add_argument('-n', '--limit', type=int,
+                              help='Repair at most N entries (oldest first)')
+    repair_parser.add_argument('-j', '--jobs', type=int,
+                              help='Entries compressed at once (default: hook_max_concurrency config)')
+    repair_parser.add_argument('--repo', metavar='PATH',
+                              help='Repository to read commits from when an entry has none recorded '
+                                   '(default: the current repository)')
+    repair_parser.add_argument('--dry-run', action='store_true',
+                              help='List degraded entries without changing them')
+
+    # jrnl bench
+    bench_parser = subparsers.add_parser(
+        'bench',
+        help='Benchmark LLM providers on your own commits'
+    )
+    bench_subparsers = bench_parser.add_subparsers(dest='bench_command', required=True)
+    bench_providers_parser = bench_subparsers.add_parser(
+        'providers',
+        help='Compare latency and throughput of providers and models',
+        epilog='''
+Examples:
+  # The active provider on the last 20 commits of this repository
+  jrnl bench providers
+
+  # Two Claude models and a local model at 1, 4 and 8 requests in flight
+  jrnl bench providers --target anthropic:claude-haiku-4-5 \\
+      --target anthropic:claude-sonnet-4-5-20250929 --target ollama:llama3.1:8b \\
+      --concurrency 1,4,8
+
+  # Check whether summaries get cut off at a lower token limit
+  jrnl bench providers --max-tokens 120 --json > bench.json
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    bench_providers_parser.add_argument('--repo', default='.', metavar='PATH',
+                                        help='Repository whose commits are the corpus (default: current directory)')
+    bench_providers_parser.add_argument('-n', '--commits', type=int, default=20,
+                                        help='Newest non-merge commits to use (default: 20)')
+    bench_providers_parser.add_argument('-t', '--target', action='append', metavar='PROVIDER[:MODEL]',
+                                        help='Provider, optionally with a model; repeat to compare (default: active provider)')
+    bench_providers_parser.add_argument('-c', '--concurrency', default='1,4', metavar='N[,N...]',
+                                        help='Requests in flight, one run per level (default: 1,4)')
+    bench_providers_parser.add_argument('--max-tokens', type=int,
+                                        help='Output token limit (default: the provider\'s max_tokens_commit)')
+    bench_providers_parser.add_argument('--timeout', type=float, default=120.0, metavar='SECONDS',
+                                        help='Per-request timeout (default: 120)')
+    bench_providers_parser.add_argument('--no-warmup', action='store_true',
+                                        help='Skip the untimed first request per target')
+    bench_providers_parser.add_argument('--json', action='store_true',
+                                        help='Print the results as JSON')
+
+    # jrnl serve
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Run the team journal server',
+        epilog='''
+Examples:
+  # Serve on all interfaces with a shared token
+  JRNL_SERVER_TOKEN=secret jrnl serve --host 0.0.0.0
+
+  # Local server with a separate database, summaries only on request
+  jrnl serve --port 9000 --db /tmp/team.db --no-precompute
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=8787, help='Port to listen on (default: 8787)')
+    serve_parser.add_argument('--db', metavar='PATH', help='Team database (default: team_server.db_path config)')
+    serve_parser.add_argument('--token', help='Bearer token clients must send (default: $JRNL_SERVER_TOKEN or team_server.token config)')
+    serve_parser.add_argument('--refresh-interval', type=float, default=60.0, metavar='SECONDS',
+                             help='How often recent per-user summaries are regenerated (default: 60)')
+    serve_parser.add_argument('--no-precompute', action='store_true',
+                             help='Only summarize when a standup is requested')
+
+    # jrnl push
+    push_parser = subparsers.add_parser(
+        'push',
+        help='Send new logs and dailies to the team server',
+        epilog='''
+Examples:
+  # Push using team_server.url and team_server.user from config.json
+  jrnl push
+
+  # Push to a specific server
+  jrnl push --server http://jrnl.internal:8787 --user alice
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    push_parser.add_argument('--server', metavar='URL', help='Team server URL (default: team_server.url config)')
+    push_parser.add_argument('--user', help='Your name on the team server (default: team_server.user config)')
+
+    # jrnl worker (started by the git hooks)
+    worker_parser = subparsers.add_parser(
+        'worker',
+        help='Process commits queued by the git hooks (normally started by the hooks)'
+    )
+    worker_parser.add_argument('--max-concurrency', type=int,
+                              help='Maximum commits compressed at once (default: hook_max_concurrency config)')
 
     # jrnl config
     config_parser = subparsers.add_parser(
@@ -131,6 +436,25 @@ Examples:
                               help='Configuration action')
     config_parser.add_argument('args', nargs='*', help='Action arguments')
 
+    # jrnl completion
+    completion_parser = subparsers.add_parser(
+        'completion',
+        help='Print a shell completion script',
+        epilog='''
+Examples:
+  # bash
+  jrnl completion bash > ~/.local/share/bash-completion/completions/jrnl
+
+  # zsh (any directory on $fpath)
+  jrnl completion zsh > ~/.zfunc/_jrnl
+
+  # fish
+  jrnl completion fish > ~/.config/fish/completions/jrnl.fish
+        ''',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    completion_parser.add_argument('shell', choices=completion.SHELLS, help='Shell to generate for')
+
     # jrnl uninstall
     uninstall_parser = subparsers.add_parser('uninstall', help='Uninstall jrnl')
     uninstall_parser.add_argument('--no-backup', action='store_true',
@@ -139,6 +463,52 @@ Examples:
     return parser
 
 
+def run_command(parser, args):
+    """Dispatch parsed arguments to a command handler."""
+    # Route to appropriate command handler
+    if args.command == 'new':
+        return new.handle(args)
+    elif args.command in ['daily', 'standup']:
+        return daily.handle(args)
+    elif args.command == 'report':
+        return report.handle(args)
+    elif args.command == 'stats':
+        return stats.handle(args)
+    elif args.command == 'logs':
+        return logs.handle(args)
+    elif args.command == 'search':
+        return search.handle(args)
+    elif args.command == 'archive':
+        return archive_cmd.handle(args)
+    elif args.command == 'export':
+        return export_cmd.handle(args)
+    elif args.command == 'import':
+        return import_cmd.handle(args)
+    elif args.command == 'sync':
+        return sync.handle(args)
+    elif args.command in ['sync-push', 'sync-pull']:
+        return replicate.handle(args)
+    elif args.command == 'repair':
+        return repair.handle(args)
+    elif args.command == 'bench':
+        return bench.handle(args)
+    elif args.command == 'serve':
+        return serve.handle(args)
+    elif args.command == 'push':
+        return push.handle(args)
+    elif args.command == 'worker':
+        return worker.handle(args)
+    elif args.command == 'config':
+        return config_cmd.handle(args)
+    elif args.command == 'completion':
+        return completion.handle(args)
+    elif args.command == 'uninstall':
+        return uninstall_cmd.handle(args)
+    else:
+        parser.print_help()
+        return 1
+
+
 def main():
     """Main CLI entry point."""
     parser = create_parser()
@@ -148,21 +518,12 @@ def main():
         parser.print_help()
         return 0
 
+    if args.profile or tracing.env_requested():
+        tracing.enable()
+
     try:
-        # Route to appropriate command handler
-        if args.command == 'new':
-            return new.handle(args)
-        elif args.command in ['daily', 'standup']:
-            return daily.handle(args)
-        elif args.command == 'logs':
-            return logs.handle(args)
-        elif args.command == 'config':
-            return config_cmd.handle(args)
-        elif args.command == 'uninstall':
-            return uninstall_cmd.handle(args)
-        else:
-            parser.print_help()
-            return 1
+        with tracing.span(f"jrnl {args.command}", cat='cli'):
+            return run_command(parser, args)
 
     except KeyboardInterrupt:
         print("\nInterrupted")
@@ -172,6 +533,13 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        if tracing.is_enabled():
+            trace_path = tracing.write_trace(f"jrnl {args.command}")
+            if args.profile:
+                print(tracing.summary_line(f"jrnl {args.command}"), file=sys.stderr)
+                if trace_path:
+                    print(f"Trace written to {trace_path}", file=sys.stderr)
 
 
 if __name__ == '__main__':
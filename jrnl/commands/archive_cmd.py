@@ -0,0 +1,40 @@
+"""jrnl archive command - Move old entries to per-year archives and compact."""
+
+import sqlite3
+from ..database.archive import archive_before, compact_database, archive_dir
+from ..utils.date_utils import get_datetime_ago, parse_duration_days
+from ..utils.formatting import format_success, format_error, format_info
+
+
+def handle(args):
+    """Handle the 'archive' command."""
+    try:
+        days = parse_duration_days(args.older_than)
+    except ValueError as e:
+        print(format_error(str(e)))
+        return 1
+
+    cutoff = get_datetime_ago(days=days)
+
+    try:
+        moved = archive_before(cutoff)
+        if moved['logs'] or moved['dailies']:
+            print(format_success(
+                f"Archived {moved['logs']} log entries and {moved['dailies']} dailies "
+                f"older than {days} days to {archive_dir()}"
+            ))
+        else:
+            print(format_info(f"Nothing older than {days} days to archive"))
+
+        if not args.no_compact:
+            compact_database()
+            print(format_success("Compacted database and refreshed statistics"))
+
+        return 0
+
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except OSError as e:
+        print(format_error(f"Cannot write archive: {e}"))
+        return 1
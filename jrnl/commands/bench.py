@@ -0,0 +1,280 @@
+"""jrnl bench command - Compare LLM providers and models on real commits."""
+
+import json
+import math
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from ..config import Config
+from ..git_integration.commit_processor import extract_commit_info
+from ..llm_providers import PROVIDERS, LLMProvider
+from ..llm_providers.prompts import COMPRESS_COMMIT_PROMPT
+from ..utils.formatting import format_error, format_info
+
+# Servers that report no token counts are estimated at this many characters per token
+CHARS_PER_TOKEN = 4
+
+
+class Sample(NamedTuple):
+    """One request's measurements."""
+    ttft: Optional[float]  # Seconds until the first piece of the reply
+    latency: float  # Seconds until the reply was complete
+    input_tokens: Optional[int]
+    output_tokens: int
+    estimated: bool  # Token counts estimated from text length
+    summary_chars: int
+    error: Optional[str]
+
+
+class Run(NamedTuple):
+    """Every corpus prompt sent to one target at one concurrency level."""
+    target: str
+    concurrency: int
+    max_tokens: int
+    wall: float
+    samples: List[Sample]
+
+
+def handle(args):
+    """Handle the 'bench' command."""
+    if args.bench_command == 'providers':
+        return handle_providers(args)
+    return 1
+
+
+def handle_providers(args):
+    """Run the commit corpus through each target at each concurrency level."""
+    try:
+        levels = parse_levels(args.concurrency)
+    except ValueError as e:
+        print(format_error(str(e)))
+        return 1
+
+    prompts = load_corpus(args.repo, args.commits)
+    if not prompts:
+        print(format_error(f"No commits to benchmark in {args.repo}"))
+        return 1
+
+    config = Config.load()
+    targets = args.target or [config.get('active_llm_provider', 'anthropic')]
+    runs: List[Run] = []
+    failed = 0
+    for target in targets:
+        try:
+            provider = build_provider(config, target, max(levels))
+        except ValueError as e:
+            print(format_error(f"{target}: {e}"), file=sys.stderr)
+            failed += 1
+            continue
+
+        max_tokens = args.max_tokens or getattr(provider, 'max_tokens_commit', 200)
+        if not args.no_warmup:
+            # Loads the model (Ollama) and opens connections before anything is timed
+            warmup = measure(provider, prompts[0], max_tokens, args.timeout)
+            if warmup.error:
+                print(format_error(f"{target}: warmup failed: {warmup.error}"), file=sys.stderr)
+
+        for level in levels:
+            print(format_info(f"{target}: {len(prompts)} commits at concurrency {level}..."), file=sys.stderr)
+            runs.append(run_level(provider, target, prompts, level, max_tokens, args.timeout))
+
+    if args.json:
+        print(json.dumps([summarize(run) for run in runs], indent=2))
+    else:
+        print_report(runs, len(prompts))
+    return 1 if failed else 0
+
+
+def parse_levels(text: str) -> List[int]:
+    """Concurrency levels from a comma-separated list such as '1,4,8'."""
+    try:
+        levels = sorted({int(part) for part in text.split(',') if part.strip()})
+    except ValueError:
+        raise ValueError(f"Invalid concurrency levels: {text} (expected e.g. 1,4,8)")
+    if not levels or levels[0] < 1:
+        raise ValueError(f"Invalid concurrency levels: {text} (expected e.g. 1,4,8)")
+    return levels
+
+
+def load_corpus(repo_path: str, count: int) -> List[str]:
+    """Commit compression prompts for the newest non-merge commits of a repository."""
+    try:
+        result = subprocess.run(
+            ['git', '-C', repo_path, 'rev-list', '--no-merges', f'--max-count={count}', 'HEAD'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return []
+    if result.returncode != 0:
+        return []
+
+    prompts = []
+    for commit_hash in result.stdout.split():
+        info = extract_commit_info(repo_path, commit_hash)
+        if info:
+            prompts.append(COMPRESS_COMMIT_PROMPT.format(
+                commit_message=info['message'],
+                commit_diff=info['diff']
+            ))
+    return prompts
+
+
+def build_provider(config: Dict, target: str, concurrency: int) -> LLMProvider:
+    """
+    Provider for a 'provider' or 'provider:model' target.
+
+    Settings come from the provider's config block, with the model
+    replaced when the target names one.
+    """
+    name, _, model = target.partition(':')
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {name}")
+    block = dict(config.get('llm_providers', {}).get(name, {}))
+    if model:
+        block['model'] = model
+    # Keep the client's connection pool from being what the benchmark measures
+    block['max_concurrency'] = max(int(block.get('max_concurrency', 1)), concurrency)
+    provider_class = PROVIDERS[name]
+    if getattr(provider_class, 'wraps_provider', False):
+        raise ValueError("Cannot benchmark a wrapping provider; benchmark its upstream instead")
+    return provider_class(block)
+
+
+def measure(provider: LLMProvider, prompt: str, max_tokens: int,
+            timeout: Optional[float] = None) -> Sample:
+    """Send one prompt, streaming the reply, and time it."""
+    usage: Dict = {}
+    pieces = []
+    first = None
+    start = time.perf_counter()
+    try:
+        for piece in provider.stream_chat(prompt, max_tokens, timeout=timeout, usage=usage):
+            if first is None:
+                first = time.perf_counter()
+            pieces.append(piece)
+        error = None
+    except NotImplementedError as e:
+        error = str(e)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    end = time.perf_counter()
+
+    text = ''.join(pieces).strip()
+    estimated = not usage.get('output_tokens')
+    output_tokens = usage.get('output_tokens') or len(text) // CHARS_PER_TOKEN
+    input_tokens = usage.get('input_tokens')
+    if input_tokens is None:
+        input_tokens = len(prompt) // CHARS_PER_TOKEN
+        estimated = True
+    return Sample(
+        ttft=first - start if first is not None else None,
+        latency=end - start,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        estimated=estimated,
+        summary_chars=len(text),
+        error=error
+    )
+
+
+def run_level(provider: LLMProvider, target: str, prompts: Sequence[str], concurrency: int,
+              max_tokens: int, timeout: Optional[float] = None) -> Run:
+    """Send every prompt with up to `concurrency` requests in flight."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(lambda prompt: measure(provider, prompt, max_tokens, timeout), prompts))
+    return Run(target, concurrency, max_tokens, time.perf_counter() - start, samples)
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = math.ceil(pct * len(ordered) / 100) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+def _mean(values: Sequence[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+def summarize(run: Run) -> Dict:
+    """Aggregate one run's samples into the reported metrics."""
+    ok = [sample for sample in run.samples if not sample.error]
+    ttfts = [sample.ttft for sample in ok if sample.ttft is not None]
+    latencies = [sample.latency for sample in ok]
+    # Generation speed after the first token, so queueing and prefill don't count
+    rates = [
+        sample.output_tokens / (sample.latency - sample.ttft)
+        for sample in ok
+        if sample.ttft is not None and sample.latency > sample.ttft and sample.output_tokens
+    ]
+    outputs = [sample.output_tokens for sample in ok]
+    errors = sorted({sample.error for sample in run.samples if sample.error})
+    return {
+        'target': run.target,
+        'concurrency': run.concurrency,
+        'max_tokens': run.max_tokens,
+        'requests': len(run.samples),
+        'errors': len(run.samples) - len(ok),
+        'error_messages': errors[:5],
+        'wall_seconds': run.wall,
+        'ttft_p50': percentile(ttfts, 50),
+        'ttft_p95': percentile(ttfts, 95),
+        'latency_p50': percentile(latencies, 50),
+        'latency_p90': percentile(latencies, 90),
+        'latency_p99': percentile(latencies, 99),
+        'tokens_per_second': percentile(rates, 50),
+        'throughput_tokens_per_second': sum(outputs) / run.wall if run.wall else None,
+        'input_tokens_mean': _mean([sample.input_tokens for sample in ok]),
+        'output_tokens_mean': _mean(outputs),
+        'output_tokens_p95': percentile(outputs, 95),
+        'at_max_tokens': sum(1 for tokens in outputs if tokens >= run.max_tokens),
+        'summary_chars_mean': _mean([sample.summary_chars for sample in ok]),
+        'tokens_estimated': any(sample.estimated for sample in ok),
+    }
+
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{value:6.2f}s" if value is not None else "      -"
+
+
+def _number(value: Optional[float], width: int = 6) -> str:
+    return f"{value:{width}.0f}" if value is not None else f"{'-':>{width}}"
+
+
+def print_report(runs: List[Run], commits: int):
+    """Print one table per target, a row per concurrency level."""
+    if not runs:
+        return
+    header = ("   conc   ok/err   ttft p50     p95   lat p50     p90     p99"
+              "   tok/s  total tok/s  in tok  out tok  out p95  at max  chars")
+    current = None
+    for run in runs:
+        stats = summarize(run)
+        if run.target != current:
+            current = run.target
+            print(f"\n{run.target}  ({commits} commits, max_tokens {run.max_tokens})")
+            print(header)
+        ok = stats['requests'] - stats['errors']
+        print(
+            f"  {run.concurrency:5}  {ok:4}/{stats['errors']:<3}"
+            f"  {_seconds(stats['ttft_p50'])} {_seconds(stats['ttft_p95'])}"
+            f"  {_seconds(stats['latency_p50'])} {_seconds(stats['latency_p90'])} {_seconds(stats['latency_p99'])}"
+            f"  {_number(stats['tokens_per_second'])}  {_number(stats['throughput_tokens_per_second'], 11)}"
+            f"  {_number(stats['input_tokens_mean'])}  {_number(stats['output_tokens_mean'], 7)}"
+            f"  {_number(stats['output_tokens_p95'], 7)}  {stats['at_max_tokens']:6}"
+            f"  {_number(stats['summary_chars_mean'], 5)}"
+        )
+        for message in stats['error_messages']:
+            print(f"           error: {message}")
+
+    if any(summarize(run)['tokens_estimated'] for run in runs):
+        print(f"\nToken counts the server did not report are estimated at {CHARS_PER_TOKEN} characters per token.")
+    print("\nA summary that reaches max_tokens was cut off; keep max_tokens_commit above the out p95 column.")
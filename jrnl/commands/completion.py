@@ -0,0 +1,277 @@
+"""jrnl completion command - Print shell completion scripts."""
+
+import argparse
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from ..database.completion_cache import CACHE_NAME
+
+SHELLS = ('bash', 'zsh', 'fish')
+
+# Option values completed from the completion cache: (command, option) -> (cache kind, extra words)
+CACHED_VALUES = {
+    ('logs', '--delete'): ('label', ()),
+    ('search', '--related'): ('label', ()),
+    ('daily', '--delete'): ('daily', ('today', 'latest')),
+}
+
+CACHE_FILE = f'$HOME/.jrnl/{CACHE_NAME}'
+
+
+class Option(NamedTuple):
+    flags: List[str]
+    help: str
+    takes_value: bool
+    choices: List[str]
+    cached: Optional[str]  # Cache kind ('label' or 'daily') completing the value
+
+
+class Command(NamedTuple):
+    names: List[str]  # Name followed by aliases
+    help: str
+    options: List[Option]
+    choices: List[str]  # Choices of positional arguments
+
+
+def handle(args):
+    """Handle the 'completion' command."""
+    from ..cli import create_parser
+
+    commands = describe(create_parser())
+    print(GENERATORS[args.shell](commands), end='')
+    return 0
+
+
+def describe(parser: argparse.ArgumentParser) -> List[Command]:
+    """Commands and options of the CLI, read from its argparse definition."""
+    subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    help_by_name = {action.dest: action.help or '' for action in subparsers._choices_actions}
+
+    commands: Dict[int, Command] = {}
+    for name, subparser in subparsers.choices.items():
+        if id(subparser) in commands:
+            commands[id(subparser)].names.append(name)  # Alias
+            continue
+        options, choices = [], []
+        for action in subparser._actions:
+            if action.help == argparse.SUPPRESS:
+                continue
+            if not action.option_strings:
+                choices.extend(str(choice) for choice in action.choices or ())
+                continue
+            cached = None
+            for flag in action.option_strings:
+                cached = cached or CACHED_VALUES.get((name, flag), (None,))[0]
+            options.append(Option(
+                flags=list(action.option_strings),
+                help=(action.help or '').replace('%(default)s', str(action.default)),
+                takes_value=action.nargs != 0,
+                choices=[str(choice) for choice in action.choices or ()],
+                cached=cached
+            ))
+        commands[id(subparser)] = Command([name], help_by_name.get(name, ''), options, choices)
+    return list(commands.values())
+
+
+def _cached_extras(command: Command, option: Option) -> Tuple[str, ...]:
+    for flag in option.flags:
+        entry = CACHED_VALUES.get((command.names[0], flag))
+        if entry:
+            return entry[1]
+    return ()
+
+
+def _single_quote(text: str) -> str:
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def bash_script(commands: List[Command]) -> str:
+    value_cases = []
+    option_cases = []
+    for command in commands:
+        pattern = '|'.join(command.names)
+        for option in command.options:
+            if not option.takes_value:
+                continue
+            flags = '|'.join(f'{name}:{flag}' for name in command.names for flag in option.flags)
+            if option.cached:
+                extras = ' '.join(_cached_extras(command, option))
+                words = f'{extras} $(_jrnl_cached {option.cached})'.strip()
+            elif option.choices:
+                words = ' '.join(option.choices)
+            else:
+                continue
+            value_cases.append(f'        {flags})\n'
+                               f'            COMPREPLY=($(compgen -W "{words}" -- "$cur")); return ;;')
+        flags = ' '.join(flag for option in command.options for flag in option.flags)
+        option_cases.append(f'        {pattern})\n'
+                            f'            opts="{flags}"; words="{" ".join(command.choices)}" ;;')
+
+    names = ' '.join(name for command in commands for name in command.names)
+    return f'''# jrnl bash completion, generated by `jrnl completion bash`
+# Values come from {CACHE_FILE}, so completing does not start Python.
+
+_jrnl_cached() {{
+    local kind value
+    [[ -r {CACHE_FILE} ]] || return
+    while read -r kind value; do
+        [[ $kind == "$1" ]] && printf '%s\\n' "$value"
+    done < {CACHE_FILE}
+}}
+
+_jrnl() {{
+    local cur prev cmd opts words i
+    cur=${{COMP_WORDS[COMP_CWORD]}}
+    prev=${{COMP_WORDS[COMP_CWORD-1]}}
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        if [[ ${{COMP_WORDS[i]}} != -* ]]; then
+            cmd=${{COMP_WORDS[i]}}
+            break
+        fi
+    done
+
+    if [[ -z $cmd ]]; then
+        COMPREPLY=($(compgen -W "{names} --help --version --profile" -- "$cur"))
+        return
+    fi
+
+    case "$cmd:$prev" in
+{chr(10).join(value_cases)}
+    esac
+
+    case "$cmd" in
+{chr(10).join(option_cases)}
+        *) return ;;
+    esac
+    if [[ $cur == -* ]]; then
+        COMPREPLY=($(compgen -W "$opts" -- "$cur"))
+    elif [[ -n $words ]]; then
+        COMPREPLY=($(compgen -W "$words" -- "$cur"))
+    fi
+}}
+
+complete -o default -F _jrnl jrnl
+'''
+
+
+def _zsh_item(name: str, description: str) -> str:
+    """A 'name:description' entry for _describe."""
+    return _single_quote(name.replace(':', '\\:') + ':' + description)
+
+
+def zsh_script(commands: List[Command]) -> str:
+    described = '\n'.join(
+        f"            {_zsh_item(name, command.help)}"
+        for command in commands for name in command.names
+    )
+    value_cases = []
+    option_cases = []
+    for command in commands:
+        for option in command.options:
+            if not option.takes_value or not (option.cached or option.choices):
+                continue
+            flags = '|'.join(f'{name}:{flag}' for name in command.names for flag in option.flags)
+            if option.cached:
+                words = ' '.join(_cached_extras(command, option) + ('$reply',))
+                action = f'_jrnl_cached {option.cached}; compadd -- {words}'
+            else:
+                action = f'compadd -- {" ".join(option.choices)}'
+            value_cases.append(f'        {flags})\n            {action}; return ;;')
+        items = ' '.join(
+            _zsh_item(flag, option.help)
+            for option in command.options for flag in option.flags
+        )
+        choices = f'compadd -- {" ".join(command.choices)}' if command.choices else '_files'
+        option_cases.append(
+            f'        {"|".join(command.names)})\n'
+            f'            opts=({items})\n'
+            f'            if [[ $PREFIX == -* ]]; then _describe -t options option opts; else {choices}; fi ;;'
+        )
+
+    return f'''#compdef jrnl
+# jrnl zsh completion, generated by `jrnl completion zsh`
+# Values come from {CACHE_FILE}, so completing does not start Python.
+
+_jrnl_cached() {{
+    local line
+    reply=()
+    [[ -r {CACHE_FILE} ]] || return
+    while IFS= read -r line; do
+        [[ $line == "$1 "* ]] && reply+=("${{line#$1 }}")
+    done < {CACHE_FILE}
+}}
+
+_jrnl() {{
+    local cmd i prev=${{words[CURRENT-1]}}
+    local -a opts
+    for ((i = 2; i < CURRENT; i++)); do
+        if [[ ${{words[i]}} != -* ]]; then
+            cmd=${{words[i]}}
+            break
+        fi
+    done
+
+    if [[ -z $cmd ]]; then
+        local -a commands=(
+{described}
+        )
+        _describe -t commands 'jrnl command' commands
+        return
+    fi
+
+    case "$cmd:$prev" in
+{chr(10).join(value_cases)}
+    esac
+
+    case $cmd in
+{chr(10).join(option_cases)}
+    esac
+}}
+
+if [[ $zsh_eval_context[-1] == loadautofunc ]]; then
+    _jrnl "$@"
+else
+    compdef _jrnl jrnl
+fi
+'''
+
+
+def fish_script(commands: List[Command]) -> str:
+    lines = [
+        '# jrnl fish completion, generated by `jrnl completion fish`',
+        f'# Values come from {CACHE_FILE.replace("$HOME", "~")}, so completing does not start Python.',
+        '',
+        'function __jrnl_cached',
+        f'    set -l cache {CACHE_FILE.replace("$HOME", "~")}',
+        '    test -r $cache; and string replace -rf "^$argv[1] " "" < $cache',
+        'end',
+        '',
+    ]
+    for command in commands:
+        for name in command.names:
+            lines.append(f"complete -c jrnl -n __fish_use_subcommand -f -a {name} -d {_single_quote(command.help)}")
+    lines.append('')
+    for command in commands:
+        condition = _single_quote('__fish_seen_subcommand_from ' + ' '.join(command.names))
+        if command.choices:
+            lines.append(f"complete -c jrnl -n {condition} -f -a {_single_quote(' '.join(command.choices))}")
+        for option in command.options:
+            parts = [f'complete -c jrnl -n {condition}']
+            for flag in option.flags:
+                parts.append(f'-l {flag[2:]}' if flag.startswith('--') else f'-s {flag[1:]}')
+            if option.cached:
+                extras = ' '.join(_cached_extras(command, option))
+                parts.append(f"-x -a {_single_quote(f'{extras} (__jrnl_cached {option.cached})'.strip())}")
+            elif option.choices:
+                parts.append(f"-x -a {_single_quote(' '.join(option.choices))}")
+            elif option.takes_value:
+                parts.append('-r')
+            if option.help:
+                parts.append(f'-d {_single_quote(option.help)}')
+            lines.append(' '.join(parts))
+    return '\n'.join(lines) + '\n'
+
+
+GENERATORS = {
+    'bash': bash_script,
+    'zsh': zsh_script,
+    'fish': fish_script,
+}
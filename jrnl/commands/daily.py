@@ -1,18 +1,13 @@
 """jrnl daily command - Generate standup summaries."""
 
 import sqlite3
+from ..api import Journal
 from ..database.operations import (
-    get_logs_since,
     get_latest_daily,
-    get_previous_daily_before,
     get_daily_for_date,
-    insert_daily,
     delete_daily
 )
-from ..database.models import Daily
-from ..config import Config
-from ..llm_providers import get_provider
-from ..utils.date_utils import get_utc_now, get_current_date, get_datetime_ago
+from ..utils.date_utils import get_current_date
 from ..utils.formatting import format_daily_header
 
 
@@ -23,51 +18,33 @@ def handle(args):
         if hasattr(args, 'delete') and args.delete:
             return handle_delete(args.delete)
 
-        config = Config.load()
-
-        # Determine date range for logs
-        if args.regenerate:
-            cutoff = get_regenerate_cutoff()
-        else:
-            cutoff = get_normal_cutoff()
-
-        # Get logs
-        logs = get_logs_since(cutoff)
-
-        if not logs:
-            if args.regenerate:
-                print("No logs found. Cannot regenerate - no previous daily exists.")
+        def report_progress(found, sent):
+            if sent < found:
+                print(f"Generating standup from {found} log entries "
+                      f"({sent} after collapsing near-duplicates)...")
             else:
-                print("No logs found since last daily. Try: jrnl logs")
-            return 0
-
-        print(f"Generating standup from {len(logs)} log entries...")
-
-        # Get LLM provider
-        provider = get_provider(config)
-
-        # Generate daily message
-        print("Generating standup (this may take 10-30 seconds)...")
-        daily_message = provider.generate_daily(
-            logs=[log.to_dict() for log in logs],
-            days=args.days
-        )
-
-        # Save daily
-        today = get_current_date()
-        daily = Daily(
-            timestamp=get_utc_now(),
-            daily_date=today,
-            daily_message=daily_message
-        )
-
-        insert_daily(daily)
+                print(f"Generating standup from {found} log entries...")
+            print("Generating standup (this may take 10-30 seconds)...")
+
+        with Journal() as journal:
+            daily = journal.generate_daily(days=args.days, regenerate=args.regenerate,
+                                           progress=report_progress)
+            if daily is None:
+                if args.regenerate:
+                    print("No logs found. Cannot regenerate - no previous daily exists.")
+                else:
+                    print("No logs found since last daily. Try: jrnl logs")
+                return 0
+            degraded = journal.count_degraded()
 
         # Display result
-        print(format_daily_header(today))
-        print(daily_message)
+        print(format_daily_header(daily.daily_date))
+        print(daily.daily_message)
         print("\n" + "="*60 + "\n")
 
+        if degraded:
+            print(f"Note: {degraded} entries still hold an LLM error placeholder. Run: jrnl repair\n")
+
         return 0
 
     except sqlite3.Error as e:
@@ -121,28 +98,3 @@ def handle_delete(date_arg: str) -> int:
     except Exception as e:
         print(f"Error deleting daily: {e}")
         return 1
-
-
-def get_normal_cutoff():
-    """Get cutoff timestamp for normal daily generation."""
-    latest_daily = get_latest_daily()
-    if latest_daily:
-        return latest_daily.timestamp
-    else:
-        # No previous daily - get logs from 24 hours ago
-        return get_datetime_ago(hours=24)
-
-
-def get_regenerate_cutoff():
-    """Get cutoff timestamp for regenerating today's daily."""
-    today = get_current_date()
-    latest_daily = get_latest_daily()
-
-    if latest_daily and latest_daily.daily_date == today:
-        # Today's daily exists - get previous daily's timestamp
-        prev_daily = get_previous_daily_before(today)
-        if prev_daily:
-            return prev_daily.timestamp
-
-    # Fallback: 24 hours ago
-    return get_datetime_ago(hours=24)
@@ -0,0 +1,62 @@
+"""jrnl export command - Stream log entries out as JSONL or CSV."""
+
+import csv
+import json
+import sqlite3
+import sys
+from ..database.operations import iter_all_logs
+from ..utils.formatting import format_error, format_success
+
+# Columns written by export and understood by import
+LOG_FIELDS = ['timestamp', 'log_message', 'type', 'label']
+# Columns that may be empty; files without them still import
+OPTIONAL_LOG_FIELDS = ['repo']
+
+FORMATS = ['jsonl', 'csv']
+
+
+def handle(args):
+    """Handle the 'export' command."""
+    try:
+        if args.output and args.output != '-':
+            with open(args.output, 'w', newline='', encoding='utf-8') as f:
+                count = write_logs(f, args.format)
+            print(format_success(f"Exported {count} log entries to {args.output}"), file=sys.stderr)
+        else:
+            count = write_logs(sys.stdout, args.format)
+        return 0
+
+    except BrokenPipeError:
+        # Output piped into e.g. head - not an error
+        return 0
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"), file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(format_error(f"Cannot write export file: {e}"), file=sys.stderr)
+        return 1
+
+
+def write_logs(stream, fmt: str) -> int:
+    """Write every log entry to stream in the given format. Returns row count."""
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(LOG_FIELDS + OPTIONAL_LOG_FIELDS)
+        for log in iter_all_logs():
+            writer.writerow((log.timestamp, log.log_message, log.type, log.label, log.repo or ''))
+            count += 1
+    else:
+        for log in iter_all_logs():
+            record = {
+                'timestamp': log.timestamp,
+                'log_message': log.log_message,
+                'type': log.type,
+                'label': log.label
+            }
+            if log.repo:
+                record['repo'] = log.repo
+            stream.write(json.dumps(record, ensure_ascii=False))
+            stream.write('\n')
+            count += 1
+    return count
@@ -0,0 +1,132 @@
+"""jrnl import command - Bulk load log entries from JSONL or CSV."""
+
+import csv
+import json
+import sqlite3
+from datetime import timezone
+from pathlib import Path
+from typing import Iterator, Optional
+from ..database.operations import insert_logs_bulk
+from ..database.models import Log
+from ..utils.date_utils import parse_iso_datetime
+from ..utils.formatting import format_error, format_success
+from .export_cmd import LOG_FIELDS
+
+LOG_TYPES = ('manual', 'git-hook')
+
+
+class ImportStats:
+    """Counters collected while reading an import file."""
+
+    def __init__(self):
+        self.read = 0
+        self.skipped = 0
+
+
+def handle(args):
+    """Handle the 'import' command."""
+    path = Path(args.file)
+    if not path.is_file():
+        print(format_error(f"File not found: {path}"))
+        return 1
+
+    fmt = args.format or detect_format(path)
+    if fmt is None:
+        print(format_error("Cannot detect format from file extension. Use --format jsonl|csv"))
+        return 1
+
+    stats = ImportStats()
+    try:
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            records = read_csv(f, stats) if fmt == 'csv' else read_jsonl(f, stats)
+            inserted = insert_logs_bulk(records)
+
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except (OSError, UnicodeDecodeError) as e:
+        print(format_error(f"Cannot read import file: {e}"))
+        return 1
+    except csv.Error as e:
+        print(format_error(f"Malformed CSV: {e}"))
+        return 1
+
+    duplicates = stats.read - stats.skipped - inserted
+    print(format_success(
+        f"Imported {inserted} log entries "
+        f"({duplicates} duplicate labels, {stats.skipped} invalid rows skipped)"
+    ))
+    return 0
+
+
+def detect_format(path: Path) -> Optional[str]:
+    """Guess the import format from the file extension."""
+    suffix = path.suffix.lower()
+    if suffix in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    if suffix == '.csv':
+        return 'csv'
+    return None
+
+
+def to_log(record: dict) -> Optional[Log]:
+    """Validate one decoded record. Returns None for rows that cannot be stored."""
+    if not isinstance(record, dict):
+        return None
+    values = [record.get(field) for field in LOG_FIELDS]
+    if not all(isinstance(value, str) and value for value in values):
+        return None
+    timestamp, log_message, log_type, label = values
+    if log_type not in LOG_TYPES:
+        return None
+    timestamp = normalize_timestamp(timestamp)
+    if timestamp is None:
+        return None
+    # Optional, see OPTIONAL_LOG_FIELDS; CSV writes an empty cell for none
+    repo = record.get('repo') or None
+    if repo is not None and not isinstance(repo, str):
+        return None
+    return Log(timestamp=timestamp, log_message=log_message, type=log_type, label=label, repo=repo)
+
+
+def normalize_timestamp(value: str) -> Optional[str]:
+    """
+    ISO 8601 timestamp in the stored form (UTC, `+00:00` offset), or None if invalid.
+
+    Timestamps without an offset are taken as UTC, like the ones jrnl writes.
+    """
+    try:
+        parsed = parse_iso_datetime(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def read_jsonl(stream, stats: ImportStats) -> Iterator[Log]:
+    """Yield logs from a JSON Lines stream, one line at a time."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        stats.read += 1
+        try:
+            log = to_log(json.loads(line))
+        except json.JSONDecodeError:
+            log = None
+        if log is None:
+            stats.skipped += 1
+            continue
+        yield log
+
+
+def read_csv(stream, stats: ImportStats) -> Iterator[Log]:
+    """Yield logs from a CSV stream with a header row."""
+    for record in csv.DictReader(stream):
+        stats.read += 1
+        log = to_log(record)
+        if log is None:
+            stats.skipped += 1
+            continue
+        yield log
@@ -1,9 +1,17 @@
 """jrnl logs command - View log entries."""
 
 import sqlite3
-from ..database.operations import get_logs_since, get_all_logs, get_log_by_label, delete_log
+from datetime import datetime, timezone
+from ..api import Journal
+from ..database.operations import PAGE_SIZE, iter_recent_logs, get_logs_after_id
+from ..database import connection
 from ..utils.date_utils import get_datetime_ago
 from ..utils.formatting import format_log_entry, format_success, format_error
+from ..utils.pager import paged_output
+from ..utils.watch import DatabaseWatcher
+
+# Re-check for new rows at least this often even without a change notification
+FOLLOW_SAFETY_INTERVAL = 30.0
 
 
 def handle(args):
@@ -13,21 +21,31 @@ def handle(args):
         if args.delete:
             return handle_delete(args.delete)
 
-        # Get logs based on filters
-        if args.days:
-            cutoff = get_datetime_ago(days=args.days)
-            logs = get_logs_since(cutoff)
-        else:
-            logs = get_all_logs(limit=args.limit)
-
-        if not logs:
-            print("No logs found")
-            return 0
-
-        # Display logs
-        print(f"\nShowing {len(logs)} log entries:\n")
-        for log in logs:
-            print(format_log_entry(log))
+        if getattr(args, 'follow', False):
+            return handle_follow(args.limit)
+
+        with Journal() as journal:
+            # Get logs based on filters (streamed, nothing is materialized)
+            archived = getattr(args, 'archived', False)
+            if args.days:
+                cutoff = get_datetime_ago(days=args.days)
+                total = journal.count_logs(since=cutoff, include_archived=archived)
+                logs = journal.iter_logs(since=cutoff, newest_first=False, include_archived=archived)
+            else:
+                total = min(journal.count_logs(include_archived=archived), args.limit)
+                logs = journal.iter_logs(limit=args.limit, include_archived=archived)
+
+            if not total:
+                print("No logs found")
+                return 0
+
+            # Display logs - one shared "now" for every relative timestamp
+            now = datetime.now(timezone.utc)
+            with paged_output(enabled=not getattr(args, 'no_pager', False)) as write:
+                write(f"\nShowing {total} log entries:\n")
+                for log in logs:
+                    if not write(format_log_entry(log, now)):
+                        break
 
         return 0
 
@@ -41,11 +59,47 @@ def handle(args):
         return 1
 
 
+def handle_follow(limit: int):
+    """Print the latest logs, then new ones as they are written."""
+    recent = list(iter_recent_logs(limit=limit))
+    now = datetime.now(timezone.utc)
+    for log in reversed(recent):
+        print(format_log_entry(log, now))
+    last_id = max((log.id for log in recent), default=0)
+
+    watcher = DatabaseWatcher(connection.DB_PATH)
+    print("\nFollowing new log entries (Ctrl-C to stop)...\n", flush=True)
+    try:
+        while True:
+            watcher.wait(timeout=FOLLOW_SAFETY_INTERVAL)
+            # A burst (sync, import) can be larger than one page; drain it all
+            while True:
+                new_logs = get_logs_after_id(last_id, limit=PAGE_SIZE)
+                if not new_logs:
+                    break
+                now = datetime.now(timezone.utc)
+                for log in new_logs:
+                    print(format_log_entry(log, now), flush=True)
+                last_id = new_logs[-1].id
+                if len(new_logs) < PAGE_SIZE:
+                    break
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
+
+
 def handle_delete(label: str):
     """Handle log deletion with confirmation."""
+    try:
+        journal = Journal()
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+
     try:
         # Find the log entry
-        log = get_log_by_label(label)
+        log = journal.get(label)
 
         if not log:
             print(format_error(f"Log entry not found: {label}"))
@@ -63,7 +117,7 @@ def handle_delete(label: str):
             return 0
 
         # Delete the log
-        if delete_log(label):
+        if journal.delete(label):
             print(format_success(f"Log entry deleted: {label}"))
             return 0
         else:
@@ -78,3 +132,5 @@ def handle_delete(label: str):
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        journal.close()
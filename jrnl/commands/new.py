@@ -1,15 +1,20 @@
 """jrnl new command - Create log entries."""
 
-import uuid
 import subprocess
 import sqlite3
 from pathlib import Path
+from typing import Optional, Tuple
+from ..api import Journal
 from ..database.operations import insert_log
-from ..database.models import Log
+from ..database.models import Log, is_degraded
 from ..utils.date_utils import get_utc_now
 from ..utils.formatting import format_success, format_error
+from ..utils import tracing
 from ..config import Config
 from ..llm_providers import get_provider
+from ..git_integration.diff_reader import TRUNCATION_NOTE, read_commit_chunks, read_commit_diff
+from ..git_integration.classifier import classify_commit
+from ..git_integration import notes
 
 
 def handle(args):
@@ -30,16 +35,8 @@ def handle_manual_mode(args):
         return 1
 
     try:
-        # Create log entry
-        log = Log(
-            timestamp=get_utc_now(),
-            log_message=args.message,
-            type='manual',
-            label=args.label or str(uuid.uuid4())[:8]
-        )
-
-        # Save to database
-        insert_log(log)
+        with Journal() as journal:
+            journal.add(args.message, label=args.label)
 
         print(format_success(f"Log entry created: {args.message}"))
         return 0
@@ -65,32 +62,11 @@ def handle_git_mode(args):
         return 1
 
     try:
-        # Extract commit info
-        commit_info = extract_commit_info(args.repo_path, args.commit_hash)
-        if not commit_info:
-            return 1  # Silently fail
-
         # Load config and get LLM provider
         config = Config.load()
         provider = get_provider(config)
 
-        # Compress commit info
-        log_message = provider.compress_commit(
-            commit_message=commit_info['message'],
-            commit_diff=commit_info['diff']
-        )
-
-        # Create log entry
-        log = Log(
-            timestamp=get_utc_now(),
-            log_message=log_message,
-            type='git-hook',
-            label=commit_info['hash'][:8]
-        )
-
-        # Save to database
-        insert_log(log)
-
+        process_commit(args.repo_path, args.commit_hash, provider)
         return 0
 
     except Exception as e:
@@ -99,31 +75,125 @@ def handle_git_mode(args):
         return 0  # Return success to avoid blocking commit
 
 
-def extract_commit_info(repo_path: str, commit_hash: str) -> dict:
-    """Extract commit message and diff."""
+def process_commit(repo_path: str, commit_hash: str, provider,
+                   timestamp: Optional[str] = None) -> bool:
+    """
+    Compress one commit and store it as a git-hook log. Returns True if stored.
+
+    The log is timestamped now unless a timestamp (e.g. the commit time for
+    commits found by `jrnl sync`) is given.
+    """
+    summary = summarize_commit(repo_path, commit_hash, provider)
+    if summary is None:
+        return False  # Silently fail
+    commit_info, log_message = summary
+
+    # Create log entry
+    log = Log(
+        timestamp=timestamp or get_utc_now(),
+        log_message=log_message,
+        type='git-hook',
+        label=commit_info['hash'][:8],
+        repo=commit_info['repo']
+    )
+
+    # Save to database
+    insert_log(log)
+    return True
+
+
+def summarize_commit(repo_path: str, commit_hash: str, provider) -> Optional[Tuple[dict, str]]:
+    """
+    Return (commit info, log message) for a commit, or None if it can't be read.
+
+    The message is, in order of preference, a summary already shared in
+    the commit's git note, a classifier template for trivial commits, or
+    the provider's compression (possibly a failure placeholder).
+    """
+    # Extract the commit message; the diff is only read if the LLM needs it
+    commit_info = extract_commit_info(repo_path, commit_hash, include_diff=False)
+    if not commit_info:
+        return None
+
+    # Another clone may already have compressed this commit
+    if Config.get('git_notes_read', True):
+        try:
+            with tracing.span('read_note', cat='git'):
+                noted = notes.read_note(repo_path, commit_hash)
+        except (OSError, subprocess.SubprocessError):
+            noted = None
+        if noted:
+            return commit_info, noted
+
+    # Merges, reverts, version bumps and formatting get a template summary
+    log_message = None
+    if Config.get('commit_classifier', True):
+        try:
+            with tracing.span('classify_commit', cat='git'):
+                log_message = classify_commit(repo_path, commit_hash, commit_info['message'])
+        except (OSError, subprocess.SubprocessError):
+            log_message = None
+
+    if log_message is None:
+        try:
+            commit_info['diff'] = read_commit_diff(repo_path, commit_hash)
+        except (OSError, subprocess.SubprocessError) as e:
+            log_error(f"Could not read diff for {commit_hash}: {type(e).__name__}: {e}")
+            return None
+
+        # A truncated diff shows only its first files; summarize such
+        # commits part by part so the summary covers the whole change
+        chunks = None
+        if commit_info['diff'].endswith(TRUNCATION_NOTE) and Config.get('large_commit_map_reduce', True):
+            try:
+                chunks = read_commit_chunks(repo_path, commit_hash, int(Config.get('large_commit_max_chunks', 8)))
+            except (OSError, subprocess.SubprocessError) as e:
+                log_error(f"Could not split diff for {commit_hash}: {type(e).__name__}: {e}")
+
+        # Compress commit info
+        with tracing.span('compress_commit', cat='provider', provider=type(provider).__name__,
+                          parts=len(chunks) if chunks else 1):
+            if chunks and len(chunks) > 1:
+                log_message = provider.compress_large_commit(
+                    commit_message=commit_info['message'],
+                    commit_diff=commit_info['diff'],
+                    chunks=chunks
+                )
+            else:
+                log_message = provider.compress_commit(
+                    commit_message=commit_info['message'],
+                    commit_diff=commit_info['diff']
+                )
+
+        # Share the LLM output; templates are cheap to recompute and
+        # placeholders must not spread
+        if Config.get('git_notes_write', False) and not is_degraded(log_message):
+            try:
+                with tracing.span('write_note', cat='git'):
+                    if not notes.write_note(repo_path, commit_hash, log_message):
+                        log_error(f"Could not write git note for {commit_hash}")
+            except (OSError, subprocess.SubprocessError) as e:
+                log_error(f"Could not write git note for {commit_hash}: {type(e).__name__}: {e}")
+
+    return commit_info, log_message
+
+
+def extract_commit_info(repo_path: str, commit_hash: str, include_diff: bool = True) -> dict:
+    """Extract commit message and, unless include_diff is False, the diff."""
     try:
         # Get commit message
-        result = subprocess.run(
-            ['git', '-C', repo_path, 'log', '-1', '--pretty=%B', commit_hash],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        with tracing.span('git log', cat='git'):
+            result = subprocess.run(
+                ['git', '-C', repo_path, 'log', '-1', '--pretty=%B', commit_hash],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
         commit_message = result.stdout.strip()
 
-        # Get commit diff with context
-        result = subprocess.run(
-            ['git', '-C', repo_path, 'show', '--unified=3', '--no-color', commit_hash],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        commit_diff = result.stdout
-
-        # Truncate large diffs to avoid exceeding LLM context limits
-        MAX_DIFF_SIZE = 50000  # characters
-        if len(commit_diff) > MAX_DIFF_SIZE:
-            commit_diff = commit_diff[:MAX_DIFF_SIZE] + "\n... (diff truncated for size)"
+        # Get commit diff with context, streamed and capped so huge commits
+        # never get fully read into memory
+        commit_diff = read_commit_diff(repo_path, commit_hash) if include_diff else None
 
         return {
             'hash': commit_hash,
@@ -147,6 +217,7 @@ def extract_commit_info(repo_path: str, commit_hash: str) -> dict:
 
 def log_error(message: str):
     """Log error to error log file."""
+    tracing.instant('error', message=message)
     try:
         error_log = Path.home() / '.jrnl' / 'logs' / 'errors.log'
         error_log.parent.mkdir(parents=True, exist_ok=True)
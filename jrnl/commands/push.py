@@ -0,0 +1,103 @@
+"""jrnl push command - Send new local logs and dailies to the team server."""
+
+import sqlite3
+import requests
+from ..config import Config
+from ..database.operations import (
+    get_logs_after_id,
+    get_dailies_after_id,
+    get_log_updates_after,
+    get_push_state,
+    set_push_state
+)
+from ..utils.date_utils import get_utc_now
+from ..utils.formatting import format_success, format_error, format_info
+
+# Rows sent per request; the server ingests each batch in one transaction
+PUSH_BATCH_SIZE = 1000
+
+
+def handle(args):
+    """Handle the 'push' command."""
+    settings = Config.get('team_server', {})
+    url = (args.server or settings.get('url') or '').rstrip('/')
+    user = args.user or settings.get('user')
+    token = settings.get('token')
+    if not url or not user:
+        print(format_error(
+            "Team server URL and user are required. Use: jrnl push --server URL --user NAME, "
+            "or set team_server.url and team_server.user in ~/.jrnl/config.json"
+        ))
+        return 1
+
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+    try:
+        with requests.Session() as session:
+            session.headers.update(headers)
+            logs_sent, dailies_sent = push(session, url, user)
+    except requests.exceptions.RequestException as e:
+        print(format_error(f"Push to {url} failed: {e}"))
+        return 1
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+
+    if logs_sent or dailies_sent:
+        print(format_success(f"Pushed {logs_sent} log entries and {dailies_sent} dailies to {url}"))
+    else:
+        print(format_info("Nothing new to push"))
+    return 0
+
+
+def push(session: requests.Session, url: str, user: str) -> tuple:
+    """
+    Send everything written since the last push, in batches.
+
+    New rows go first, by id. Logs changed after they were pushed (e.g. by
+    `jrnl repair` or a sync pull) follow and replace the server's copy.
+    Progress is saved after each accepted batch, so an interrupted push
+    resumes where it stopped. Returns (logs sent, dailies sent).
+    """
+    last_log_id, last_daily_id, last_update_seq = get_push_state(url)
+    logs_sent = dailies_sent = 0
+
+    while True:
+        logs = get_logs_after_id(last_log_id, PUSH_BATCH_SIZE)
+        dailies = get_dailies_after_id(last_daily_id, PUSH_BATCH_SIZE)
+        if not logs and not dailies:
+            break
+
+        _ingest(session, url, user, logs, dailies)
+        if logs:
+            last_log_id = logs[-1].id
+        if dailies:
+            last_daily_id = dailies[-1].id
+        set_push_state(url, last_log_id, last_daily_id, last_update_seq, get_utc_now())
+        logs_sent += len(logs)
+        dailies_sent += len(dailies)
+
+    while True:
+        logs, seq = get_log_updates_after(last_update_seq, PUSH_BATCH_SIZE)
+        if seq == last_update_seq:
+            return logs_sent, dailies_sent
+
+        # Updated logs not pushed yet went out with the new rows above
+        logs = [log for log in logs if log.id <= last_log_id]
+        if logs:
+            _ingest(session, url, user, logs, [])
+        last_update_seq = seq
+        set_push_state(url, last_log_id, last_daily_id, last_update_seq, get_utc_now())
+        logs_sent += len(logs)
+
+
+def _ingest(session: requests.Session, url: str, user: str, logs: list, dailies: list):
+    response = session.post(
+        f"{url}/api/v1/ingest",
+        json={
+            'user': user,
+            'logs': [log.to_dict() for log in logs],
+            'dailies': [daily.to_dict() for daily in dailies]
+        },
+        timeout=60
+    )
+    response.raise_for_status()
@@ -0,0 +1,117 @@
+"""jrnl repair command - Re-compress logs stored with provider failure placeholders."""
+
+import os
+import sqlite3
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
+from ..config import Config
+from ..database.models import Log, is_degraded, strip_degraded_prefix
+from ..database.operations import get_degraded_logs, update_log_messages
+from ..llm_providers import get_provider
+from ..utils.formatting import format_success, format_error, format_info
+from .new import summarize_commit, log_error
+
+
+def handle(args):
+    """Handle the 'repair' command."""
+    try:
+        logs = get_degraded_logs(args.limit)
+        if not logs:
+            print(format_info("No degraded entries to repair"))
+            return 0
+
+        if args.dry_run:
+            for log in logs:
+                print(f"{log.label}  {log.timestamp[:10]}  {log.log_message.splitlines()[0]}")
+            print(format_info(f"{len(logs)} degraded entries"))
+            return 0
+
+        config = Config.load()
+        provider = get_provider(config)
+        max_workers = args.jobs or config.get('hook_max_concurrency', 2)
+
+        # Logs written before the repo column existed have none; look for their commits here
+        fallback_repos = [path for path in (args.repo, current_repo()) if path]
+
+        print(f"Re-compressing {len(logs)} degraded entries...")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(logs)))) as pool:
+            messages = list(pool.map(lambda log: recompress(log, provider, fallback_repos), logs))
+
+        updates = [
+            (log.id, message)
+            for log, message in zip(logs, messages)
+            if message and not is_degraded(message)
+        ]
+        update_log_messages(updates)
+
+        failed = len(logs) - len(updates)
+        if updates:
+            print(format_success(f"Repaired {len(updates)} entries"))
+        if failed:
+            print(format_error(f"{failed} entries still failed; check the provider and run jrnl repair again"))
+            return 1
+        return 0
+
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except ValueError as e:  # Unknown provider
+        print(format_error(str(e)))
+        return 1
+
+
+def commit_exists(repo_path: str, commit_hash: str) -> bool:
+    """True if repo_path is a repository that still has the commit."""
+    if not repo_path or not os.path.isdir(repo_path):
+        return False
+    try:
+        result = subprocess.run(
+            ['git', '-C', repo_path, 'cat-file', '-e', f'{commit_hash}^{{commit}}'],
+            capture_output=True,
+            timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+def current_repo() -> Optional[str]:
+    """Top level of the git repository containing the working directory, if any."""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def recompress(log: Log, provider, fallback_repos: Sequence[str] = ()) -> Optional[str]:
+    """
+    New summary for a degraded log, or None if it could not be produced.
+
+    The commit is re-read from its repository when that is still reachable,
+    trying fallback_repos for logs with no or a stale repo path; otherwise
+    the original commit message kept in the placeholder is compressed on
+    its own.
+    """
+    try:
+        for repo_path in dict.fromkeys([log.repo] + list(fallback_repos)):
+            if commit_exists(repo_path, log.label):
+                summary = summarize_commit(repo_path, log.label, provider)
+                if summary is not None:
+                    return summary[1]
+                break
+        return provider.compress_commit(
+            commit_message=strip_degraded_prefix(log.log_message),
+            commit_diff=''
+        )
+    except Exception as e:
+        log_error(f"Error repairing log {log.label}: {type(e).__name__}: {e}")
+        return None
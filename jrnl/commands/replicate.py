@@ -0,0 +1,151 @@
+"""jrnl sync-push / sync-pull commands - Exchange journal changes through a shared directory."""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from ..config import Config
+from ..database.changelog import (
+    ensure_baseline,
+    get_local_device,
+    get_exported_seq,
+    set_exported_seq,
+    get_changes_after,
+    get_peer_state,
+    apply_peer_changes
+)
+from ..utils.formatting import format_success, format_error, format_info
+
+# Each device appends only to its own file, so file-sync tools (Dropbox,
+# Syncthing, NFS) never see two writers on one file
+CHANGE_FILE_SUFFIX = '.changes.jsonl'
+
+# Changes written or applied per transaction
+CHANGE_BATCH_SIZE = 5000
+
+
+def handle(args):
+    """Handle the 'sync-push' and 'sync-pull' commands."""
+    directory = args.dir or Config.get('replication_dir')
+    if not directory:
+        print(format_error(
+            f"No shared directory configured. Use: jrnl {args.command} --dir ~/Dropbox/jrnl, "
+            "or set \"replication_dir\" in ~/.jrnl/config.json"
+        ))
+        return 1
+    directory = Path(os.path.expanduser(directory))
+
+    try:
+        if args.command == 'sync-push':
+            return handle_push(directory)
+        return handle_pull(directory)
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except OSError as e:
+        print(format_error(f"Cannot access {directory}: {e}"))
+        return 1
+
+
+def change_file(directory: Path, device: str) -> Path:
+    return directory / f"{device}{CHANGE_FILE_SUFFIX}"
+
+
+def handle_push(directory: Path) -> int:
+    """Append local changes not yet exported to this device's change file."""
+    directory.mkdir(parents=True, exist_ok=True)
+    ensure_baseline()
+
+    exported = get_exported_seq()
+    written = 0
+    while True:
+        changes = get_changes_after(exported, CHANGE_BATCH_SIZE)
+        if not changes:
+            break
+
+        # Normally all one device; a copied database may carry older ids
+        by_device = {}
+        for change in changes:
+            by_device.setdefault(change['device'], []).append(change)
+        for device, device_changes in by_device.items():
+            with open(change_file(directory, device), 'a', encoding='utf-8') as f:
+                for change in device_changes:
+                    f.write(json.dumps(change, ensure_ascii=False, separators=(',', ':')))
+                    f.write('\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+        # A crash before this point re-appends the batch; peers skip seqs they have
+        exported = changes[-1]['seq']
+        set_exported_seq(exported)
+        written += len(changes)
+
+    if written:
+        print(format_success(f"Pushed {written} changes to {directory}"))
+    else:
+        print(format_info("No local changes to push"))
+    return 0
+
+
+def read_new_changes(path: Path, offset: int, limit: int = CHANGE_BATCH_SIZE):
+    """
+    Read up to limit complete lines from a change file, starting at offset.
+
+    Returns (changes, new offset). A trailing line without a newline is a
+    write still in progress (or still being synced) and is left for later.
+    """
+    changes = []
+    with open(path, 'rb') as f:
+        if offset > os.fstat(f.fileno()).st_size:
+            offset = 0  # File was replaced; seqs already applied are skipped
+        f.seek(offset)
+        while len(changes) < limit:
+            line = f.readline()
+            if not line.endswith(b'\n'):
+                break
+            offset += len(line)
+            line = line.strip()
+            if line:
+                changes.append(json.loads(line))
+    return changes, offset
+
+
+def handle_pull(directory: Path) -> int:
+    """Apply other devices' changes that arrived since the last pull."""
+    if not directory.is_dir():
+        print(format_error(f"Shared directory not found: {directory}"))
+        return 1
+
+    local = get_local_device()
+    applied = skipped = peers = 0
+    for path in sorted(directory.glob(f"*{CHANGE_FILE_SUFFIX}")):
+        device = path.name[:-len(CHANGE_FILE_SUFFIX)]
+        if device == local:
+            continue
+
+        _, offset = get_peer_state(device)
+        peer_applied = 0
+        while True:
+            try:
+                changes, new_offset = read_new_changes(path, offset)
+            except ValueError as e:
+                print(format_error(f"Corrupt change file {path.name}: {e}"))
+                return 1
+            if new_offset == offset:
+                break
+            counts = apply_peer_changes(device, changes, new_offset)
+            applied += counts[0]
+            skipped += counts[1]
+            peer_applied += counts[0]
+            offset = new_offset
+        if peer_applied:
+            peers += 1
+
+    if applied or skipped:
+        message = f"Applied {applied} changes from {peers} devices"
+        if skipped:
+            message += f" ({skipped} superseded by newer edits)"
+        print(format_success(message))
+    else:
+        print(format_info("Already up to date"))
+    return 0
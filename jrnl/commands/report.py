@@ -0,0 +1,81 @@
+"""jrnl report command - Weekly and monthly summaries from materialized rollups."""
+
+import sqlite3
+from ..database.operations import (
+    get_rollup,
+    upsert_rollup,
+    get_logs_between,
+    get_dailies_between
+)
+from ..database.models import Rollup
+from ..config import Config
+from ..llm_providers import get_provider
+from ..utils.date_utils import get_utc_now, get_period_bounds
+from ..utils.formatting import format_report_header
+from ..utils import tracing
+
+
+def handle(args):
+    """Handle the 'report' command."""
+    period_type = 'month' if args.month else 'week'
+    provider = None
+
+    try:
+        for ago in range(args.ago + args.last - 1, args.ago - 1, -1):
+            start, end = get_period_bounds(period_type, ago=ago)
+            rollup = get_rollup(period_type, start)
+
+            if rollup is None or rollup.stale or args.rebuild:
+                if provider is None:
+                    provider = get_provider(Config.load())
+                rollup = build_rollup(provider, period_type, start, end)
+
+            print(format_report_header(period_type, start, end))
+            if rollup is None:
+                print("No logs or dailies in this period.")
+            else:
+                print(rollup.summary)
+                print(f"\n({rollup.source_count} entries, generated {rollup.timestamp[:16].replace('T', ' ')} UTC)")
+            print("\n" + "="*60 + "\n")
+
+        return 0
+
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+        return 1
+    except RuntimeError as e:  # From LLM providers
+        print(f"Error: {e}")
+        return 1
+    except ValueError as e:  # Unknown LLM provider / missing API key
+        print(f"Error: {e}")
+        return 1
+
+
+def build_rollup(provider, period_type: str, start: str, end: str):
+    """Summarize one period from its dailies and logs and store the rollup."""
+    dailies = get_dailies_between(start, end, include_archived=True)
+    logs = get_logs_between(start, end, include_archived=True)
+    if not dailies and not logs:
+        return None
+
+    print(f"Generating {period_type} summary for {start} from "
+          f"{len(dailies)} dailies and {len(logs)} log entries...")
+
+    with tracing.span('generate_report', cat='provider', provider=type(provider).__name__, period=start):
+        summary = provider.generate_report(
+            period=period_type,
+            period_label=f"the {period_type} of {start}",
+            dailies=[daily.to_dict() for daily in dailies],
+            logs=[log.to_dict() for log in logs]
+        )
+
+    rollup = Rollup(
+        period_type=period_type,
+        period_start=start,
+        period_end=end,
+        summary=summary,
+        source_count=len(dailies) + len(logs),
+        timestamp=get_utc_now()
+    )
+    upsert_rollup(rollup)
+    return rollup
@@ -0,0 +1,82 @@
+"""jrnl search command - Find log entries by keyword or meaning."""
+
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from ..config import Config
+from ..api import Journal
+from ..database.operations import get_logs_by_ids
+from ..embeddings import get_embedder
+from ..embeddings.index import EmbeddingIndex
+from ..utils.formatting import format_log_entry, format_error
+
+
+def handle(args):
+    """Handle the 'search' command."""
+    if not args.query and not args.related:
+        print(format_error("Give a search query or --related LABEL"))
+        return 1
+
+    try:
+        if args.semantic or args.related:
+            return handle_semantic(args)
+
+        with Journal() as journal:
+            logs = journal.search(args.query, limit=args.limit, include_archived=args.archived)
+
+        if not logs:
+            print(f"No logs matching: {args.query}")
+            return 0
+
+        now = datetime.now(timezone.utc)
+        print(f"\nFound {len(logs)} matching log entries:\n")
+        for log in logs:
+            print(format_log_entry(log, now))
+
+        return 0
+
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except RuntimeError as e:  # From embeddings
+        print(format_error(str(e)))
+        return 1
+    except ValueError as e:  # Unknown embeddings provider
+        print(format_error(str(e)))
+        return 1
+
+
+def handle_semantic(args):
+    """Search by embedding similarity, embedding any new logs first."""
+    index = EmbeddingIndex(get_embedder(Config.load()))
+
+    embedded = index.update(
+        progress=lambda n: print(f"\rEmbedding new logs... {n}", end='', file=sys.stderr)
+    )
+    if embedded:
+        print(file=sys.stderr)
+
+    if args.related:
+        matches = index.related(args.related, k=args.limit)
+        if matches is None:
+            print(format_error(f"Log entry not found: {args.related}"))
+            return 1
+        title = f"related to {args.related}"
+    else:
+        matches = index.search(args.query, k=args.limit)
+        title = f"for: {args.query}"
+
+    scores = dict(matches)
+    logs = [log for log in get_logs_by_ids([log_id for log_id, _ in matches])
+            if not (args.related and log.label == args.related)][:args.limit]
+
+    if not logs:
+        print("No indexed logs found")
+        return 0
+
+    now = datetime.now(timezone.utc)
+    print(f"\nTop {len(logs)} log entries {title}\n")
+    for log in logs:
+        print(f"{scores[log.id]:.2f} {format_log_entry(log, now)}")
+
+    return 0
@@ -0,0 +1,37 @@
+"""jrnl serve command - Run the team journal server."""
+
+import os
+from pathlib import Path
+from ..config import Config
+from ..llm_providers import get_provider
+from ..server import TeamServer
+from ..utils.formatting import format_error, format_info
+
+
+def handle(args):
+    """Handle the 'serve' command."""
+    settings = Config.get('team_server', {})
+    db_path = Path(os.path.expanduser(args.db or settings.get('db_path') or '~/.jrnl/team.db'))
+    token = args.token or os.environ.get('JRNL_SERVER_TOKEN') or settings.get('token') or None
+
+    try:
+        server = TeamServer(
+            db_path,
+            host=args.host,
+            port=args.port,
+            token=token,
+            provider_factory=lambda: get_provider(Config.load()),
+            refresh_interval=None if args.no_precompute else args.refresh_interval
+        )
+    except OSError as e:
+        print(format_error(f"Cannot start server on {args.host}:{args.port}: {e}"))
+        return 1
+
+    print(format_info(f"Team journal server listening on {server.url} (database: {db_path})"))
+    if not token:
+        print(format_info("No token set - any client that can reach this address can push"))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,71 @@
+"""jrnl stats command - Aggregate view of your work."""
+
+import os
+import sqlite3
+from datetime import date
+from ..analytics import compute_stats
+from ..utils.formatting import format_sparkline, format_error
+
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+# Days shown in the activity sparkline
+SPARKLINE_DAYS = 60
+
+
+def handle(args):
+    """Handle the 'stats' command."""
+    try:
+        stats = compute_stats(days=args.days)
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except RuntimeError as e:  # numpy missing
+        print(format_error(str(e)))
+        return 1
+
+    window = f"last {args.days} days" if args.days else "all time"
+    print(f"\nJournal stats ({window})\n")
+
+    if not stats.total:
+        print("No logs found")
+        return 0
+
+    git_share = stats.git_hook / stats.total * 100
+    print(f"  Entries:        {stats.total}  (git-hook {stats.git_hook}, manual {stats.manual}, {git_share:.0f}% git)")
+    print(f"  Active days:    {stats.active_days}  (longest streak {stats.longest_streak}, "
+          f"current streak {stats.current_streak})")
+
+    recent = stats.per_day[-SPARKLINE_DAYS:]
+    first_shown = date.fromordinal(date(1970, 1, 1).toordinal() + stats.first_day
+                                   + len(stats.per_day) - len(recent))
+    print(f"\n  Per day since {first_shown.isoformat()} (peak {max(recent)}):")
+    print(f"    {format_sparkline(recent)}")
+
+    print(f"\n  By hour (peak {max(stats.per_hour)}):")
+    print(f"    {format_sparkline(stats.per_hour)}")
+    print("    0     6     12    18   23")
+
+    print("\n  By weekday:")
+    print(f"    {format_sparkline(stats.per_weekday)}  " +
+          '  '.join(f"{day} {count}" for day, count in zip(WEEKDAYS, stats.per_weekday)))
+
+    if stats.per_repo:
+        print("\n  By repository (git-hook entries):")
+        width = max(len(_repo_name(repo)) for repo, _ in stats.per_repo[:args.top])
+        peak = stats.per_repo[0][1]
+        for repo, count in stats.per_repo[:args.top]:
+            bar = '█' * max(1, round(count / peak * 30))
+            print(f"    {_repo_name(repo):{width}}  {count:6}  {bar}")
+
+    print("\n  Standups:")
+    print(f"    Dailies: {stats.dailies}, days with commits: {stats.commit_days}, "
+          f"not yet covered by a daily: {stats.unreported_commit_days}")
+    if stats.median_report_lag is not None:
+        print(f"    Days from commit to next daily: median {stats.median_report_lag:g}, max {stats.max_report_lag}")
+
+    print()
+    return 0
+
+
+def _repo_name(repo: str) -> str:
+    return os.path.basename(repo.rstrip('/')) if repo else '(unknown)'
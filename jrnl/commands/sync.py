@@ -0,0 +1,160 @@
+"""jrnl sync command - Log new commits from every repository under the workspace roots."""
+
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from ..config import Config
+from ..database.operations import get_repo_watermarks, set_repo_watermark, get_existing_labels
+from ..git_integration.workspace import discover_repos, list_commits_since, default_author_emails
+from ..llm_providers import get_provider
+from ..utils.date_utils import get_utc_now
+from ..utils.formatting import format_success, format_error, format_info
+from .new import process_commit, log_error
+
+# Re-list this much history before each watermark, to catch commits pulled
+# from other machines whose committer dates are slightly older. Anything
+# already logged is skipped by label.
+SYNC_OVERLAP_SECONDS = 3 * 86400
+
+
+def handle(args):
+    """Handle the 'sync' command."""
+    try:
+        config = Config.load()
+        roots = args.roots or config.get('workspace_roots', [])
+        if not roots:
+            print(format_error(
+                "No workspace roots configured. Use: jrnl sync ~/code, "
+                "or add \"workspace_roots\" to ~/.jrnl/config.json"
+            ))
+            return 1
+
+        started = time.monotonic()
+        repos = find_repos(roots, config)
+        if not repos:
+            print(format_info("No git repositories found"))
+            return 0
+
+        initial_days = args.days if args.days is not None else config.get('sync_initial_days', 7)
+        jobs = args.jobs or config.get('sync_max_concurrency', 8)
+        new_commits, watermarks = scan_repos(repos, config, initial_days, jobs)
+
+        print(format_info(
+            f"Scanned {len(repos)} repositories in {time.monotonic() - started:.1f}s: "
+            f"{len(new_commits)} new commits"
+        ))
+
+        if args.dry_run:
+            for commit in new_commits:
+                print(f"  {commit.hash[:8]}  {commit.repo}")
+            return 0
+
+        failed_repos = ingest(new_commits, config)
+
+        # Only advance watermarks for repositories that fully synced
+        scanned_at = get_utc_now()
+        for repo, (old, new) in watermarks.items():
+            if repo not in failed_repos and new != old:
+                set_repo_watermark(repo, new, scanned_at)
+
+        logged = sum(1 for commit in new_commits if commit.repo not in failed_repos)
+        if new_commits:
+            print(format_success(f"Logged {logged} commits"))
+        if failed_repos:
+            print(format_error(
+                f"Some commits could not be processed in {len(failed_repos)} repositories; "
+                "see ~/.jrnl/logs/errors.log"
+            ))
+            return 1
+        return 0
+
+    except sqlite3.Error as e:
+        print(format_error(f"Database error: {e}"))
+        return 1
+    except RuntimeError as e:
+        print(format_error(str(e)))
+        return 1
+
+
+def find_repos(roots, config):
+    """Discover repositories under all roots, minus excluded ones."""
+    max_depth = config.get('sync_max_depth', 4)
+    excluded = {os.path.realpath(p) for p in config.get('excluded_repos', [])}
+    excluded.add(os.path.realpath(os.path.expanduser('~/.jrnl')))
+
+    repos = set()
+    for root in roots:
+        for repo in discover_repos(root, max_depth):
+            if os.path.realpath(repo) not in excluded:
+                repos.add(repo)
+    return sorted(repos)
+
+
+def scan_repos(repos, config, initial_days, jobs):
+    """
+    List unlogged commits in all repositories concurrently.
+
+    Returns the new commits, oldest first, and a mapping of repo to
+    (stored watermark, proposed watermark).
+    """
+    authors = config.get('sync_authors') or default_author_emails()
+    stored = get_repo_watermarks()
+    initial = int(time.time()) - initial_days * 86400
+
+    def since_for(repo):
+        if repo in stored:
+            return stored[repo] - SYNC_OVERLAP_SECONDS
+        return initial
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(pool.map(lambda repo: list_commits_since(repo, since_for(repo), authors), repos))
+
+    listed = []
+    watermarks = {}
+    for repo, commits in zip(repos, results):
+        if commits is None:
+            log_error(f"Sync: could not list commits in {repo}")
+            continue
+        old = stored.get(repo)
+        new = max([old if old is not None else initial] + [c.commit_time for c in commits])
+        watermarks[repo] = (old, new)
+        listed.extend(commits)
+
+    # Drop commits already logged by a hook or an earlier sync
+    existing = get_existing_labels([c.hash[:8] for c in listed]) if listed else set()
+    seen = set()
+    new_commits = []
+    for commit in sorted(listed, key=lambda c: c.commit_time):
+        label = commit.hash[:8]
+        if label in existing or label in seen:
+            continue
+        seen.add(label)
+        new_commits.append(commit)
+    return new_commits, watermarks
+
+
+def ingest(commits, config):
+    """Compress and store commits. Returns the repos with failed commits."""
+    failed = set()
+    if not commits:
+        return failed
+
+    provider = get_provider(config)
+    max_workers = config.get('hook_max_concurrency', 2)
+
+    def process(commit):
+        timestamp = datetime.fromtimestamp(commit.commit_time, timezone.utc).isoformat()
+        return process_commit(commit.repo, commit.hash, provider, timestamp=timestamp)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [pool.submit(process, commit) for commit in commits]
+        for commit, future in zip(commits, futures):
+            try:
+                if not future.result():
+                    failed.add(commit.repo)
+            except Exception as e:
+                log_error(f"Error processing commit {commit.hash} in {commit.repo}: {type(e).__name__}: {e}")
+                failed.add(commit.repo)
+    return failed
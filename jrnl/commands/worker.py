@@ -0,0 +1,142 @@
+"""jrnl worker command - Drain commits queued by the git hooks."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from ..config import Config
+from ..database.models import is_degraded
+from ..database.operations import delete_log, get_log_by_label, relabel_log, update_log_messages
+from ..git_integration import commit_queue
+from ..llm_providers import get_provider
+from .new import process_commit, log_error
+
+
+def handle(args):
+    """Handle the 'worker' command. Always returns 0 so hooks never fail."""
+    fd = commit_queue.acquire_worker_lock()
+    if fd is None:
+        return 0  # Another worker is already draining the queue
+
+    try:
+        max_workers = args.max_concurrency or Config.get('hook_max_concurrency', 2)
+        while True:
+            try:
+                drain(max_workers)
+            finally:
+                commit_queue.release_worker_lock(fd)
+
+            # A hook may have queued work after the last batch but before the
+            # lock was released; take the lock back if so, otherwise we're done
+            if not commit_queue.has_pending():
+                return 0
+            fd = commit_queue.acquire_worker_lock()
+            if fd is None:
+                return 0
+
+    except Exception as e:
+        log_error(f"Queue worker failed: {type(e).__name__}: {e}")
+        return 0
+
+
+def drain(max_workers: int):
+    """Process queued batches until the queue stays empty."""
+    provider = None
+    while True:
+        time.sleep(commit_queue.SETTLE_SECONDS)
+        batch = commit_queue.take_batch()
+        if batch is None:
+            return
+
+        # Rewritten commits keep their existing summaries
+        handled = set()
+        new_commits = []
+        for repo_path, new_hash, old_hashes in group_rewrites(batch.rewrites):
+            if carry_over_logs(old_hashes, new_hash):
+                handled.add(new_hash)
+            else:
+                new_commits.append((repo_path, new_hash))
+
+        for repo_path, commit_hash in batch.commits:
+            new_commits.append((repo_path, commit_hash))
+
+        # post-rewrite lists picked commits but not ones made at an edit/exec stop
+        rewritten = {new_hash for _, _, new_hash in batch.rewrites}
+        deferred = []
+        for repo_path, commit_hash in batch.rebase_commits:
+            if commit_hash in rewritten:
+                continue
+            if commit_queue.rebase_in_progress(repo_path):
+                deferred.append((repo_path, commit_hash))
+            elif commit_queue.on_current_branch(repo_path, commit_hash):
+                new_commits.append((repo_path, commit_hash))
+            # Otherwise the rebase was aborted and the commit abandoned
+        commit_queue.defer(deferred)
+
+        # Skip anything already logged (e.g. relabeled above or a repeated hook)
+        todo = []
+        seen = set()
+        for repo_path, commit_hash in new_commits:
+            if commit_hash in handled or commit_hash in seen:
+                continue
+            seen.add(commit_hash)
+            if get_log_by_label(commit_hash[:8]) is None:
+                todo.append((repo_path, commit_hash))
+
+        if not todo:
+            continue
+
+        if provider is None:
+            provider = get_provider(Config.load())
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = [
+                pool.submit(process_commit, repo_path, commit_hash, provider)
+                for repo_path, commit_hash in todo
+            ]
+            for (repo_path, commit_hash), future in zip(todo, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log_error(f"Error processing commit {commit_hash} in {repo_path}: {type(e).__name__}: {e}")
+
+
+def group_rewrites(rewrites: List[Tuple[str, str, str]]) -> List[Tuple[str, str, List[str]]]:
+    """(repo_path, new_hash, old hashes) per new commit, in first-seen order."""
+    groups: Dict[str, Tuple[str, str, List[str]]] = {}
+    for repo_path, old_hash, new_hash in rewrites:
+        groups.setdefault(new_hash, (repo_path, new_hash, []))[2].append(old_hash)
+    return list(groups.values())
+
+
+def carry_over_logs(old_hashes: List[str], new_hash: str) -> bool:
+    """
+    Move the summaries of rewritten commits to the commit that replaced them.
+
+    A squash maps several old commits to one new one. The new commit keeps
+    a single log: the first summary is relabeled and the others are merged
+    into its message and deleted. Returns False if no old commit had a log.
+    """
+    new_label = new_hash[:8]
+    target = get_log_by_label(new_label)
+    old_logs = []
+    for old_hash in old_hashes:
+        log = get_log_by_label(old_hash[:8])
+        if log is not None and log.label != new_label and all(log.label != seen.label for seen in old_logs):
+            old_logs.append(log)
+    if not old_logs:
+        return target is not None
+
+    if target is None:
+        target, old_logs = old_logs[0], old_logs[1:]
+        relabel_log(target.label, new_label)
+    if not old_logs:
+        return True
+
+    messages = [log.log_message for log in [target] + old_logs]
+    kept = [message for message in messages if not is_degraded(message)] or messages[:1]
+    merged = '; '.join(dict.fromkeys(kept))
+    if merged != target.log_message:
+        update_log_messages([(target.id, merged)])
+    for log in old_logs:
+        delete_log(log.label)
+    return True
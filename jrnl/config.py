@@ -1,8 +1,13 @@
 """Configuration management for JRNL."""
 
+import copy
 import json
+import os
+import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+from .utils import tracing
 
 class Config:
     """Configuration manager."""
@@ -14,6 +19,7 @@ class Config:
         'llm_providers': {
             'anthropic': {
                 'api_key': '',
+                'url': 'https://api.anthropic.com',
                 'model': 'claude-sonnet-4-5-20250929',
                 'max_tokens_commit': 200,
                 'max_tokens_daily': 500
@@ -23,37 +29,117 @@ class Config:
                 'model': 'llama3.1:8b',
                 'max_tokens_commit': 200,
                 'max_tokens_daily': 500
+            },
+            'openai_compat': {
+                'url': 'http://localhost:8080',
+                'api_key': '',
+                'model': '',
+                'max_tokens_commit': 200,
+                'max_tokens_daily': 500,
+                'stream': False,
+                'max_concurrency': 8,
+                'timeout': 60
+            },
+            'replay': {
+                'mode': 'replay',
+                'cassette': '~/.jrnl/cassettes/default.jsonl',
+                'upstream': 'anthropic',
+                'latency': 'original'
             }
         },
+        'embeddings': {
+            'provider': 'ollama',
+            'url': 'http://localhost:11434',
+            'model': 'nomic-embed-text'
+        },
+        'team_server': {
+            'url': '',
+            'user': '',
+            'token': '',
+            'db_path': '~/.jrnl/team.db'
+        },
         'git_hooks_enabled': True,
+        'hook_max_concurrency': 2,
+        'commit_classifier': True,
+        'git_notes_read': True,
+        'git_notes_write': False,
+        'collapse_similar_logs': True,
+        'similar_logs_threshold': 0.6,
+        'large_commit_map_reduce': True,
+        'large_commit_max_chunks': 8,
         'excluded_repos': [],
+        'replication_dir': '',
+        'workspace_roots': [],
+        'sync_authors': [],
+        'sync_initial_days': 7,
+        'sync_max_depth': 4,
+        'sync_max_concurrency': 8,
         'standup_time': '10:30',
         'timezone': 'local'
     }
 
+    # Parsed config and the (inode, mtime_ns, size) of the file it came from
+    _cache: Optional[Dict[str, Any]] = None
+    _cache_key: Optional[Tuple[int, int, int]] = None
+
+    @classmethod
+    def _file_key(cls) -> Optional[Tuple[int, int, int]]:
+        """Identity of the config file on disk, or None if it doesn't exist."""
+        try:
+            st = cls.CONFIG_PATH.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _cached(cls) -> Dict[str, Any]:
+        """
+        Return the parsed config, re-reading the file only if it changed.
+
+        The result is shared - callers must not mutate it.
+        """
+        key = cls._file_key()
+        if key is None:
+            return cls.DEFAULT_CONFIG
+        if cls._cache is not None and key == cls._cache_key:
+            return cls._cache
+
+        with tracing.span('config.load', cat='config'):
+            config = cls._read()
+        cls._cache, cls._cache_key = config, key
+        return config
+
     @classmethod
     def load(cls) -> Dict[str, Any]:
         """Load configuration from file."""
-        if not cls.CONFIG_PATH.exists():
-            return cls.DEFAULT_CONFIG.copy()
+        return copy.deepcopy(cls._cached())
 
+    @classmethod
+    def _read(cls) -> Dict[str, Any]:
+        """Read and merge the config file with defaults."""
         try:
             with open(cls.CONFIG_PATH, 'r') as f:
                 config = json.load(f)
 
             # Merge with defaults (for new fields)
-            merged = cls._deep_merge(cls.DEFAULT_CONFIG.copy(), config)
+            merged = cls._deep_merge(copy.deepcopy(cls.DEFAULT_CONFIG), config)
             return merged
 
         except FileNotFoundError:
             # Config doesn't exist - return defaults (this is normal for first run)
-            return cls.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(cls.DEFAULT_CONFIG)
         except json.JSONDecodeError as e:
+            if not sys.stdin.isatty():
+                # Background hooks and pipes can't answer a prompt
+                raise RuntimeError(
+                    f"Invalid config file at {cls.CONFIG_PATH} (line {e.lineno}: {e.msg}). "
+                    "Run jrnl config in a terminal to repair it."
+                )
             print(f"Config file is corrupted at line {e.lineno}: {e.msg}")
             response = input("Recreate config with defaults? (y/N): ")
             if response.lower() == 'y':
-                cls.save(cls.DEFAULT_CONFIG.copy())
-                return cls.DEFAULT_CONFIG.copy()
+                cls.save(copy.deepcopy(cls.DEFAULT_CONFIG))
+                return copy.deepcopy(cls.DEFAULT_CONFIG)
             raise RuntimeError(f"Invalid config file at {cls.CONFIG_PATH}")
         except PermissionError as e:
             raise RuntimeError(f"Cannot read config file (permission denied): {cls.CONFIG_PATH}")
@@ -62,14 +148,36 @@ class Config:
 
     @classmethod
     def save(cls, config: Dict[str, Any]):
-        """Save configuration to file."""
+        """
+        Save configuration to file.
+
+        Writes a temp file in the same directory, fsyncs it and renames it over
+        the config, so concurrent readers see either the old or the new file
+        and never a truncated one.
+        """
+        tmp_path = None
         try:
             cls.CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(cls.CONFIG_PATH, 'w') as f:
+
+            # mkstemp creates the file as 600, so API keys are never world-readable
+            fd, tmp_path = tempfile.mkstemp(prefix='.config.', suffix='.tmp', dir=cls.CONFIG_PATH.parent)
+            with os.fdopen(fd, 'w') as f:
                 json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(tmp_path, cls.CONFIG_PATH)
+            tmp_path = None
 
-            # Set permissions to 600 for security (API keys)
-            cls.CONFIG_PATH.chmod(0o600)
+            # Persist the rename itself
+            dir_fd = os.open(cls.CONFIG_PATH.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+            cls._cache = cls._deep_merge(copy.deepcopy(cls.DEFAULT_CONFIG), copy.deepcopy(config))
+            cls._cache_key = cls._file_key()
 
         except PermissionError:
             raise RuntimeError(f"Cannot write config file (permission denied): {cls.CONFIG_PATH}")
@@ -77,12 +185,17 @@ class Config:
             raise RuntimeError(f"Failed to write config file: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to save config: {type(e).__name__}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     @classmethod
     def get(cls, key: str, default=None):
         """Get a configuration value."""
-        config = cls.load()
-        return config.get(key, default)
+        return copy.deepcopy(cls._cached().get(key, default))
 
     @classmethod
     def set(cls, key: str, value):
@@ -0,0 +1,191 @@
+"""Per-year archive databases and live database compaction."""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from . import connection
+from . import completion_cache
+
+# SQLite's default SQLITE_MAX_ATTACHED is 10; keep one slot spare
+MAX_ATTACHED_ARCHIVES = 9
+
+# Labels per IN (...) lookup; SQLite before 3.32 allows 999 parameters
+LABEL_LOOKUP_BATCH = 500
+
+LOG_COLUMNS = 'id, timestamp, log_message, type, label, created_at, repo'
+DAILY_COLUMNS = 'id, timestamp, daily_date, daily_message, created_at'
+
+# Archives whose schema is up to date in this process
+_migrated = set()
+_migrated_lock = threading.Lock()
+_warned_skipped = False
+
+
+def archive_dir() -> Path:
+    """Directory holding the archive databases (next to the live database)."""
+    return connection.DB_PATH.parent / 'archive'
+
+
+def archive_path(year: str) -> Path:
+    """Path of the archive database for a given year."""
+    return archive_dir() / f'jrnl-{year}.db'
+
+
+def list_archives() -> List[Path]:
+    """Existing archive databases, newest year first."""
+    directory = archive_dir()
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob('jrnl-*.db'), reverse=True)
+
+
+def archives_between(since: Optional[str] = None, until: Optional[str] = None) -> List[Path]:
+    """Archive databases for years overlapping [since, until), newest year first."""
+    return [
+        path for path in list_archives()
+        if (since is None or path.stem[5:] >= since[:4]) and (until is None or path.stem[5:] <= until[:4])
+    ]
+
+
+def archived_labels(labels: Iterable[str]) -> Set[str]:
+    """The given labels that exist in any archive database, however old."""
+    archives = list_archives()
+    if not archives:
+        return set()
+    wanted = list(set(labels))
+    found: Set[str] = set()
+    for path in archives:
+        _ensure_schema(path)
+        conn = sqlite3.connect(path)
+        try:
+            for start in range(0, len(wanted), LABEL_LOOKUP_BATCH):
+                part = wanted[start:start + LABEL_LOOKUP_BATCH]
+                found.update(row[0] for row in conn.execute(
+                    'SELECT label FROM logs WHERE label IN ({})'.format(', '.join('?' * len(part))), part
+                ))
+        finally:
+            conn.close()
+    return found
+
+
+def attach_archives(conn: sqlite3.Connection, since: Optional[str] = None, until: Optional[str] = None):
+    """
+    Attach archive databases and expose TEMP views spanning live and archived rows.
+
+    Creates `all_logs` and `all_dailies`, which are plain UNION ALLs so the
+    planner pushes WHERE clauses down into each attached database's indexes.
+    Only archives for years overlapping [since, until) are attached, at most
+    MAX_ATTACHED_ARCHIVES of them (the newest); a warning names any left out.
+    """
+    global _warned_skipped
+    archives = archives_between(since, until)
+    if len(archives) > MAX_ATTACHED_ARCHIVES:
+        skipped = archives[MAX_ATTACHED_ARCHIVES:]
+        archives = archives[:MAX_ATTACHED_ARCHIVES]
+        if not _warned_skipped:
+            _warned_skipped = True
+            print(f"Warning: archived years {skipped[-1].stem[5:]}-{skipped[0].stem[5:]} were not searched "
+                  f"(at most {MAX_ATTACHED_ARCHIVES} archive years at once); narrow the date range to include them",
+                  file=sys.stderr)
+
+    log_sources = ['SELECT {} FROM main.logs'.format(LOG_COLUMNS)]
+    daily_sources = ['SELECT {} FROM main.dailies'.format(DAILY_COLUMNS)]
+
+    for index, path in enumerate(archives):
+        # Archives written by older versions lack newer columns
+        _ensure_schema(path)
+        alias = f'archive_{index}'
+        conn.execute('ATTACH DATABASE ? AS {}'.format(alias), (str(path),))
+        log_sources.append('SELECT {} FROM {}.logs'.format(LOG_COLUMNS, alias))
+        daily_sources.append('SELECT {} FROM {}.dailies'.format(DAILY_COLUMNS, alias))
+
+    conn.execute('CREATE TEMP VIEW all_logs AS ' + ' UNION ALL '.join(log_sources))
+    conn.execute('CREATE TEMP VIEW all_dailies AS ' + ' UNION ALL '.join(daily_sources))
+
+
+def _ensure_schema(path: Path):
+    """Create or upgrade an archive database to the live schema, once per process."""
+    with _migrated_lock:
+        if path in _migrated:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+        try:
+            connection.apply_schema(conn)
+            conn.commit()
+        finally:
+            conn.close()
+        _migrated.add(path)
+
+
+def archive_before(cutoff: str) -> Dict[str, int]:
+    """
+    Move logs and dailies older than cutoff into per-year archive databases.
+
+    Each year is copied and deleted in a single transaction, so a row is
+    always in exactly one database. Returns counts of moved rows.
+    """
+    moved = {'logs': 0, 'dailies': 0}
+
+    with connection.get_connection() as conn:
+        years = [row[0] for row in conn.execute(
+            '''SELECT substr(timestamp, 1, 4) FROM logs WHERE timestamp < ?
+               UNION
+               SELECT substr(timestamp, 1, 4) FROM dailies WHERE timestamp < ?''',
+            (cutoff, cutoff)
+        )]
+
+    for year in years:
+        path = archive_path(year)
+        _ensure_schema(path)
+
+        with connection.get_connection() as conn:
+            conn.execute('ATTACH DATABASE ? AS archive', (str(path),))
+            params = (cutoff, year)
+
+            # Moving rows does not change what a rollup covers, so keep
+            # fresh rollups fresh despite the delete triggers
+            fresh = [row[0] for row in conn.execute('SELECT id FROM main.rollups WHERE stale = 0')]
+            where = 'timestamp < ? AND substr(timestamp, 1, 4) = ?'
+
+            cursor = conn.execute(
+                'INSERT OR REPLACE INTO archive.logs ({0}) SELECT {0} FROM main.logs WHERE {1}'.format(LOG_COLUMNS, where),
+                params
+            )
+            moved['logs'] += cursor.rowcount
+            # Semantic search covers live logs only
+            conn.execute(
+                'DELETE FROM main.log_embeddings WHERE log_id IN (SELECT id FROM main.logs WHERE {})'.format(where),
+                params
+            )
+            conn.execute('DELETE FROM main.logs WHERE ' + where, params)
+
+            cursor = conn.execute(
+                'INSERT OR REPLACE INTO archive.dailies ({0}) SELECT {0} FROM main.dailies WHERE {1}'.format(DAILY_COLUMNS, where),
+                params
+            )
+            moved['dailies'] += cursor.rowcount
+            conn.execute('DELETE FROM main.dailies WHERE ' + where, params)
+
+            conn.executemany('UPDATE main.rollups SET stale = 0 WHERE id = ?', ((i,) for i in fresh))
+
+            conn.commit()
+            conn.execute('DETACH DATABASE archive')
+
+    if moved['logs'] or moved['dailies']:
+        with connection.get_connection() as conn:
+            completion_cache.refresh(conn)
+    return moved
+
+
+def compact_database():
+    """Reclaim free pages and refresh planner statistics on the live database."""
+    conn = sqlite3.connect(connection.DB_PATH, isolation_level=None)
+    try:
+        conn.execute('VACUUM')
+        conn.execute('ANALYZE')
+        conn.execute('PRAGMA optimize')
+    finally:
+        conn.close()
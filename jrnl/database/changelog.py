@@ -0,0 +1,260 @@
+"""
+Append-only change log for syncing one journal across several machines.
+
+Every insert and delete made through operations.py is appended to
+`change_log` in the same transaction, numbered by a per-database sequence
+and tagged with this device's id. Devices exchange the entries they have
+not seen yet, and apply them with a last-writer-wins rule on
+(timestamp, device, seq). That order is total, so every device converges
+on the same rows whatever order the changes arrive in. Deletes are kept as
+tombstones, so an older insert arriving late cannot bring a row back.
+"""
+
+import json
+import socket
+import sqlite3
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.date_utils import get_utc_now
+from ..utils.minhash import signature
+from .models import is_degraded
+from .connection import get_connection
+from . import completion_cache
+
+LOG_PAYLOAD_FIELDS = ('timestamp', 'log_message', 'type', 'label', 'repo')
+DAILY_PAYLOAD_FIELDS = ('timestamp', 'daily_date', 'daily_message')
+
+
+def _meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute('SELECT value FROM sync_meta WHERE key = ?', (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str):
+    conn.execute('INSERT OR REPLACE INTO sync_meta (key, value) VALUES (?, ?)', (key, value))
+
+
+def local_device(conn: sqlite3.Connection) -> str:
+    """
+    This database's device id, created on first use.
+
+    The id is bound to the hostname, so a jrnl.db copied to another machine
+    gets a fresh id there instead of impersonating the original device.
+    """
+    device = _meta(conn, 'device_id')
+    host = socket.gethostname()
+    if device is None or _meta(conn, 'device_host') != host:
+        device = uuid.uuid4().hex[:12]
+        _set_meta(conn, 'device_id', device)
+        _set_meta(conn, 'device_host', host)
+    return device
+
+
+def log_payload(row) -> Dict:
+    return {field: row[field] for field in LOG_PAYLOAD_FIELDS}
+
+
+def daily_payload(row) -> Dict:
+    return {field: row[field] for field in DAILY_PAYLOAD_FIELDS}
+
+
+def record_changes(conn: sqlite3.Connection, changes: Iterable[Tuple[str, str, str, Optional[Dict]]]):
+    """
+    Append (kind, op, key, payload) changes made on this device.
+
+    Must be called on the connection that made the change, so the change
+    and its log entry commit or roll back together.
+    """
+    changes = list(changes)
+    if not changes:
+        return
+    device = local_device(conn)
+    timestamp = get_utc_now()
+    first = conn.execute('SELECT COALESCE(MAX(seq), 0) + 1 FROM change_log').fetchone()[0]
+    rows = [
+        (first + offset, device, timestamp, kind, op, key,
+         json.dumps(payload, ensure_ascii=False) if payload is not None else None)
+        for offset, (kind, op, key, payload) in enumerate(changes)
+    ]
+    conn.executemany(
+        '''INSERT INTO change_log (seq, device, timestamp, kind, op, key, payload)
+           VALUES (?, ?, ?, ?, ?, ?, ?)''',
+        rows
+    )
+    conn.executemany(
+        '''INSERT OR REPLACE INTO sync_versions (kind, key, timestamp, device, seq, deleted)
+           VALUES (?, ?, ?, ?, ?, ?)''',
+        [(kind, key, timestamp, device, seq, int(op == 'delete'))
+         for seq, device, timestamp, kind, op, key, _ in rows]
+    )
+
+
+def _set_version(conn, kind, key, timestamp, device, seq, deleted):
+    conn.execute(
+        '''INSERT OR REPLACE INTO sync_versions (kind, key, timestamp, device, seq, deleted)
+           VALUES (?, ?, ?, ?, ?, ?)''',
+        (kind, key, timestamp, device, seq, int(deleted))
+    )
+
+
+def _wins(conn, change: Dict) -> bool:
+    """True if change is newer than the version already applied for its row."""
+    row = conn.execute(
+        'SELECT timestamp, device, seq FROM sync_versions WHERE kind = ? AND key = ?',
+        (change['kind'], change['key'])
+    ).fetchone()
+    if row is None:
+        return True
+    return (change['timestamp'], change['device'], change['seq']) > (row[0], row[1], row[2])
+
+
+def apply_change(conn: sqlite3.Connection, change: Dict) -> bool:
+    """Apply one change from another device. Returns True if it won and was applied."""
+    if not _wins(conn, change):
+        return False
+
+    kind, op, key, payload = change['kind'], change['op'], change['key'], change.get('payload')
+    if kind == 'log':
+        if op == 'delete':
+            conn.execute(
+                'DELETE FROM log_embeddings WHERE log_id IN (SELECT id FROM logs WHERE label = ?)',
+                (key,)
+            )
+            conn.execute('DELETE FROM logs WHERE label = ?', (key,))
+        else:
+            message = payload['log_message']
+            values = (payload['timestamp'], message, payload['type'], payload.get('repo'), signature(message),
+                      int(payload['type'] == 'git-hook' and is_degraded(message)), key)
+            # A changed message needs a new embedding; the old vector would keep matching
+            conn.execute(
+                'DELETE FROM log_embeddings WHERE log_id IN (SELECT id FROM logs WHERE label = ? AND log_message != ?)',
+                (key, message)
+            )
+            cursor = conn.execute(
+                '''UPDATE logs SET timestamp = ?, log_message = ?, type = ?, repo = ?, minhash = ?, degraded = ?
+                   WHERE label = ?''',
+                values
+            )
+            if cursor.rowcount == 0:
+                conn.execute(
+                    '''INSERT INTO logs (timestamp, log_message, type, repo, minhash, degraded, label)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                    values
+                )
+    elif kind == 'daily':
+        if op == 'delete':
+            conn.execute('DELETE FROM dailies WHERE daily_date = ?', (key,))
+        else:
+            conn.execute(
+                '''INSERT OR REPLACE INTO dailies (timestamp, daily_date, daily_message)
+                   VALUES (?, ?, ?)''',
+                (payload['timestamp'], key, payload['daily_message'])
+            )
+    else:
+        return False
+
+    _set_version(conn, kind, key, change['timestamp'], change['device'], change['seq'], op == 'delete')
+    return True
+
+
+def ensure_baseline():
+    """
+    Record the rows that predate the change log, once.
+
+    Journals written before syncing existed have no change entries, so a
+    new peer would never receive them. The first push records an upsert for
+    every live log and daily that has no version yet.
+    """
+    with get_connection() as conn:
+        if _meta(conn, 'baseline_recorded'):
+            return
+        logs = conn.execute(
+            '''SELECT * FROM logs WHERE label NOT IN
+               (SELECT key FROM sync_versions WHERE kind = 'log')
+               ORDER BY id'''
+        ).fetchall()
+        dailies = conn.execute(
+            '''SELECT * FROM dailies WHERE daily_date NOT IN
+               (SELECT key FROM sync_versions WHERE kind = 'daily')
+               ORDER BY id'''
+        ).fetchall()
+        record_changes(conn, [('log', 'upsert', row['label'], log_payload(row)) for row in logs])
+        record_changes(conn, [('daily', 'upsert', row['daily_date'], daily_payload(row)) for row in dailies])
+        _set_meta(conn, 'baseline_recorded', get_utc_now())
+
+
+def get_local_device() -> str:
+    with get_connection() as conn:
+        return local_device(conn)
+
+
+def get_exported_seq() -> int:
+    """Highest local change sequence already written to the shared directory."""
+    with get_connection() as conn:
+        value = _meta(conn, 'exported_seq')
+        return int(value) if value else 0
+
+
+def set_exported_seq(seq: int):
+    with get_connection() as conn:
+        _set_meta(conn, 'exported_seq', str(seq))
+
+
+def get_changes_after(seq: int, limit: int = 5000) -> List[Dict]:
+    """Local changes with a sequence number above seq, in order."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            '''SELECT seq, device, timestamp, kind, op, key, payload FROM change_log
+               WHERE seq > ?
+               ORDER BY seq
+               LIMIT ?''',
+            (seq, limit)
+        ).fetchall()
+    return [{
+        'device': row['device'],
+        'seq': row['seq'],
+        'timestamp': row['timestamp'],
+        'kind': row['kind'],
+        'op': row['op'],
+        'key': row['key'],
+        'payload': json.loads(row['payload']) if row['payload'] is not None else None
+    } for row in rows]
+
+
+def get_peer_state(device: str) -> Tuple[int, int]:
+    """(last applied seq, byte offset into the peer's file) for a peer device."""
+    with get_connection() as conn:
+        row = conn.execute(
+            'SELECT last_seq, file_offset FROM sync_peers WHERE device = ?', (device,)
+        ).fetchone()
+        return (row['last_seq'], row['file_offset']) if row else (0, 0)
+
+
+def apply_peer_changes(device: str, changes: List[Dict], file_offset: int) -> Tuple[int, int]:
+    """
+    Apply a peer's changes and advance its watermark in one transaction.
+
+    Changes at or below the peer's last applied seq are skipped. Returns
+    (changes applied, changes that lost to a newer version).
+    """
+    applied = skipped = 0
+    with get_connection() as conn:
+        row = conn.execute('SELECT last_seq FROM sync_peers WHERE device = ?', (device,)).fetchone()
+        last_seq = row['last_seq'] if row else 0
+        for change in changes:
+            if change['seq'] <= last_seq:
+                continue
+            if apply_change(conn, change):
+                applied += 1
+            else:
+                skipped += 1
+            last_seq = change['seq']
+        conn.execute(
+            '''INSERT OR REPLACE INTO sync_peers (device, last_seq, file_offset, pulled_at)
+               VALUES (?, ?, ?, ?)''',
+            (device, last_seq, file_offset, get_utc_now())
+        )
+        if applied:
+            completion_cache.refresh(conn)
+    return applied, skipped
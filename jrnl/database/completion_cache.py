@@ -0,0 +1,64 @@
+"""
+Recent labels and daily dates for shell completion.
+
+The scripts printed by `jrnl completion` read this file directly instead
+of running jrnl, so pressing TAB costs a file read rather than a Python
+start. Write paths in operations.py call refresh() after changing logs or
+dailies. One entry per line:
+
+    label <label>
+    daily <YYYY-MM-DD>
+"""
+
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+CACHE_NAME = 'completion_cache'
+
+# Newest entries kept; older ones can still be typed out in full
+MAX_LABELS = 200
+MAX_DAILIES = 60
+
+
+def cache_path(conn: sqlite3.Connection) -> Optional[Path]:
+    """The cache file beside the connection's database, or None for in-memory databases."""
+    db_file = conn.execute('PRAGMA database_list').fetchone()[2]
+    return Path(db_file).parent / CACHE_NAME if db_file else None
+
+
+def refresh(conn: sqlite3.Connection):
+    """
+    Rewrite the cache from conn's current view of the database.
+
+    Best effort: the file is replaced atomically, and failing to write it
+    never fails the operation that triggered the refresh.
+    """
+    path = cache_path(conn)
+    if path is None:
+        return
+
+    labels = conn.execute(
+        'SELECT label FROM logs ORDER BY timestamp DESC, id DESC LIMIT ?', (MAX_LABELS,)
+    ).fetchall()
+    dates = conn.execute(
+        'SELECT daily_date FROM dailies ORDER BY daily_date DESC LIMIT ?', (MAX_DAILIES,)
+    ).fetchall()
+    # Completion splits on whitespace, so labels containing any are left out
+    lines = [f"label {row[0]}\n" for row in labels if row[0] and not any(c.isspace() for c in row[0])]
+    lines.extend(f"daily {row[0]}\n" for row in dates)
+
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{CACHE_NAME}-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
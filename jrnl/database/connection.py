@@ -1,50 +1,151 @@
 """Database connection and initialization."""
 
 import sqlite3
+import sys
+import threading
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
+from typing import Optional
+from ..utils import tracing
 
 DB_PATH = Path.home() / '.jrnl' / 'jrnl.db'
 
+# Set once the schema has been brought up to date in this process
+_schema_ready = False
+
+# Connection shared by get_connection() calls in this thread, see use_session()
+_session = threading.local()
+
 
 def init_database():
     """Initialize the database with schema."""
-    from .sql_statements import CREATE_LOGS_TABLE, CREATE_DAILIES_TABLE
+    global _schema_ready
 
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    try:
+        apply_schema(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    _schema_ready = True
+
 
-    # Create tables
+def apply_schema(conn: sqlite3.Connection):
+    """Create missing tables and indexes. Every statement is idempotent."""
+    from .sql_statements import (
+        CREATE_LOGS_TABLE,
+        CREATE_DAILIES_TABLE,
+        CREATE_EMBEDDINGS_TABLE,
+        CREATE_ROLLUPS_TABLE,
+        CREATE_REPO_WATERMARKS_TABLE,
+        CREATE_PUSH_STATE_TABLE,
+        CREATE_CHANGE_LOG_TABLES,
+        COLUMN_MIGRATIONS,
+        CREATE_MIGRATED_INDEXES
+    )
+
+    cursor = conn.cursor()
     cursor.executescript(CREATE_LOGS_TABLE)
     cursor.executescript(CREATE_DAILIES_TABLE)
+    cursor.executescript(CREATE_EMBEDDINGS_TABLE)
+    cursor.executescript(CREATE_ROLLUPS_TABLE)
+    cursor.executescript(CREATE_REPO_WATERMARKS_TABLE)
+    cursor.executescript(CREATE_PUSH_STATE_TABLE)
+    cursor.executescript(CREATE_CHANGE_LOG_TABLES)
 
-    conn.commit()
-    conn.close()
+    for table, column, declaration, *backfill in COLUMN_MIGRATIONS:
+        existing = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+        if column not in existing:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {declaration}')
+            for statement in backfill:
+                cursor.execute(statement)
 
+    cursor.executescript(CREATE_MIGRATED_INDEXES)
 
-@contextmanager
-def get_connection():
-    """Get database connection context manager."""
-    # Auto-initialize database on first access
-    if not DB_PATH.exists():
-        init_database()
 
-    conn = sqlite3.connect(DB_PATH)
+def open_session(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Open a long-lived connection for use_session(), creating the schema if needed.
+
+    db_path defaults to the live journal; the caller owns the connection and
+    must close it.
+    """
+    if db_path is None:
+        if not _schema_ready:
+            init_database()
+        db_path = DB_PATH
+    else:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(db_path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    if db_path != DB_PATH:
+        apply_schema(conn)
+        conn.commit()
+    return conn
+
+
+@contextmanager
+def use_session(conn: sqlite3.Connection):
+    """
+    Route get_connection() in this thread to conn until the block exits.
+
+    Saves a connect (and the schema check) per operation when many run back
+    to back. Each get_connection() block still commits or rolls back on its
+    own. Requests that need archives attached get a fresh connection to the
+    same database file.
+    """
+    previous = getattr(_session, 'conn', None), getattr(_session, 'path', None)
+    _session.conn = conn
+    _session.path = conn.execute('PRAGMA database_list').fetchone()[2]
     try:
         yield conn
-        conn.commit()
-    except sqlite3.Error as e:
-        conn.rollback()
-        import sys
-        print(f"Database error: {e}", file=sys.stderr)
-        raise
-    except Exception as e:
-        conn.rollback()
-        import sys
-        print(f"Unexpected database operation error: {type(e).__name__}: {e}", file=sys.stderr)
-        raise
     finally:
-        conn.close()
+        _session.conn, _session.path = previous
+
+
+@contextmanager
+def get_connection(include_archived: bool = False, since: Optional[str] = None,
+                   until: Optional[str] = None):
+    """
+    Get database connection context manager.
+
+    With include_archived, archive databases are attached and the
+    `all_logs` / `all_dailies` views span live and archived rows. since
+    and until limit the archives to years the query can touch.
+    """
+    shared = None if include_archived else getattr(_session, 'conn', None)
+
+    # Auto-initialize (or upgrade) the database on first access in this process
+    if shared is None and not _schema_ready:
+        init_database()
+
+    # Connect before the span opens so a failed connect leaves no span unclosed
+    conn = shared or sqlite3.connect(getattr(_session, 'path', None) or DB_PATH)
+    conn.row_factory = sqlite3.Row
+
+    if tracing.is_enabled():
+        # Name the span after the operations.py function that asked for the connection
+        trace_span = tracing.span(sys._getframe(2).f_code.co_name, cat='db')
+    else:
+        trace_span = tracing.span('sqlite')
+    with ExitStack() as stack:
+        if shared is None:
+            stack.callback(conn.close)
+        stack.enter_context(trace_span)
+        try:
+            if include_archived:
+                from .archive import attach_archives
+                attach_archives(conn, since, until)
+            yield conn
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Database error: {e}", file=sys.stderr)
+            raise
+        except Exception as e:
+            conn.rollback()
+            print(f"Unexpected database operation error: {type(e).__name__}: {e}", file=sys.stderr)
+            raise
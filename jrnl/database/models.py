@@ -3,6 +3,33 @@
 from dataclasses import dataclass
 from typing import Optional
 
+# Placeholders that LLM providers' compress_commit() return when the call
+# fails; logs starting with one of these are stored with degraded = 1
+DEGRADED_PREFIXES = (
+    '[LLM Error] ',
+    '[Anthropic Error] ',
+    '[Ollama Not Running] ',
+    '[Ollama Timeout] ',
+    '[Ollama Error] ',
+    '[OpenAI-Compat Not Running] ',
+    '[OpenAI-Compat Timeout] ',
+    '[OpenAI-Compat Error] ',
+    '[Replay Miss] ',
+)
+
+
+def is_degraded(log_message: str) -> bool:
+    """True if a log message is a provider failure placeholder."""
+    return log_message.startswith(DEGRADED_PREFIXES)
+
+
+def strip_degraded_prefix(log_message: str) -> str:
+    """The original commit message behind a placeholder."""
+    for prefix in DEGRADED_PREFIXES:
+        if log_message.startswith(prefix):
+            return log_message[len(prefix):]
+    return log_message
+
 
 @dataclass
 class Log:
@@ -12,6 +39,39 @@ class Log:
     type: str  # 'manual' or 'git-hook'
     label: str
     id: Optional[int] = None
+    repo: Optional[str] = None  # Repository path for git-hook entries
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        return {
+            'id': self.id,
+            'timestamp': self.timestamp,
+            'log_message': self.log_message,
+            'type': self.type,
+            'label': self.label,
+            'repo': self.repo
+        }
+
+
+class LogRow:
+    """Compact read-only log row used when streaming large result sets."""
+
+    __slots__ = ('id', 'timestamp', 'log_message', 'type', 'label', 'repo')
+
+    def __init__(self, id: int, timestamp: str, log_message: str, type: str, label: str,
+                 repo: Optional[str] = None):
+        self.id = id
+        self.timestamp = timestamp
+        self.log_message = log_message
+        self.type = type
+        self.label = label
+        self.repo = repo  # Only filled in by queries that select it
+
+    @classmethod
+    def from_row(cls, row) -> 'LogRow':
+        """Build from a sqlite3.Row."""
+        repo = row['repo'] if 'repo' in row.keys() else None
+        return cls(row['id'], row['timestamp'], row['log_message'], row['type'], row['label'], repo)
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -23,6 +83,9 @@ class Log:
             'label': self.label
         }
 
+    def __repr__(self):
+        return f"LogRow(id={self.id!r}, label={self.label!r}, timestamp={self.timestamp!r})"
+
 
 @dataclass
 class Daily:
@@ -40,3 +103,29 @@ class Daily:
             'daily_date': self.daily_date,
             'daily_message': self.daily_message
         }
+
+
+@dataclass
+class Rollup:
+    """Materialized weekly or monthly summary."""
+    period_type: str  # 'week' or 'month'
+    period_start: str  # YYYY-MM-DD, inclusive
+    period_end: str  # YYYY-MM-DD, exclusive
+    summary: str
+    source_count: int
+    timestamp: str
+    stale: bool = False
+    id: Optional[int] = None
+
+    def to_dict(self):
+        """Convert to dictionary."""
+        return {
+            'id': self.id,
+            'period_type': self.period_type,
+            'period_start': self.period_start,
+            'period_end': self.period_end,
+            'summary': self.summary,
+            'source_count': self.source_count,
+            'timestamp': self.timestamp,
+            'stale': self.stale
+        }
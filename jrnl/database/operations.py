@@ -1,8 +1,17 @@
 """Database CRUD operations."""
 
-from typing import List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from .connection import get_connection
-from .models import Log, Daily
+from .models import Log, LogRow, Daily, Rollup, is_degraded
+from .changelog import record_changes, log_payload, daily_payload
+from . import completion_cache
+from ..utils.minhash import signature
+
+
+def _degraded(log_type: str, log_message: str) -> int:
+    """Value of the degraded column; only commit summaries can be placeholders."""
+    return int(log_type == 'git-hook' and is_degraded(log_message))
 
 
 def insert_log(log: Log) -> int:
@@ -10,51 +19,232 @@ def insert_log(log: Log) -> int:
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            '''INSERT INTO logs (timestamp, log_message, type, label)
-               VALUES (?, ?, ?, ?)''',
-            (log.timestamp, log.log_message, log.type, log.label)
+            '''INSERT INTO logs (timestamp, log_message, type, label, repo, minhash, degraded)
+               VALUES (?, ?, ?, ?, ?, ?, ?)''',
+            (log.timestamp, log.log_message, log.type, log.label, log.repo,
+             signature(log.log_message), _degraded(log.type, log.log_message))
         )
+        record_changes(conn, [('log', 'upsert', log.label, log_payload(log.to_dict()))])
+        completion_cache.refresh(conn)
         return cursor.lastrowid
 
 
-def get_logs_since(timestamp: str) -> List[Log]:
-    """Get all logs since a given timestamp."""
+# Rows fetched per keyset page when streaming logs
+PAGE_SIZE = 500
+
+# Rows written per transaction by bulk inserts
+BULK_BATCH_SIZE = 50000
+
+
+def insert_logs_bulk(logs: Iterable[Log], batch_size: int = BULK_BATCH_SIZE) -> int:
+    """
+    Insert many log entries, skipping any whose label already exists in
+    the live table or an archive.
+
+    Consumes the iterable incrementally and writes each batch with a single
+    executemany() inside one transaction on one connection.
+    Returns the number of rows actually inserted.
+    """
+    from .sql_statements import INSERT_LOG_IF_NEW_LABEL
+    from .archive import archived_labels
+
+    inserted = 0
+    iterator = iter(logs)
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            '''SELECT * FROM logs
-               WHERE timestamp >= ?
-               ORDER BY timestamp ASC''',
-            (timestamp,)
-        )
-        rows = cursor.fetchall()
-        return [Log(
-            id=row['id'],
-            timestamp=row['timestamp'],
-            log_message=row['log_message'],
-            type=row['type'],
-            label=row['label']
-        ) for row in rows]
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                break
+            # INSERT_LOG_IF_NEW_LABEL only sees live rows; re-importing must not revive archived logs
+            archived = archived_labels(log.label for log in chunk)
+            batch = [
+                (log.timestamp, log.log_message, log.type, log.label, log.repo, signature(log.log_message),
+                 _degraded(log.type, log.log_message), log.label)
+                for log in chunk if log.label not in archived
+            ]
+            if not batch:
+                continue
+            before = cursor.execute('SELECT COALESCE(MAX(id), 0) FROM logs').fetchone()[0]
+            cursor.executemany(INSERT_LOG_IF_NEW_LABEL, batch)
+            inserted += cursor.rowcount
+            new_rows = cursor.execute('SELECT * FROM logs WHERE id > ? ORDER BY id', (before,))
+            record_changes(conn, [('log', 'upsert', row['label'], log_payload(row)) for row in new_rows])
+            conn.commit()
+        if inserted:
+            completion_cache.refresh(conn)
+    return inserted
 
 
-def get_all_logs(limit: int = 50) -> List[Log]:
-    """Get recent logs."""
-    with get_connection() as conn:
+def _logs_source(include_archived: bool) -> str:
+    """Table or view to read logs from."""
+    return 'all_logs' if include_archived else 'logs'
+
+
+def iter_logs_since(timestamp: str, page_size: int = PAGE_SIZE,
+                    include_archived: bool = False) -> Iterator[LogRow]:
+    """
+    Stream logs since a given timestamp, oldest first.
+
+    Uses keyset pagination on (timestamp, id) so each page is an index seek
+    and no connection or read lock is held while the caller consumes rows.
+    """
+    source = _logs_source(include_archived)
+    last_ts, last_id = timestamp, None
+    while True:
+        with get_connection(include_archived, since=timestamp) as conn:
+            cursor = conn.cursor()
+            if last_id is None:
+                cursor.execute(
+                    f'''SELECT id, timestamp, log_message, type, label, repo FROM {source}
+                       WHERE timestamp >= ?
+                       ORDER BY timestamp ASC, id ASC
+                       LIMIT ?''',
+                    (last_ts, page_size)
+                )
+            else:
+                cursor.execute(
+                    f'''SELECT id, timestamp, log_message, type, label, repo FROM {source}
+                       WHERE (timestamp, id) > (?, ?)
+                       ORDER BY timestamp ASC, id ASC
+                       LIMIT ?''',
+                    (last_ts, last_id, page_size)
+                )
+            rows = cursor.fetchall()
+
+        for row in rows:
+            yield LogRow.from_row(row)
+
+        if len(rows) < page_size:
+            return
+        last_ts, last_id = rows[-1]['timestamp'], rows[-1]['id']
+
+
+def iter_recent_logs(limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                     include_archived: bool = False) -> Iterator[LogRow]:
+    """Stream the most recent logs, newest first. A limit of None streams everything."""
+    source = _logs_source(include_archived)
+    last_ts, last_id = None, None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        with get_connection(include_archived) as conn:
+            cursor = conn.cursor()
+            if last_id is None:
+                cursor.execute(
+                    f'''SELECT id, timestamp, log_message, type, label FROM {source}
+                       ORDER BY timestamp DESC, id DESC
+                       LIMIT ?''',
+                    (size,)
+                )
+            else:
+                cursor.execute(
+                    f'''SELECT id, timestamp, log_message, type, label FROM {source}
+                       WHERE (timestamp, id) < (?, ?)
+                       ORDER BY timestamp DESC, id DESC
+                       LIMIT ?''',
+                    (last_ts, last_id, size)
+                )
+            rows = cursor.fetchall()
+
+        for row in rows:
+            yield LogRow.from_row(row)
+
+        if len(rows) < size:
+            return
+        if remaining is not None:
+            remaining -= len(rows)
+        last_ts, last_id = rows[-1]['timestamp'], rows[-1]['id']
+
+
+def iter_all_logs(page_size: int = PAGE_SIZE, include_archived: bool = False) -> Iterator[LogRow]:
+    """Stream every log, oldest first."""
+    return iter_logs_since('', page_size=page_size, include_archived=include_archived)
+
+
+def iter_logs(since: Optional[str] = None, until: Optional[str] = None,
+              log_type: Optional[str] = None, repo: Optional[str] = None,
+              newest_first: bool = True, limit: Optional[int] = None,
+              page_size: int = PAGE_SIZE, include_archived: bool = False) -> Iterator[LogRow]:
+    """
+    Stream logs matching optional filters, with since <= timestamp < until.
+
+    Pages with the same (timestamp, id) keyset as iter_logs_since and
+    iter_recent_logs, in either direction.
+    """
+    source = _logs_source(include_archived)
+    filters, params = [], []
+    for clause, value in (('timestamp >= ?', since), ('timestamp < ?', until),
+                          ('type = ?', log_type), ('repo = ?', repo)):
+        if value is not None:
+            filters.append(clause)
+            params.append(value)
+    order, after = ('DESC', '<') if newest_first else ('ASC', '>')
+
+    last = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        where = list(filters)
+        page_params = list(params)
+        if last is not None:
+            where.append(f'(timestamp, id) {after} (?, ?)')
+            page_params.extend(last)
+        with get_connection(include_archived, since=since, until=until) as conn:
+            rows = conn.execute(
+                f'''SELECT id, timestamp, log_message, type, label FROM {source}
+                    {'WHERE ' + ' AND '.join(where) if where else ''}
+                    ORDER BY timestamp {order}, id {order}
+                    LIMIT ?''',
+                page_params + [size]
+            ).fetchall()
+
+        for row in rows:
+            yield LogRow.from_row(row)
+
+        if len(rows) < size:
+            return
+        if remaining is not None:
+            remaining -= len(rows)
+        last = (rows[-1]['timestamp'], rows[-1]['id'])
+
+
+def count_logs(since: Optional[str] = None, include_archived: bool = False) -> int:
+    """Count logs, optionally only those since a given timestamp."""
+    source = _logs_source(include_archived)
+    with get_connection(include_archived, since=since) as conn:
+        cursor = conn.cursor()
+        if since is None:
+            cursor.execute(f'SELECT COUNT(*) FROM {source}')
+        else:
+            cursor.execute(f'SELECT COUNT(*) FROM {source} WHERE timestamp >= ?', (since,))
+        return cursor.fetchone()[0]
+
+
+def search_logs(term: str, limit: int = 50, include_archived: bool = False) -> List[LogRow]:
+    """Find logs whose message or label contains term, newest first."""
+    source = _logs_source(include_archived)
+    pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    with get_connection(include_archived) as conn:
         cursor = conn.cursor()
         cursor.execute(
-            '''SELECT * FROM logs
-               ORDER BY timestamp DESC
+            f'''SELECT id, timestamp, log_message, type, label FROM {source}
+               WHERE log_message LIKE ? ESCAPE '\\' OR label LIKE ? ESCAPE '\\'
+               ORDER BY timestamp DESC, id DESC
                LIMIT ?''',
-            (limit,)
+            (pattern, pattern, limit)
         )
-        rows = cursor.fetchall()
-        return [Log(
-            id=row['id'],
-            timestamp=row['timestamp'],
-            log_message=row['log_message'],
-            type=row['type'],
-            label=row['label']
-        ) for row in rows]
+        return [LogRow.from_row(row) for row in cursor.fetchall()]
+
+
+def get_logs_since(timestamp: str) -> List[LogRow]:
+    """Get all logs since a given timestamp."""
+    return list(iter_logs_since(timestamp))
+
+
+def get_all_logs(limit: int = 50) -> List[LogRow]:
+    """Get recent logs."""
+    return list(iter_recent_logs(limit=limit))
 
 
 def get_log_by_label(label: str) -> Optional[Log]:
@@ -73,17 +263,41 @@ def get_log_by_label(label: str) -> Optional[Log]:
                 timestamp=row['timestamp'],
                 log_message=row['log_message'],
                 type=row['type'],
-                label=row['label']
+                label=row['label'],
+                repo=row['repo']
             )
         return None
 
 
+def relabel_log(old_label: str, new_label: str) -> int:
+    """Point log entries at a rewritten commit. Returns number of rows updated."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('UPDATE logs SET label = ? WHERE label = ?', (new_label, old_label))
+        updated = cursor.rowcount
+        if updated:
+            rows = cursor.execute('SELECT * FROM logs WHERE label = ?', (new_label,)).fetchall()
+            record_changes(conn, [('log', 'delete', old_label, None)] + [
+                ('log', 'upsert', new_label, log_payload(row)) for row in rows
+            ])
+            completion_cache.refresh(conn)
+        return updated
+
+
 def delete_log(label: str) -> bool:
     """Delete a log entry by its label/hash. Returns True if deleted, False if not found."""
     with get_connection() as conn:
         cursor = conn.cursor()
+        cursor.execute(
+            'DELETE FROM log_embeddings WHERE log_id IN (SELECT id FROM logs WHERE label = ?)',
+            (label,)
+        )
         cursor.execute('DELETE FROM logs WHERE label = ?', (label,))
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
+        if deleted:
+            record_changes(conn, [('log', 'delete', label, None)])
+            completion_cache.refresh(conn)
+        return deleted
 
 
 def insert_daily(daily: Daily) -> int:
@@ -95,6 +309,8 @@ def insert_daily(daily: Daily) -> int:
                VALUES (?, ?, ?)''',
             (daily.timestamp, daily.daily_date, daily.daily_message)
         )
+        record_changes(conn, [('daily', 'upsert', daily.daily_date, daily_payload(daily.to_dict()))])
+        completion_cache.refresh(conn)
         return cursor.lastrowid
 
 
@@ -165,4 +381,448 @@ def delete_daily(date: str) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('DELETE FROM dailies WHERE daily_date = ?', (date,))
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
+        if deleted:
+            record_changes(conn, [('daily', 'delete', date, None)])
+            completion_cache.refresh(conn)
+        return deleted
+
+
+def get_logs_without_embedding(model: str, limit: int) -> List[LogRow]:
+    """Get up to limit logs that have no embedding for model, oldest id first."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT l.id, l.timestamp, l.log_message, l.type, l.label FROM logs l
+               LEFT JOIN log_embeddings e ON e.log_id = l.id AND e.model = ?
+               WHERE e.log_id IS NULL
+               ORDER BY l.id ASC
+               LIMIT ?''',
+            (model, limit)
+        )
+        return [LogRow.from_row(row) for row in cursor.fetchall()]
+
+
+def insert_embeddings(model: str, rows: Iterable[tuple]) -> int:
+    """Store (log_id, dim, vector_bytes) embeddings for model in one transaction."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            '''INSERT OR REPLACE INTO log_embeddings (log_id, model, dim, vector)
+               VALUES (?, ?, ?, ?)''',
+            ((log_id, model, dim, vector) for log_id, dim, vector in rows)
+        )
+        return cursor.rowcount
+
+
+def get_embedding_stats(model: str) -> tuple:
+    """
+    Return (count, max_log_id, generation, removals) of stored embeddings for live logs.
+
+    generation changes with every insert, replace or delete of a vector;
+    removals only with replaces and deletes.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT COUNT(*), COALESCE(MAX(e.log_id), 0) FROM log_embeddings e
+               JOIN logs l ON l.id = e.log_id
+               WHERE e.model = ?''',
+            (model,)
+        )
+        count, max_id = cursor.fetchone()
+        row = cursor.execute(
+            'SELECT generation, removals FROM embedding_generations WHERE model = ?', (model,)
+        ).fetchone()
+        generation, removals = tuple(row) if row else (0, 0)
+        return count, max_id, generation, removals
+
+
+def iter_embeddings(model: str, after_id: int = 0, page_size: int = PAGE_SIZE) -> Iterator[tuple]:
+    """Stream (log_id, vector_bytes) for live logs with log_id > after_id, by id."""
+    last_id = after_id
+    while True:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                '''SELECT e.log_id, e.vector FROM log_embeddings e
+                   JOIN logs l ON l.id = e.log_id
+                   WHERE e.model = ? AND e.log_id > ?
+                   ORDER BY e.log_id ASC
+                   LIMIT ?''',
+                (model, last_id, page_size)
+            )
+            rows = cursor.fetchall()
+
+        for row in rows:
+            yield row['log_id'], row['vector']
+
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['log_id']
+
+
+def get_embedding_for_label(model: str, label: str) -> Optional[bytes]:
+    """Get the stored embedding of the log with the given label."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT e.vector FROM log_embeddings e
+               JOIN logs l ON l.id = e.log_id
+               WHERE l.label = ? AND e.model = ?
+               ORDER BY l.id DESC
+               LIMIT 1''',
+            (label, model)
+        )
+        row = cursor.fetchone()
+        return row['vector'] if row else None
+
+
+def get_logs_by_ids(ids: List[int]) -> List[LogRow]:
+    """Get logs by id, returned in the order of ids."""
+    if not ids:
+        return []
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        placeholders = ','.join('?' * len(ids))
+        cursor.execute(
+            f'''SELECT id, timestamp, log_message, type, label FROM logs
+                WHERE id IN ({placeholders})''',
+            ids
+        )
+        by_id = {row['id']: LogRow.from_row(row) for row in cursor.fetchall()}
+    return [by_id[log_id] for log_id in ids if log_id in by_id]
+
+
+def get_logs_between(start: str, end: str, include_archived: bool = False) -> List[LogRow]:
+    """Get logs with start <= timestamp < end, oldest first."""
+    source = _logs_source(include_archived)
+    with get_connection(include_archived, since=start, until=end) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f'''SELECT id, timestamp, log_message, type, label FROM {source}
+                WHERE timestamp >= ? AND timestamp < ?
+                ORDER BY timestamp ASC, id ASC''',
+            (start, end)
+        )
+        return [LogRow.from_row(row) for row in cursor.fetchall()]
+
+
+def get_dailies_between(start_date: str, end_date: str, include_archived: bool = False) -> List[Daily]:
+    """Get dailies with start_date <= daily_date < end_date, oldest first."""
+    source = 'all_dailies' if include_archived else 'dailies'
+    with get_connection(include_archived, since=start_date, until=end_date) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f'''SELECT * FROM {source}
+                WHERE daily_date >= ? AND daily_date < ?
+                ORDER BY daily_date ASC''',
+            (start_date, end_date)
+        )
+        return [Daily(
+            id=row['id'],
+            timestamp=row['timestamp'],
+            daily_date=row['daily_date'],
+            daily_message=row['daily_message']
+        ) for row in cursor.fetchall()]
+
+
+def get_rollup(period_type: str, period_start: str) -> Optional[Rollup]:
+    """Get the rollup for a period."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT * FROM rollups
+               WHERE period_type = ? AND period_start = ?''',
+            (period_type, period_start)
+        )
+        row = cursor.fetchone()
+        if row:
+            return Rollup(
+                id=row['id'],
+                period_type=row['period_type'],
+                period_start=row['period_start'],
+                period_end=row['period_end'],
+                summary=row['summary'],
+                source_count=row['source_count'],
+                timestamp=row['timestamp'],
+                stale=bool(row['stale'])
+            )
+        return None
+
+
+def upsert_rollup(rollup: Rollup) -> int:
+    """Insert or replace the rollup for a period, marking it fresh."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''INSERT OR REPLACE INTO rollups
+               (period_type, period_start, period_end, summary, source_count, stale, timestamp)
+               VALUES (?, ?, ?, ?, ?, 0, ?)''',
+            (rollup.period_type, rollup.period_start, rollup.period_end,
+             rollup.summary, rollup.source_count, rollup.timestamp)
+        )
+        return cursor.lastrowid
+
+
+def get_hourly_log_counts(since: Optional[str] = None, utc_offset: int = 0) -> List[tuple]:
+    """
+    Count logs per local hour since a timestamp.
+
+    Returns (hour_index, total, git_hook) rows where hour_index is hours since
+    the Unix epoch shifted by utc_offset seconds. Aggregation happens in SQL,
+    so the result has at most one row per active hour. Rows whose timestamp
+    SQLite cannot parse are left out.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT (CAST(strftime('%s', timestamp) AS INTEGER) + ?) / 3600 AS hour_index,
+                      COUNT(*), SUM(type = 'git-hook')
+               FROM logs
+               WHERE timestamp >= ?
+                 AND strftime('%s', timestamp) IS NOT NULL
+               GROUP BY hour_index
+               ORDER BY hour_index''',
+            (utc_offset, since or '')
+        )
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+def get_log_counts_by_repo(since: Optional[str] = None) -> List[tuple]:
+    """Return (repo, count) for git-hook logs since a timestamp, most active first."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT COALESCE(repo, ''), COUNT(*) AS n FROM logs
+               WHERE type = 'git-hook' AND timestamp >= ?
+               GROUP BY repo
+               ORDER BY n DESC''',
+            (since or '',)
+        )
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+def get_daily_day_numbers(since_date: Optional[str] = None) -> List[int]:
+    """Return daily dates as days since the Unix epoch, ascending."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT CAST(julianday(daily_date) - 2440587.5 AS INTEGER) FROM dailies
+               WHERE daily_date >= ?
+               ORDER BY daily_date''',
+            (since_date or '',)
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def get_logs_after_id(last_id: int, limit: int = PAGE_SIZE) -> List[LogRow]:
+    """Get logs inserted after a given id, in insertion order."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT id, timestamp, log_message, type, label FROM logs
+               WHERE id > ?
+               ORDER BY id ASC
+               LIMIT ?''',
+            (last_id, limit)
+        )
+        return [LogRow.from_row(row) for row in cursor.fetchall()]
+
+
+def get_repo_watermarks() -> Dict[str, int]:
+    """Get the newest synced commit time (unix seconds) for each repository."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT repo, commit_time FROM repo_watermarks')
+        return {row['repo']: row['commit_time'] for row in cursor.fetchall()}
+
+
+def set_repo_watermark(repo: str, commit_time: int, scanned_at: str):
+    """Record how far a repository has been synced."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''INSERT OR REPLACE INTO repo_watermarks (repo, commit_time, scanned_at)
+               VALUES (?, ?, ?)''',
+            (repo, commit_time, scanned_at)
+        )
+
+
+def get_existing_labels(labels: List[str]) -> Set[str]:
+    """Return which of the given labels already have a log."""
+    found = set()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        # Stay under SQLite's default bound-parameter limit
+        for start in range(0, len(labels), 900):
+            chunk = labels[start:start + 900]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT label FROM logs WHERE label IN ({placeholders})',
+                chunk
+            )
+            found.update(row['label'] for row in cursor.fetchall())
+    return found
+
+
+def get_dailies_after_id(last_id: int, limit: int = PAGE_SIZE) -> List[Daily]:
+    """Get dailies written after a given id, in insertion order."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''SELECT * FROM dailies
+               WHERE id > ?
+               ORDER BY id ASC
+               LIMIT ?''',
+            (last_id, limit)
+        )
+        return [Daily(
+            id=row['id'],
+            timestamp=row['timestamp'],
+            daily_date=row['daily_date'],
+            daily_message=row['daily_message']
+        ) for row in cursor.fetchall()]
+
+
+def get_push_state(server: str) -> tuple:
+    """Get (last pushed log id, last pushed daily id, last pushed log update seq) for a team server."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT last_log_id, last_daily_id, last_update_seq FROM push_state WHERE server = ?',
+            (server,)
+        )
+        row = cursor.fetchone()
+        if row:
+            return row['last_log_id'], row['last_daily_id'], row['last_update_seq']
+        # Updates made before the first push are covered by sending every row
+        return 0, 0, get_last_log_update_seq()
+
+
+def set_push_state(server: str, last_log_id: int, last_daily_id: int, last_update_seq: int, pushed_at: str):
+    """Record how far local logs, dailies and log updates have been pushed to a team server."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''INSERT OR REPLACE INTO push_state (server, last_log_id, last_daily_id, last_update_seq, pushed_at)
+               VALUES (?, ?, ?, ?, ?)''',
+            (server, last_log_id, last_daily_id, last_update_seq, pushed_at)
+        )
+
+
+def get_last_log_update_seq() -> int:
+    """Sequence number of the latest log update."""
+    with get_connection() as conn:
+        return conn.execute('SELECT COALESCE(MAX(seq), 0) FROM log_updates').fetchone()[0]
+
+
+def get_log_updates_after(seq: int, limit: int = PAGE_SIZE) -> Tuple[List[LogRow], int]:
+    """
+    Logs changed after insertion, from update seq onwards.
+
+    Returns (current rows of the updated logs, last update seq read). Logs
+    updated again later or since deleted appear once or not at all.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        updates = cursor.execute(
+            'SELECT seq, label FROM log_updates WHERE seq > ? ORDER BY seq LIMIT ?',
+            (seq, limit)
+        ).fetchall()
+        if not updates:
+            return [], seq
+        labels = list(dict.fromkeys(row['label'] for row in updates))
+        logs = []
+        for start in range(0, len(labels), 900):
+            chunk = labels[start:start + 900]
+            logs.extend(LogRow.from_row(row) for row in cursor.execute(
+                f'''SELECT id, timestamp, log_message, type, label, repo FROM logs
+                    WHERE label IN ({','.join('?' * len(chunk))})
+                    ORDER BY id''',
+                chunk
+            ))
+        return logs, updates[-1]['seq']
+
+
+def get_log_signatures(ids: List[int]) -> Dict[int, bytes]:
+    """
+    Near-duplicate signatures for logs by id.
+
+    Logs written before signatures were stored get theirs computed and
+    saved here, so each is computed only once.
+    """
+    signatures = {}
+    missing = []
+    with get_connection() as conn:
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            placeholders = ','.join('?' * len(chunk))
+            for row in conn.execute(
+                f'SELECT id, log_message, minhash FROM logs WHERE id IN ({placeholders})', chunk
+            ):
+                if row['minhash'] is None:
+                    missing.append((signature(row['log_message']), row['id']))
+                else:
+                    signatures[row['id']] = row['minhash']
+        if missing:
+            conn.executemany('UPDATE logs SET minhash = ? WHERE id = ?', missing)
+            signatures.update((log_id, sig) for sig, log_id in missing)
+    return signatures
+
+
+def count_degraded_logs() -> int:
+    """Number of logs holding a provider failure placeholder."""
+    with get_connection() as conn:
+        return conn.execute('SELECT COUNT(*) FROM logs WHERE degraded = 1').fetchone()[0]
+
+
+def get_degraded_logs(limit: Optional[int] = None) -> List[Log]:
+    """Logs holding a provider failure placeholder, oldest first."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            '''SELECT * FROM logs
+               WHERE degraded = 1
+               ORDER BY id
+               LIMIT ?''',
+            (limit if limit is not None else -1,)
+        ).fetchall()
+    return [
+        Log(id=row['id'], timestamp=row['timestamp'], log_message=row['log_message'],
+            type=row['type'], label=row['label'], repo=row['repo'])
+        for row in rows
+    ]
+
+
+def update_log_messages(updates: Iterable[tuple]) -> int:
+    """
+    Replace the message of logs by id, all in one transaction.
+
+    Takes (log_id, new_message) pairs. Their embeddings are dropped so
+    the next embedding pass indexes the new text. Returns the number of
+    rows updated.
+    """
+    updates = list(updates)
+    if not updates:
+        return 0
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        updated = 0
+        for log_id, message in updates:
+            cursor.execute(
+                '''UPDATE logs SET log_message = ?, minhash = ?,
+                   degraded = CASE WHEN type = 'git-hook' THEN ? ELSE 0 END
+                   WHERE id = ?''',
+                (message, signature(message), int(is_degraded(message)), log_id)
+            )
+            updated += cursor.rowcount
+            cursor.execute('DELETE FROM log_embeddings WHERE log_id = ?', (log_id,))
+        ids = [log_id for log_id, _ in updates]
+        rows = []
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            rows.extend(cursor.execute(
+                f"SELECT * FROM logs WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        record_changes(conn, [('log', 'upsert', row['label'], log_payload(row)) for row in rows])
+    return updated
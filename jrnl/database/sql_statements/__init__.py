@@ -1,5 +1,7 @@
 """SQL statement definitions for JRNL database."""
 
+from ..models import DEGRADED_PREFIXES
+
 CREATE_LOGS_TABLE = """
 CREATE TABLE IF NOT EXISTS logs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -13,6 +15,7 @@ CREATE TABLE IF NOT EXISTS logs (
 
 CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp);
 CREATE INDEX IF NOT EXISTS idx_logs_type ON logs(type);
+CREATE INDEX IF NOT EXISTS idx_logs_label ON logs(label);
 """
 
 CREATE_DAILIES_TABLE = """
@@ -28,3 +31,193 @@ CREATE TABLE IF NOT EXISTS dailies (
 CREATE INDEX IF NOT EXISTS idx_dailies_date ON dailies(daily_date);
 CREATE INDEX IF NOT EXISTS idx_dailies_timestamp ON dailies(timestamp);
 """
+
+CREATE_EMBEDDINGS_TABLE = """
+CREATE TABLE IF NOT EXISTS log_embeddings (
+    log_id INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (log_id, model)
+);
+
+-- Change counters per model, so the search matrix can tell a re-embedded
+-- log apart from an unchanged one (count and max id stay the same).
+-- No OR IGNORE below: the outer INSERT OR REPLACE would override it
+CREATE TABLE IF NOT EXISTS embedding_generations (
+    model TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0,  -- bumped by every insert, replace and delete
+    removals INTEGER NOT NULL DEFAULT 0     -- bumped by every replace and delete
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_embeddings_replace_generation BEFORE INSERT ON log_embeddings
+WHEN EXISTS (SELECT 1 FROM log_embeddings WHERE log_id = NEW.log_id AND model = NEW.model)
+BEGIN
+    INSERT INTO embedding_generations (model)
+    SELECT NEW.model WHERE NOT EXISTS (SELECT 1 FROM embedding_generations WHERE model = NEW.model);
+    UPDATE embedding_generations SET removals = removals + 1 WHERE model = NEW.model;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_embeddings_insert_generation AFTER INSERT ON log_embeddings
+BEGIN
+    INSERT INTO embedding_generations (model)
+    SELECT NEW.model WHERE NOT EXISTS (SELECT 1 FROM embedding_generations WHERE model = NEW.model);
+    UPDATE embedding_generations SET generation = generation + 1 WHERE model = NEW.model;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_embeddings_delete_generation AFTER DELETE ON log_embeddings
+BEGIN
+    INSERT INTO embedding_generations (model)
+    SELECT OLD.model WHERE NOT EXISTS (SELECT 1 FROM embedding_generations WHERE model = OLD.model);
+    UPDATE embedding_generations SET generation = generation + 1, removals = removals + 1
+    WHERE model = OLD.model;
+END;
+"""
+
+CREATE_ROLLUPS_TABLE = """
+CREATE TABLE IF NOT EXISTS rollups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    period_type TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    source_count INTEGER NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT NOT NULL,
+    CHECK (period_type IN ('week', 'month')),
+    UNIQUE(period_type, period_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_rollups_period ON rollups(period_start, period_end);
+
+-- Mark only the rollups whose period contains a changed row as stale.
+-- period_start/period_end are YYYY-MM-DD and compare correctly against
+-- ISO timestamps as strings (end is exclusive).
+CREATE TRIGGER IF NOT EXISTS trg_logs_insert_rollup AFTER INSERT ON logs
+BEGIN
+    UPDATE rollups SET stale = 1
+    WHERE NEW.timestamp >= period_start AND NEW.timestamp < period_end;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_logs_delete_rollup AFTER DELETE ON logs
+BEGIN
+    UPDATE rollups SET stale = 1
+    WHERE OLD.timestamp >= period_start AND OLD.timestamp < period_end;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_logs_update_rollup AFTER UPDATE OF timestamp, log_message, type ON logs
+BEGIN
+    UPDATE rollups SET stale = 1
+    WHERE (OLD.timestamp >= period_start AND OLD.timestamp < period_end)
+       OR (NEW.timestamp >= period_start AND NEW.timestamp < period_end);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_dailies_insert_rollup AFTER INSERT ON dailies
+BEGIN
+    UPDATE rollups SET stale = 1
+    WHERE NEW.daily_date >= period_start AND NEW.daily_date < period_end;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_dailies_delete_rollup AFTER DELETE ON dailies
+BEGIN
+    UPDATE rollups SET stale = 1
+    WHERE OLD.daily_date >= period_start AND OLD.daily_date < period_end;
+END;
+"""
+
+CREATE_REPO_WATERMARKS_TABLE = """
+CREATE TABLE IF NOT EXISTS repo_watermarks (
+    repo TEXT PRIMARY KEY,
+    commit_time INTEGER NOT NULL,
+    scanned_at TEXT NOT NULL
+);
+"""
+
+CREATE_PUSH_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS push_state (
+    server TEXT PRIMARY KEY,
+    last_log_id INTEGER NOT NULL DEFAULT 0,
+    last_daily_id INTEGER NOT NULL DEFAULT 0,
+    pushed_at TEXT NOT NULL
+);
+
+-- Logs changed after insertion (repair, sync pull), so push can resend them
+CREATE TABLE IF NOT EXISTS log_updates (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_logs_update_push AFTER UPDATE OF timestamp, log_message, type, label, repo ON logs
+WHEN OLD.timestamp IS NOT NEW.timestamp OR OLD.log_message IS NOT NEW.log_message
+  OR OLD.type IS NOT NEW.type OR OLD.label IS NOT NEW.label OR OLD.repo IS NOT NEW.repo
+BEGIN
+    INSERT INTO log_updates (label) VALUES (NEW.label);
+END;
+"""
+
+CREATE_CHANGE_LOG_TABLES = """
+-- Every local insert/delete of a log or daily, numbered per device.
+-- Deletes are kept as tombstones so peers can replay them.
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY,
+    device TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    op TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT,
+    CHECK (kind IN ('log', 'daily')),
+    CHECK (op IN ('upsert', 'delete'))
+);
+
+-- Winning change per row, local or remote; decides last-writer-wins merges
+CREATE TABLE IF NOT EXISTS sync_versions (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    device TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, key)
+);
+
+-- Last sequence number applied from each peer device
+CREATE TABLE IF NOT EXISTS sync_peers (
+    device TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL,
+    file_offset INTEGER NOT NULL DEFAULT 0,
+    pulled_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sync_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Marks logs stored before the degraded column existed. LIKE treats '[' literally;
+# '_' would be a wildcard but no placeholder prefix contains one.
+MARK_DEGRADED_LOGS = "UPDATE logs SET degraded = 1 WHERE type = 'git-hook' AND ({})".format(
+    ' OR '.join("log_message LIKE '{}%'".format(prefix) for prefix in DEGRADED_PREFIXES)
+)
+
+# Columns added after the initial schema: (table, column, declaration[, backfill]).
+# Applied with ALTER TABLE when missing so existing databases upgrade in place;
+# the optional backfill statement runs once, right after the column is added.
+COLUMN_MIGRATIONS = [
+    ('logs', 'repo', 'TEXT'),
+    ('logs', 'minhash', 'BLOB'),  # Near-duplicate signature, see utils/minhash.py
+    ('logs', 'degraded', 'INTEGER NOT NULL DEFAULT 0', MARK_DEGRADED_LOGS),
+    ('push_state', 'last_update_seq', 'INTEGER NOT NULL DEFAULT 0'),
+]
+
+# Created after COLUMN_MIGRATIONS since they index migrated columns
+CREATE_MIGRATED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_logs_degraded ON logs(degraded) WHERE degraded = 1;
+"""
+
+INSERT_LOG_IF_NEW_LABEL = """
+INSERT INTO logs (timestamp, log_message, type, label, repo, minhash, degraded)
+SELECT ?, ?, ?, ?, ?, ?, ?
+WHERE NOT EXISTS (SELECT 1 FROM logs WHERE label = ?)
+"""
@@ -0,0 +1,22 @@
+"""Embedding backend factory and exports."""
+
+from .base import Embedder
+from .ollama_embedder import OllamaEmbedder
+
+EMBEDDERS = {
+    'ollama': OllamaEmbedder,
+}
+
+
+def get_embedder(config: dict) -> Embedder:
+    """Get the configured embedding backend."""
+    embeddings_config = config.get('embeddings', {})
+    backend = embeddings_config.get('provider', 'ollama')
+
+    if backend not in EMBEDDERS:
+        raise ValueError(f"Unknown embeddings provider: {backend}")
+
+    return EMBEDDERS[backend](embeddings_config)
+
+
+__all__ = ['Embedder', 'OllamaEmbedder', 'EMBEDDERS', 'get_embedder']
@@ -0,0 +1,26 @@
+"""Abstract base class for embedding backends."""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class Embedder(ABC):
+    """Abstract base class for embedding backends."""
+
+    def __init__(self, config: Dict):
+        """Initialize embedder with configuration."""
+        self.config = config
+        self.model = config.get('model', '')
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per input text, all of the same dimension
+        """
+        pass
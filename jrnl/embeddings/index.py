@@ -0,0 +1,207 @@
+"""
+Embedding index for semantic log search.
+
+Vectors are L2-normalized float32 and stored as blobs in the log_embeddings
+table, so cosine similarity is a plain dot product. For querying, the rows are
+mirrored into a flat float32 matrix file under ~/.jrnl/embeddings/ that is
+memory-mapped and scanned in chunks with NumPy. The matrix is extended in
+place when only new logs were embedded and rebuilt when vectors were deleted
+or replaced, as tracked by the embedding_generations counters.
+
+NumPy is optional: install with `pip install 'jrnl[semantic]'`.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from ..database.operations import (
+    get_logs_without_embedding,
+    insert_embeddings,
+    get_embedding_stats,
+    iter_embeddings,
+    get_embedding_for_label
+)
+from .base import Embedder
+from ..utils import tracing
+
+INDEX_DIR = Path.home() / '.jrnl' / 'embeddings'
+
+# Logs sent to the embedder per request
+EMBED_BATCH_SIZE = 64
+
+# Matrix rows multiplied per step of the top-k scan
+SCAN_CHUNK_ROWS = 65536
+
+ID_DTYPE_SIZE = 8  # int64 log ids
+FLOAT_SIZE = 4  # float32 vector components
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("Semantic search requires numpy. Install it with: pip install 'jrnl[semantic]'")
+    return numpy
+
+
+class EmbeddingIndex:
+    """Incrementally maintained embedding index for one embedding model."""
+
+    def __init__(self, embedder: Embedder):
+        self.embedder = embedder
+        self.model = embedder.model
+        name = re.sub(r'[^A-Za-z0-9_-]', '_', self.model)
+        self.matrix_path = INDEX_DIR / f'{name}.f32'
+        self.ids_path = INDEX_DIR / f'{name}.ids'
+        self.meta_path = INDEX_DIR / f'{name}.json'
+
+    def update(self, progress: Optional[Callable[[int], None]] = None) -> int:
+        """Embed logs that have no vector yet. Returns the number embedded."""
+        np = _numpy()
+        total = 0
+        while True:
+            logs = get_logs_without_embedding(self.model, EMBED_BATCH_SIZE)
+            if not logs:
+                break
+
+            with tracing.span('embed', cat='provider', texts=len(logs)):
+                vectors = self._normalize(np, self.embedder.embed([log.log_message for log in logs]))
+            dim = vectors.shape[1]
+            insert_embeddings(self.model, (
+                (log.id, dim, vectors[i].tobytes()) for i, log in enumerate(logs)
+            ))
+            total += len(logs)
+            if progress:
+                progress(total)
+
+            if len(logs) < EMBED_BATCH_SIZE:
+                break
+        return total
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """Return up to k (log_id, cosine similarity) pairs closest to the query text."""
+        np = _numpy()
+        vector = self._normalize(np, self.embedder.embed([query]))[0]
+        return self.search_vector(vector, k)
+
+    def related(self, label: str, k: int = 10) -> Optional[List[Tuple[int, float]]]:
+        """Return logs closest to the log with the given label, or None if it isn't indexed."""
+        np = _numpy()
+        blob = get_embedding_for_label(self.model, label)
+        if blob is None:
+            return None
+        return self.search_vector(np.frombuffer(blob, dtype=np.float32), k + 1)
+
+    def search_vector(self, vector, k: int) -> List[Tuple[int, float]]:
+        """Cosine top-k over the memory-mapped matrix."""
+        np = _numpy()
+        meta = self.sync()
+        count, dim = meta['count'], meta['dim']
+        if count == 0 or k <= 0:
+            return []
+        if vector.shape[0] != dim:
+            raise RuntimeError(f"Query vector has dimension {vector.shape[0]}, index has {dim}")
+
+        matrix = np.memmap(self.matrix_path, dtype=np.float32, mode='r', shape=(count, dim))
+        ids = np.memmap(self.ids_path, dtype=np.int64, mode='r', shape=(count,))
+        query = vector.astype(np.float32, copy=False)
+
+        best_scores = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+        for start in range(0, count, SCAN_CHUNK_ROWS):
+            scores = matrix[start:start + SCAN_CHUNK_ROWS] @ query
+            if scores.shape[0] > k:
+                top = np.argpartition(scores, -k)[-k:]
+            else:
+                top = np.arange(scores.shape[0])
+            best_scores = np.concatenate([best_scores, scores[top]])
+            best_rows = np.concatenate([best_rows, top + start])
+            if best_scores.shape[0] > k:
+                keep = np.argpartition(best_scores, -k)[-k:]
+                best_scores, best_rows = best_scores[keep], best_rows[keep]
+
+        order = np.argsort(-best_scores)
+        return [(int(ids[best_rows[i]]), float(best_scores[i])) for i in order]
+
+    def sync(self) -> dict:
+        """Bring the matrix file in line with the database. Returns index metadata."""
+        count, max_id, generation, removals = get_embedding_stats(self.model)
+        meta = self._read_meta()
+        stamp = {'generation': generation, 'removals': removals}
+
+        # Count and max id alone miss a log whose vector was deleted and re-embedded
+        if meta and meta.get('generation') == generation and meta['count'] == count:
+            return meta
+
+        if meta and meta.get('removals') == removals and max_id > meta['max_id']:
+            appended = self._append(meta, stamp)
+            if appended is not None and appended['count'] == count:
+                return appended
+
+        return self._rebuild(stamp)
+
+    def _append(self, meta: dict, stamp: dict) -> Optional[dict]:
+        """Append vectors for logs newer than the matrix. None if a rebuild is needed."""
+        dim = meta['dim']
+        rows = list(iter_embeddings(self.model, after_id=meta['max_id']))
+        if any(len(vector) != dim * FLOAT_SIZE for _, vector in rows):
+            return None
+
+        with open(self.matrix_path, 'ab') as matrix, open(self.ids_path, 'ab') as ids:
+            for log_id, vector in rows:
+                matrix.write(vector)
+                ids.write(log_id.to_bytes(ID_DTYPE_SIZE, 'little', signed=True))
+
+        meta = dict(stamp, count=meta['count'] + len(rows), max_id=rows[-1][0] if rows else meta['max_id'], dim=dim)
+        self._write_meta(meta)
+        return meta
+
+    def _rebuild(self, stamp: dict) -> dict:
+        """Rewrite the matrix from the database, atomically."""
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        matrix_tmp = self.matrix_path.with_name(self.matrix_path.name + '.tmp')
+        ids_tmp = self.ids_path.with_name(self.ids_path.name + '.tmp')
+
+        count, max_id, dim = 0, 0, 0
+        with open(matrix_tmp, 'wb') as matrix, open(ids_tmp, 'wb') as ids:
+            for log_id, vector in iter_embeddings(self.model):
+                if not dim:
+                    dim = len(vector) // FLOAT_SIZE
+                elif len(vector) != dim * FLOAT_SIZE:
+                    continue  # Stale vector from a differently sized model version
+                matrix.write(vector)
+                ids.write(log_id.to_bytes(ID_DTYPE_SIZE, 'little', signed=True))
+                count += 1
+                max_id = log_id
+
+        os.replace(matrix_tmp, self.matrix_path)
+        os.replace(ids_tmp, self.ids_path)
+        meta = dict(stamp, count=count, max_id=max_id, dim=dim)
+        self._write_meta(meta)
+        return meta
+
+    def _read_meta(self) -> Optional[dict]:
+        try:
+            meta = json.loads(self.meta_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        if not (self.matrix_path.exists() and self.ids_path.exists()):
+            return None
+        expected = meta['count'] * meta['dim'] * FLOAT_SIZE
+        if self.matrix_path.stat().st_size != expected:
+            return None
+        return meta
+
+    def _write_meta(self, meta: dict):
+        tmp = self.meta_path.with_name(self.meta_path.name + '.tmp')
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, self.meta_path)
+
+    @staticmethod
+    def _normalize(np, vectors):
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
@@ -0,0 +1,37 @@
+"""Ollama embeddings backend."""
+
+import requests
+from typing import Dict, List
+from .base import Embedder
+
+
+class OllamaEmbedder(Embedder):
+    """Embeddings from a local Ollama server."""
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self.base_url = config.get('url', 'http://localhost:11434')
+        self.model = config.get('model', 'nomic-embed-text')
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts with Ollama's /api/embed endpoint."""
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/embed",
+                json={"model": self.model, "input": texts},
+                timeout=120
+            )
+            response.raise_for_status()
+            embeddings = response.json()['embeddings']
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(f"Cannot connect to Ollama at {self.base_url} for embeddings. Is it running?")
+        except requests.exceptions.Timeout:
+            raise RuntimeError("Ollama embeddings request timed out.")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Ollama embeddings HTTP error: {e}")
+        except (KeyError, ValueError) as e:
+            raise RuntimeError(f"Unexpected Ollama embeddings response: {type(e).__name__}: {e}")
+
+        if len(embeddings) != len(texts):
+            raise RuntimeError(f"Ollama returned {len(embeddings)} embeddings for {len(texts)} texts")
+        return embeddings
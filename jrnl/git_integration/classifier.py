@@ -0,0 +1,299 @@
+"""Summarize trivial commits from git metadata, without an LLM call."""
+
+import re
+import subprocess
+from pathlib import PurePosixPath
+from typing import List, NamedTuple, Optional, Tuple
+
+# Files that hold a project's own version
+VERSION_FILES = {
+    'package.json', 'pyproject.toml', 'setup.py', 'setup.cfg', 'Cargo.toml',
+    'version.py', '_version.py', '__version__.py', 'VERSION', 'version.txt',
+    'build.gradle', 'pom.xml', 'gradle.properties', 'mix.exs', 'Chart.yaml',
+    'pubspec.yaml', 'composer.json', 'manifest.json',
+}
+
+# Release notes a release commit may also touch
+RELEASE_NOTE_FILES = {
+    'CHANGELOG.md', 'CHANGES.md', 'HISTORY.md', 'CHANGELOG', 'CHANGES.rst', 'NEWS.md',
+}
+
+# A changed lockfile means dependencies moved, which the LLM should describe
+LOCK_FILES = {
+    'package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'poetry.lock', 'uv.lock', 'Cargo.lock',
+}
+
+# Package files that count as version files only if the diff just sets __version__
+VERSION_ATTRIBUTE_FILES = {'__init__.py'}
+VERSION_ATTRIBUTE_RE = re.compile(r'^[+-]\s*__version__\s*=')
+
+VERSION = r'v?(\d+\.\d+(?:\.\d+)?(?:[-+.][0-9A-Za-z.]+)?)'
+# A version assignment such as "version": "1.2.0", version = '1.2.0' or <version>1.2.0</version>
+VERSION_FIELD_RE = re.compile(
+    r'^\s*(?:["\']?(?:__version__|version)["\']?\s*[:=]\s*["\']?|<version>)' + VERSION + r'(?:["\'<,\s]|$)',
+    re.IGNORECASE
+)
+# The whole content of a VERSION or version.txt file
+BARE_VERSION_RE = re.compile(r'^\s*' + VERSION + r'\s*$')
+BARE_VERSION_FILES = {'VERSION', 'version.txt'}
+
+BUMP_SUBJECT_RE = re.compile(r'\b(bump|release|version|prepare)\b|^v?\d+\.\d+', re.IGNORECASE)
+# Dependency updates ("Bump lodash from 4.17.20 to 4.17.21", "chore(deps): ...")
+DEPENDENCY_SUBJECT_RE = re.compile(
+    r'\bfrom\s+v?\d\S*\s+to\s+v?\d|\bdeps\b|\bdependenc(y|ies)\b|\brequirements?\b',
+    re.IGNORECASE
+)
+FORMAT_SUBJECT_RE = re.compile(
+    r'^(style(\(.*\))?:|(re)?format|fmt\b|lint\b)'
+    r'|\b(run|apply|ran|applied)\s+(black|prettier|gofmt|rustfmt|ruff format|isort|clang-format|autopep8|yapf)\b',
+    re.IGNORECASE
+)
+REVERT_SUBJECT_RE = re.compile(r'^Revert "(.+)"$')
+
+# Merge subjects written by git, GitHub and GitLab
+MERGE_SUBJECT_RES = [
+    re.compile(r"^Merge branch '([^']+)' into '([^']+)'"),
+    re.compile(r'^Merge pull request #(\d+) from (\S+)'),
+    re.compile(r"^Merge (?:remote-tracking )?branch '([^']+)'(?: of \S+)?(?: into (\S+))?"),
+]
+
+VERSION_BUMP_MAX_LINES = 40
+
+
+class FileChange(NamedTuple):
+    status: str             # git --raw status, e.g. M, A, D, R100
+    path: str
+    old_path: Optional[str]  # set for renames and copies
+    mode_changed: bool = False
+    content_changed: bool = True
+
+
+class FileStat(NamedTuple):
+    added: Optional[int]    # None for binary files
+    deleted: Optional[int]
+    path: str
+
+
+class CommitStats(NamedTuple):
+    parents: int
+    changes: List[FileChange]
+    # Whitespace-insensitive line counts; files whose only edits are
+    # whitespace or blank lines are left out
+    numstat: List[FileStat]
+
+
+def read_commit_stats(repo_path: str, commit_hash: str, timeout: float = 10) -> Optional[CommitStats]:
+    """
+    Return the parents, changed files and whitespace-insensitive numstat of a commit.
+
+    A single `git show` reports all three; merges get no file lists.
+    """
+    result = subprocess.run(
+        ['git', '-C', repo_path, 'show', '-w', '--ignore-blank-lines', '-M',
+         '--raw', '--numstat', '--no-color', '--format=%P', commit_hash],
+        capture_output=True, text=True, timeout=timeout
+    )
+    if result.returncode != 0:
+        return None
+
+    lines = result.stdout.splitlines()
+    parents = len(lines[0].split()) if lines else 0
+    changes = []
+    numstat = []
+    for line in lines[1:]:
+        if line.startswith(':'):
+            # :old_mode new_mode old_sha new_sha status\tpath[\tnew_path]
+            meta, _, paths = line.partition('\t')
+            old_mode, new_mode, old_sha, new_sha, status = meta[1:].split()[:5]
+            flags = (old_mode != new_mode, old_sha != new_sha)
+            names = paths.split('\t')
+            if len(names) == 2:
+                changes.append(FileChange(status, names[1], names[0], *flags))
+            else:
+                changes.append(FileChange(status, names[0], None, *flags))
+            continue
+        parts = line.split('\t', 2)
+        if len(parts) != 3:
+            continue
+        added, deleted, path = parts
+        numstat.append(FileStat(
+            added=int(added) if added.isdigit() else None,
+            deleted=int(deleted) if deleted.isdigit() else None,
+            path=path
+        ))
+    return CommitStats(parents, changes, numstat)
+
+
+def _plural(count: int, noun: str) -> str:
+    return f"{count} {noun}" if count == 1 else f"{count} {noun}s"
+
+
+def summarize_merge(subject: str, parents: int) -> str:
+    for pattern in MERGE_SUBJECT_RES:
+        match = pattern.match(subject)
+        if not match:
+            continue
+        if pattern is MERGE_SUBJECT_RES[1]:
+            return f"Merged pull request #{match.group(1)} from {match.group(2)}"
+        source, target = match.group(1), match.group(2)
+        return f"Merged {source} into {target}" if target else f"Merged {source}"
+    if parents > 2:
+        return f"Merged {parents - 1} branches"
+    return f"Merged: {subject}" if subject else "Merged branch"
+
+
+def _changed_lines(repo_path: str, commit_hash: str, paths: List[str],
+                   timeout: float = 10) -> Optional[List[Tuple[str, str]]]:
+    """(file name, +/- line) for every line the commit changes in paths."""
+    result = subprocess.run(
+        ['git', '-C', repo_path, 'show', '--unified=0', '--no-color', '--format=', commit_hash, '--'] + paths,
+        capture_output=True, text=True, timeout=timeout
+    )
+    if result.returncode != 0:
+        return None
+    lines = []
+    name = ''
+    for line in result.stdout.splitlines():
+        if line.startswith('+++ '):
+            name = PurePosixPath(line[4:]).name
+        elif line.startswith('--- ') or line.startswith('diff --git'):
+            continue
+        elif line[:1] in '+-':
+            lines.append((name, line))
+    return lines
+
+
+def _new_version(repo_path: str, commit_hash: str, paths: List[str]) -> Optional[str]:
+    """
+    The version the commit sets in the project's version fields, or None.
+
+    Every __init__.py line changed must assign __version__, and exactly one
+    new version may replace an old one across the files.
+    """
+    lines = _changed_lines(repo_path, commit_hash, paths)
+    if not lines:
+        return None
+    added, removed = set(), set()
+    for name, line in lines:
+        if name in VERSION_ATTRIBUTE_FILES and not VERSION_ATTRIBUTE_RE.match(line):
+            return None
+        pattern = BARE_VERSION_RE if name in BARE_VERSION_FILES else VERSION_FIELD_RE
+        match = pattern.match(line[1:])
+        if match:
+            (added if line[0] == '+' else removed).add(match.group(1))
+    new = added - removed
+    if len(new) != 1 or not removed - added:
+        return None
+    return new.pop()
+
+
+def _is_version_bump(repo_path: str, commit_hash: str, subject: str, stats: CommitStats) -> Optional[str]:
+    if not BUMP_SUBJECT_RE.search(subject) or DEPENDENCY_SUBJECT_RE.search(subject):
+        return None
+    version_files = []
+    for change in stats.changes:
+        name = PurePosixPath(change.path).name
+        if name in VERSION_FILES or name in VERSION_ATTRIBUTE_FILES:
+            version_files.append(change.path)
+        elif name not in RELEASE_NOTE_FILES:
+            return None  # Includes lockfiles
+    if not version_files:
+        return None
+    changed = sum((s.added or 0) + (s.deleted or 0) for s in stats.numstat)
+    if changed > VERSION_BUMP_MAX_LINES:
+        return None
+    return _new_version(repo_path, commit_hash, version_files)
+
+
+def _tokens(content: bytes) -> bytes:
+    """Content with the layout a formatter controls stripped: whitespace, quote style, trailing commas."""
+    content = re.sub(rb'\s+', b'', content).replace(b"'", b'"')
+    return re.sub(rb',([)\]}])', rb'\1', content)
+
+
+def _same_tokens(repo_path: str, commit_hash: str, paths: List[str], timeout: float = 10) -> bool:
+    """True if each file's content before and after the commit differs only in layout."""
+    objects = ''.join(f"{commit_hash}^:{path}\n{commit_hash}:{path}\n" for path in paths)
+    result = subprocess.run(
+        ['git', '-C', repo_path, 'cat-file', '--batch'],
+        input=objects.encode(), capture_output=True, timeout=timeout
+    )
+    if result.returncode != 0:
+        return False
+    contents = []
+    out = result.stdout
+    pos = 0
+    while pos < len(out):
+        end = out.index(b'\n', pos)
+        header = out[pos:end].split()
+        if len(header) != 3:
+            return False  # "<object> missing"
+        size = int(header[2])
+        contents.append(out[end + 1:end + 1 + size])
+        pos = end + 1 + size + 1
+    if len(contents) != 2 * len(paths):
+        return False
+    return all(_tokens(contents[i]) == _tokens(contents[i + 1]) for i in range(0, len(contents), 2))
+
+
+def _is_formatting(repo_path: str, commit_hash: str, subject: str, stats: CommitStats) -> bool:
+    if not FORMAT_SUBJECT_RE.search(subject):
+        return False
+    if any(c.status != 'M' for c in stats.changes):
+        return False
+    if any(s.added is None for s in stats.numstat):
+        return False  # Binary files changed
+    # The subject only says a formatter ran; the contents must agree
+    return _same_tokens(repo_path, commit_hash, [c.path for c in stats.changes])
+
+
+def classify_commit(repo_path: str, commit_hash: str, message: str) -> Optional[str]:
+    """
+    Return a template summary for a trivial commit, or None if it needs the LLM.
+
+    Handles merges, reverts, version bumps, whitespace-only changes,
+    permission changes, pure renames and formatter runs.
+    """
+    subject = message.strip().splitlines()[0].strip() if message.strip() else ''
+
+    stats = read_commit_stats(repo_path, commit_hash)
+    if stats is None:
+        return None
+
+    if stats.parents > 1:
+        return summarize_merge(subject, stats.parents)
+
+    revert = REVERT_SUBJECT_RE.match(subject)
+    if revert:
+        return f'Reverted "{revert.group(1)}"'
+
+    changes = stats.changes
+    if not changes:
+        return None  # Empty commits keep their message via the LLM path
+
+    if all(c.status == 'R100' for c in changes):
+        if len(changes) == 1:
+            return f"Renamed {changes[0].old_path} to {changes[0].path}"
+        return f"Renamed {_plural(len(changes), 'file')}"
+
+    if all(c.status == 'M' and c.mode_changed and not c.content_changed for c in changes):
+        if len(changes) == 1:
+            return f"Changed file mode of {changes[0].path}"
+        return f"Changed file mode of {_plural(len(changes), 'file')}"
+
+    # Only modified files, none with a non-whitespace line changed. A
+    # permission change also leaves numstat empty, so none may have one
+    if all(c.status == 'M' and not c.mode_changed for c in changes) and not any(
+        s.added or s.deleted or s.added is None for s in stats.numstat
+    ):
+        return f"Whitespace-only changes in {_plural(len(changes), 'file')}"
+
+    version = _is_version_bump(repo_path, commit_hash, subject, stats)
+    if version:
+        return f"Bumped version to {version}"
+
+    if _is_formatting(repo_path, commit_hash, subject, stats):
+        return f"Reformatted {_plural(len(changes), 'file')}"
+
+    return None
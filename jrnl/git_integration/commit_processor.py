@@ -2,6 +2,8 @@
 
 import subprocess
 from typing import Optional, Dict
+from ..utils import tracing
+from .diff_reader import read_commit_diff
 
 
 def extract_commit_info(repo_path: str, commit_hash: str) -> Optional[Dict]:
@@ -17,28 +19,20 @@ def extract_commit_info(repo_path: str, commit_hash: str) -> Optional[Dict]:
     """
     try:
         # Get commit message
-        result = subprocess.run(
-            ['git', '-C', repo_path, 'log', '-1', '--pretty=%B', commit_hash],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        with tracing.span('git log', cat='git'):
+            result = subprocess.run(
+                ['git', '-C', repo_path, 'log', '-1', '--pretty=%B', commit_hash],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
         if result.returncode != 0:
             return None
 
         commit_message = result.stdout.strip()
 
         # Get commit diff with context
-        result = subprocess.run(
-            ['git', '-C', repo_path, 'show', '--unified=3', '--no-color', commit_hash],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode != 0:
-            return None
-
-        commit_diff = result.stdout
+        commit_diff = read_commit_diff(repo_path, commit_hash)
 
         return {
             'hash': commit_hash,
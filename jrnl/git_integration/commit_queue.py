@@ -0,0 +1,139 @@
+"""
+Single-flight queue for commits reported by git hooks.
+
+Hooks only append a line to ~/.jrnl/queue/pending and start a worker if none
+is running. One worker holds an exclusive lock, drains the queue in batches
+and compresses commits with bounded concurrency, so a rebase that fires the
+hooks fifty times results in one process, not fifty.
+
+Queue lines are tab separated:
+    commit         <repo-path> <hash>
+    rebase-commit  <repo-path> <hash>    (made while a rebase was in progress)
+    rewrite        <repo-path> <old-hash> <new-hash>
+"""
+
+import fcntl
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+QUEUE_DIR = Path.home() / '.jrnl' / 'queue'
+PENDING_FILE = QUEUE_DIR / 'pending'
+LOCK_FILE = QUEUE_DIR / 'worker.lock'
+PID_FILE = QUEUE_DIR / 'worker.pid'
+# Rebase commits held back until their rebase finishes
+DEFERRED_FILE = QUEUE_DIR / 'deferred'
+
+# Wait this long before draining so commits from one rebase/amend land in one batch
+SETTLE_SECONDS = 1.0
+
+
+class QueueBatch(NamedTuple):
+    """Work drained from the queue in one pass."""
+    commits: List[Tuple[str, str]]  # (repo_path, hash), first-seen order, deduplicated
+    rewrites: List[Tuple[str, str, str]]  # (repo_path, old_hash, new_hash)
+    rebase_commits: List[Tuple[str, str]]  # (repo_path, hash), made during a rebase
+
+
+def acquire_worker_lock() -> Optional[int]:
+    """
+    Try to become the single queue worker.
+
+    Returns the lock file descriptor, or None if another worker holds it.
+    """
+    QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    PID_FILE.write_text(str(os.getpid()))
+    return fd
+
+
+def release_worker_lock(fd: int):
+    """Release the worker lock."""
+    try:
+        PID_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+def has_pending() -> bool:
+    """Whether any hook has queued work."""
+    return PENDING_FILE.exists()
+
+
+def take_batch() -> Optional[QueueBatch]:
+    """
+    Atomically take everything queued so far, plus any deferred rebase commits.
+
+    The pending file is renamed away first, so hooks that fire while the
+    batch is processed start a fresh file instead of racing the reader.
+    """
+    processing = QUEUE_DIR / f'processing.{os.getpid()}'
+    try:
+        os.replace(PENDING_FILE, processing)
+    except FileNotFoundError:
+        return None
+
+    # Let appends that opened the old file before the rename finish
+    time.sleep(0.1)
+    lines = []
+    for path in (DEFERRED_FILE, processing):
+        try:
+            lines.extend(path.read_text().splitlines())
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    return parse_lines(lines)
+
+
+def defer(rebase_commits: List[Tuple[str, str]]):
+    """Hold rebase commits until the next batch, which the post-rewrite hook triggers."""
+    if not rebase_commits:
+        return
+    with open(DEFERRED_FILE, 'a') as f:
+        for repo_path, commit_hash in rebase_commits:
+            f.write(f"rebase-commit\t{repo_path}\t{commit_hash}\n")
+
+
+def parse_lines(lines: List[str]) -> QueueBatch:
+    """Parse queue lines, dropping malformed ones and duplicate commits."""
+    commits: Dict[Tuple[str, str], None] = {}
+    rebase_commits: Dict[Tuple[str, str], None] = {}
+    rewrites = []
+    for line in lines:
+        parts = line.split('\t')
+        if parts[0] == 'commit' and len(parts) == 3:
+            commits[(parts[1], parts[2])] = None
+        elif parts[0] == 'rebase-commit' and len(parts) == 3:
+            rebase_commits[(parts[1], parts[2])] = None
+        elif parts[0] == 'rewrite' and len(parts) == 4:
+            rewrites.append((parts[1], parts[2], parts[3]))
+    return QueueBatch(commits=list(commits), rewrites=rewrites, rebase_commits=list(rebase_commits))
+
+
+def _git(repo_path: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(['git', '-C', repo_path] + list(args), capture_output=True, text=True, timeout=10)
+
+
+def rebase_in_progress(repo_path: str) -> bool:
+    """Whether a rebase is stopped or running in repo_path (`git am` does not count)."""
+    result = _git(repo_path, 'rev-parse', '--absolute-git-dir')
+    if result.returncode != 0:
+        return False
+    git_dir = Path(result.stdout.strip())
+    apply_dir = git_dir / 'rebase-apply'
+    return (git_dir / 'rebase-merge').is_dir() or (apply_dir.is_dir() and not (apply_dir / 'applying').exists())
+
+
+def on_current_branch(repo_path: str, commit_hash: str) -> bool:
+    """Whether HEAD contains the commit, i.e. it survived its rebase."""
+    return _git(repo_path, 'merge-base', '--is-ancestor', commit_hash, 'HEAD').returncode == 0
@@ -0,0 +1,217 @@
+"""Bounded reads of commit diffs from git."""
+
+import os
+import select
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from ..utils import tracing
+
+MAX_DIFF_BYTES = 50000
+# Per-part budget when a large commit is read in parts (read_commit_chunks)
+MAX_CHUNK_BYTES = 12000
+READ_CHUNK = 64 * 1024
+TRUNCATION_NOTE = "\n... (diff truncated for size)"
+
+IGNORE_FILE = '.jrnlignore'
+
+# Files whose diffs are noise for a summary: lockfiles, minified/bundled
+# output and binary formats.
+BUILTIN_EXCLUDES = [
+    'package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'bun.lockb', 'poetry.lock', 'Pipfile.lock', 'uv.lock', 'Cargo.lock',
+    'Gemfile.lock', 'composer.lock', 'go.sum', 'flake.lock', 'mix.lock',
+    'pubspec.lock', 'Podfile.lock', 'packages.lock.json',
+    '*.min.js', '*.min.css', '*.map',
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.ico', '*.webp', '*.bmp', '*.tiff',
+    '*.pdf', '*.zip', '*.gz', '*.tgz', '*.bz2', '*.xz', '*.7z', '*.tar', '*.jar',
+    '*.whl', '*.so', '*.dylib', '*.dll', '*.exe', '*.o', '*.a', '*.class', '*.pyc',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp3', '*.mp4', '*.mov', '*.wav', '*.avi',
+    '*.parquet', '*.feather', '*.npy', '*.npz', '*.pkl', '*.h5',
+    '*.sqlite', '*.sqlite3', '*.db',
+]
+
+# Paths marked generated or non-diffable in .gitattributes
+ATTR_EXCLUDES = [
+    ':(top,exclude,attr:linguist-generated)',
+    ':(top,exclude,attr:linguist-generated=true)',
+    ':(top,exclude,attr:-diff)',
+]
+
+
+class DiffResult(NamedTuple):
+    text: str
+    truncated: bool
+
+
+class FileChange(NamedTuple):
+    path: str
+    added: int  # Lines; 0 for binary files
+    deleted: int
+
+    @property
+    def churn(self) -> int:
+        return max(1, self.added + self.deleted)
+
+
+def _glob_exclude(pattern: str) -> str:
+    # Unanchored patterns match at any depth, like .gitignore
+    if '/' not in pattern.rstrip('/'):
+        pattern = f"**/{pattern}"
+    return f":(top,exclude,glob){pattern.lstrip('/')}"
+
+
+def read_ignore_file(repo_path: str) -> List[str]:
+    """Read glob patterns from the repository's .jrnlignore, if any."""
+    path = Path(repo_path) / IGNORE_FILE
+    try:
+        lines = path.read_text(encoding='utf-8').splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            patterns.append(line)
+    return patterns
+
+
+def exclude_pathspecs(repo_path: str) -> List[str]:
+    """Pathspecs excluding built-in, .jrnlignore and gitattributes matches."""
+    patterns = BUILTIN_EXCLUDES + read_ignore_file(repo_path)
+    return [_glob_exclude(p) for p in patterns] + ATTR_EXCLUDES
+
+
+def read_bounded(cmd: List[str], max_bytes: int, timeout: float) -> DiffResult:
+    """
+    Run a command and read at most max_bytes of its stdout.
+
+    The process is killed as soon as the budget is reached, so memory and
+    time stay bounded however large the output would have been. Raises
+    subprocess.TimeoutExpired or subprocess.CalledProcessError like
+    subprocess.run(check=True) would.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    chunks = []
+    size = 0
+    truncated = False
+    fd = proc.stdout.fileno()
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, min(READ_CHUNK, max_bytes + 1 - size))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                truncated = True
+                break
+    finally:
+        if truncated or proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        returncode = proc.wait()
+
+    if not truncated and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+    data = b''.join(chunks)[:max_bytes]
+    # A cut inside a multi-byte character decodes to one replacement char
+    return DiffResult(data.decode('utf-8', errors='replace'), truncated)
+
+
+def read_commit_diff(repo_path: str, commit_hash: str,
+                     max_bytes: int = MAX_DIFF_BYTES, timeout: float = 10) -> str:
+    """Read a commit's diff, skipping noise paths and capping its size."""
+    cmd = ['git', '-C', repo_path, 'show', '--unified=3', '--no-color',
+           '--no-ext-diff', commit_hash, '--'] + exclude_pathspecs(repo_path)
+    with tracing.span('git show', cat='git'):
+        result = read_bounded(cmd, max_bytes, timeout)
+    if result.truncated:
+        return result.text + TRUNCATION_NOTE
+    return result.text
+
+
+def read_changed_files(repo_path: str, commit_hash: str, timeout: float = 10) -> List[FileChange]:
+    """Files a commit changes with their line counts, skipping noise paths."""
+    cmd = ['git', '-C', repo_path, 'show', '--numstat', '-z', '--no-renames', '--format=',
+           commit_hash, '--'] + exclude_pathspecs(repo_path)
+    with tracing.span('git show --numstat', cat='git'):
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout, check=True)
+    files = []
+    for record in result.stdout.decode('utf-8', errors='replace').split('\0'):
+        parts = record.strip('\n').split('\t', 2)
+        if len(parts) != 3:
+            continue
+        added, deleted, path = parts
+        files.append(FileChange(path, int(added) if added.isdigit() else 0,
+                                int(deleted) if deleted.isdigit() else 0))
+    return files
+
+
+def group_changed_files(files: List[FileChange], max_groups: int) -> List[List[FileChange]]:
+    """
+    Split files into at most max_groups groups of similar churn.
+
+    Files stay in path order and a directory stays in one group unless it
+    alone is larger than a group should be, so each group is a coherent
+    part of the tree.
+    """
+    by_dir: Dict[str, List[FileChange]] = {}
+    for change in sorted(files):
+        by_dir.setdefault(os.path.dirname(change.path), []).append(change)
+
+    total = sum(change.churn for change in files)
+    target = max(1, -(-total // max(1, max_groups)))
+    while True:
+        units: List[Tuple[int, List[FileChange]]] = []
+        for members in by_dir.values():
+            churn = sum(change.churn for change in members)
+            if churn > target:
+                units.extend((change.churn, [change]) for change in members)
+            else:
+                units.append((churn, members))
+
+        groups: List[List[FileChange]] = []
+        current: List[FileChange] = []
+        size = 0
+        for churn, members in units:
+            if current and size + churn > target:
+                groups.append(current)
+                current, size = [], 0
+            current.extend(members)
+            size += churn
+        if current:
+            groups.append(current)
+        if len(groups) <= max_groups:
+            return groups
+        target = target * 3 // 2 + 1
+
+
+def read_commit_chunks(repo_path: str, commit_hash: str, max_chunks: int,
+                       max_bytes: int = MAX_CHUNK_BYTES, timeout: float = 10) -> List[Tuple[str, str]]:
+    """
+    Read a large commit as (file list, diff) parts, at most max_chunks of them.
+
+    Every changed file is named in some part's file list, even where the
+    part's diff had to be cut at max_bytes.
+    """
+    chunks = []
+    for group in group_changed_files(read_changed_files(repo_path, commit_hash, timeout), max_chunks):
+        listing = "\n".join(f"{change.path} (+{change.added} -{change.deleted})" for change in group)
+        cmd = ['git', '-C', repo_path, 'show', '--unified=3', '--no-color', '--no-ext-diff',
+               '--format=', commit_hash, '--'] + [f':(top,literal){change.path}' for change in group]
+        with tracing.span('git show', cat='git', files=len(group)):
+            result = read_bounded(cmd, max_bytes, timeout)
+        chunks.append((listing, result.text + TRUNCATION_NOTE if result.truncated else result.text))
+    return chunks
@@ -0,0 +1,46 @@
+"""
+Commit summaries stored as git notes under refs/notes/jrnl.
+
+A note travels with the repository (once the notes ref is fetched and
+pushed), so a commit compressed on one machine doesn't have to be
+compressed again by every other clone that logs it.
+"""
+
+import subprocess
+import threading
+from typing import Dict, Optional
+
+NOTES_REF = 'refs/notes/jrnl'
+
+# Writes to one notes ref from several threads would race on the ref lock
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def read_note(repo_path: str, commit_hash: str) -> Optional[str]:
+    """The summary noted for a commit, or None if there is none."""
+    result = subprocess.run(
+        ['git', '-C', repo_path, 'notes', f'--ref={NOTES_REF}', 'show', commit_hash],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    if result.returncode != 0:
+        return None  # No note (or no notes ref yet)
+    summary = result.stdout.strip()
+    return summary or None
+
+
+def write_note(repo_path: str, commit_hash: str, summary: str) -> bool:
+    """Attach a summary to a commit, replacing any earlier note. Returns True on success."""
+    with _write_locks_guard:
+        lock = _write_locks.setdefault(repo_path, threading.Lock())
+    with lock:
+        result = subprocess.run(
+            ['git', '-C', repo_path, 'notes', f'--ref={NOTES_REF}', 'add', '-f', '-F', '-', commit_hash],
+            input=summary,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    return result.returncode == 0
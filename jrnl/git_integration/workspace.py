@@ -0,0 +1,99 @@
+"""Discover repositories under workspace roots and list new commits."""
+
+import os
+import subprocess
+from typing import Iterator, List, NamedTuple, Optional
+
+# Directory names never worth descending into
+PRUNE_DIRS = {
+    'node_modules', '.venv', 'venv', 'env', '__pycache__', '.tox', '.nox',
+    '.mypy_cache', '.pytest_cache', '.ruff_cache', '.cache', '.gradle',
+    '.idea', '.vscode', 'target', 'build', 'dist', 'vendor', 'Pods',
+    'site-packages', '.terraform',
+}
+
+DEFAULT_MAX_DEPTH = 4
+
+
+class RepoCommit(NamedTuple):
+    repo: str
+    hash: str
+    commit_time: int  # unix seconds, committer date
+
+
+def discover_repos(root: str, max_depth: int = DEFAULT_MAX_DEPTH) -> Iterator[str]:
+    """
+    Yield git repositories under root.
+
+    Walks with os.scandir, which reads entry types from the directory listing
+    without a stat per entry. Stops at the first repository on each path
+    (nested repositories and submodules are not searched), skips dependency
+    and build directories, and never follows symlinks.
+    """
+    root = os.path.abspath(os.path.expanduser(root))
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable or vanished
+
+        # A .git directory, or a .git file for worktrees and submodules
+        if any(entry.name == '.git' for entry in entries):
+            yield path
+            continue
+
+        if depth >= max_depth:
+            continue
+        for entry in entries:
+            name = entry.name
+            if name in PRUNE_DIRS or name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, depth + 1))
+            except OSError:
+                continue
+
+
+def list_commits_since(repo: str, since: int, authors: List[str],
+                       timeout: float = 30) -> Optional[List[RepoCommit]]:
+    """
+    List commits on any local branch committed after `since`, oldest first.
+
+    Only commits by the given author emails are listed (all commits if none
+    are given). Returns None if git fails, e.g. for a broken repository.
+    """
+    cmd = ['git', '-C', repo, 'log', '--branches', f'--since={since}',
+           '--format=%H %ct', '--reverse']
+    for author in authors:
+        cmd.append(f'--author={author}')
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        # An empty repository has no branches to log
+        return [] if 'does not have any commits' in result.stderr else None
+
+    commits = []
+    for line in result.stdout.splitlines():
+        commit_hash, _, commit_time = line.partition(' ')
+        if commit_hash and commit_time.isdigit():
+            commits.append(RepoCommit(repo, commit_hash, int(commit_time)))
+    return commits
+
+
+def default_author_emails() -> List[str]:
+    """The user's global git email, used when no sync authors are configured."""
+    try:
+        result = subprocess.run(
+            ['git', 'config', '--global', 'user.email'],
+            capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    email = result.stdout.strip()
+    return [email] if email else []
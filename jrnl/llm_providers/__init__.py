@@ -3,10 +3,14 @@
 from .base import LLMProvider
 from .anthropic_provider import AnthropicProvider
 from .ollama_provider import OllamaProvider
+from .openai_compat_provider import OpenAICompatProvider
+from .replay_provider import ReplayProvider
 
 PROVIDERS = {
     'anthropic': AnthropicProvider,
     'ollama': OllamaProvider,
+    'openai_compat': OpenAICompatProvider,
+    'replay': ReplayProvider,
 }
 
 
@@ -18,7 +22,10 @@ def get_provider(config: dict) -> LLMProvider:
         raise ValueError(f"Unknown LLM provider: {provider_name}")
 
     provider_config = config.get('llm_providers', {}).get(provider_name, {})
-    return PROVIDERS[provider_name](provider_config)
+    provider_class = PROVIDERS[provider_name]
+    if getattr(provider_class, 'wraps_provider', False):
+        return provider_class(provider_config, root_config=config)
+    return provider_class(provider_config)
 
 
-__all__ = ['LLMProvider', 'AnthropicProvider', 'OllamaProvider', 'get_provider']
+__all__ = ['LLMProvider', 'AnthropicProvider', 'OllamaProvider', 'OpenAICompatProvider', 'ReplayProvider', 'get_provider']
@@ -1,8 +1,9 @@
 """Anthropic/Claude LLM provider."""
 
-from typing import Dict, List
-from .base import LLMProvider
-from .prompts import COMPRESS_COMMIT_PROMPT, GENERATE_DAILY_PROMPT
+import json
+from typing import Dict, Iterator, List, Optional
+from .base import LLMProvider, format_report_inputs
+from .prompts import COMPRESS_COMMIT_PROMPT, GENERATE_DAILY_PROMPT, GENERATE_REPORT_PROMPT
 import requests
 
 
@@ -15,18 +16,22 @@ class AnthropicProvider(LLMProvider):
         if not self.api_key:
             raise ValueError("Anthropic API key not configured. Run: jrnl config set anthropic api_key YOUR_KEY")
 
+        self.base_url = config.get('url', 'https://api.anthropic.com')
         self.model = config.get('model', 'claude-sonnet-4-5-20250929')
         self.max_tokens_commit = config.get('max_tokens_commit', 200)
         self.max_tokens_daily = config.get('max_tokens_daily', 500)
         
+    def _headers(self) -> dict:
+        return {
+            'x-api-key': self.api_key,
+            'anthropic-version': '2023-06-01',
+            'Content-Type': 'application/json'
+        }
+
     def _send_message(self, prompt: dict, max_tokens=200) -> dict:
         res = requests.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                'x-api-key': self.api_key,
-                'anthropic-version': '2023-06-01',
-                'Content-Type': 'application/json'
-            },
+            f"{self.base_url}/v1/messages",
+            headers=self._headers(),
             json={
                 'model': self.model,
                 'max_tokens': max_tokens,
@@ -46,7 +51,44 @@ class AnthropicProvider(LLMProvider):
         )
 
         return res.json()
-        
+
+    def stream_chat(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+                    timeout: Optional[float] = None,
+                    usage: Optional[Dict] = None) -> Iterator[str]:
+        """Yield Claude's reply in pieces as it is generated (server-sent events)."""
+        response = requests.post(
+            f"{self.base_url}/v1/messages",
+            headers=self._headers(),
+            json={
+                'model': self.model,
+                'max_tokens': max_tokens,
+                'temperature': temperature,
+                'stream': True,
+                'messages': [{'role': 'user', 'content': prompt}]
+            },
+            timeout=timeout or 120,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(b'data:'):
+                    continue
+                event = json.loads(line[5:])
+                kind = event.get('type')
+                if kind == 'content_block_delta':
+                    text = event.get('delta', {}).get('text')
+                    if text:
+                        yield text
+                elif kind == 'message_start' and usage is not None:
+                    usage['input_tokens'] = event['message'].get('usage', {}).get('input_tokens')
+                elif kind == 'message_delta' and usage is not None:
+                    usage['output_tokens'] = event.get('usage', {}).get('output_tokens')
+                elif kind == 'error':
+                    raise RuntimeError(event.get('error', {}).get('message', 'stream error'))
+                elif kind == 'message_stop':
+                    return
+
     def compress_commit(self, commit_message: str, commit_diff: str) -> str:
         """Compress commit using Claude."""
         prompt = COMPRESS_COMMIT_PROMPT.format(
@@ -92,6 +134,28 @@ class AnthropicProvider(LLMProvider):
         except Exception as e:
             raise RuntimeError(f"Failed to generate daily: {type(e).__name__}: {e}")
 
+    def generate_report(self, period: str, period_label: str,
+                        dailies: List[Dict], logs: List[Dict]) -> str:
+        """Generate weekly/monthly summary using Claude."""
+        prompt = GENERATE_REPORT_PROMPT.format(
+            period=period,
+            period_label=period_label,
+            **format_report_inputs(dailies, logs)
+        )
+
+        try:
+            message = self._send_message(
+                prompt=prompt,
+                max_tokens=self.max_tokens_daily,
+            )
+
+            return message.get('content', [])[0].get('text').strip()
+
+        except IndexError as e:
+            raise RuntimeError(f"Failed to generate {period} summary: {type(e).__name__}: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate {period} summary: {type(e).__name__}: {e}")
+
     def test_connection(self) -> bool:
         """Test Anthropic API connection."""
         try:
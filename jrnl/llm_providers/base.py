@@ -1,7 +1,27 @@
 """Abstract base class for LLM providers."""
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .prompts import COMPRESS_CHUNK_PROMPT, COMBINE_CHUNKS_PROMPT
+
+# Output limit for each part of a large commit; the combine step gets max_tokens_commit
+CHUNK_MAX_TOKENS = 80
+
+# Seconds to wait for part summaries when the provider config sets no timeout
+CHUNK_DEADLINE = 60
+
+
+def format_report_inputs(dailies: List[Dict], logs: List[Dict]) -> Dict[str, str]:
+    """Render dailies and logs as prompt text for GENERATE_REPORT_PROMPT."""
+    daily_text = "\n".join(
+        f"- {daily['daily_date']}: {daily['daily_message']}" for daily in dailies
+    ) or "(none)"
+    log_text = "\n".join(
+        f"- {log['timestamp'][:10]} [{log['type']}] {log['log_message']}" for log in logs
+    ) or "(none)"
+    return {'dailies': daily_text, 'logs': log_text}
 
 
 class LLMProvider(ABC):
@@ -25,6 +45,69 @@ class LLMProvider(ABC):
         """
         pass
 
+    def compress_large_commit(self, commit_message: str, commit_diff: str,
+                              chunks: Sequence[Tuple[str, str]]) -> str:
+        """
+        Compress a commit whose diff is too large for one prompt.
+
+        Each (file list, diff) part is summarized in parallel with a small
+        output limit, then the part summaries are combined into one log
+        message. Parts that fail or are not done within the provider's
+        `timeout` (CHUNK_DEADLINE if unset) are left out; if none succeed
+        or the combine step fails, this falls back to compress_commit on
+        the truncated commit_diff.
+
+        Args:
+            commit_message: The git commit message
+            commit_diff: The commit's diff, truncated
+            chunks: (file list, diff) for each part of the commit
+
+        Returns:
+            Compressed log message suitable for standup
+        """
+        prompts = [
+            COMPRESS_CHUNK_PROMPT.format(index=index, total=len(chunks), commit_message=commit_message,
+                                         files=files, commit_diff=diff)
+            for index, (files, diff) in enumerate(chunks, 1)
+        ]
+        deadline = float(self.config.get('timeout') or CHUNK_DEADLINE)
+        results: List[Optional[str]] = [None] * len(prompts)
+
+        def summarize_part(index: int, prompt: str):
+            try:
+                results[index] = self.complete(prompt, CHUNK_MAX_TOKENS, 0.3, deadline)
+            except Exception:
+                pass
+
+        # Daemon threads, so a part still waiting on the server never holds up process exit
+        threads = [
+            threading.Thread(target=summarize_part, args=(index, prompt), daemon=True)
+            for index, prompt in enumerate(prompts)
+        ]
+        for thread in threads:
+            thread.start()
+        end = time.monotonic() + deadline
+        for thread in threads:
+            thread.join(max(0.0, end - time.monotonic()))
+
+        summaries = [
+            f"- {result}" for thread, result in zip(threads, results)
+            if not thread.is_alive() and result
+        ]
+        if not summaries:
+            return self.compress_commit(commit_message, commit_diff)
+
+        file_count = sum(len(files.splitlines()) for files, _ in chunks)
+        try:
+            message = self.complete(
+                COMBINE_CHUNKS_PROMPT.format(file_count=file_count, commit_message=commit_message,
+                                             summaries="\n".join(summaries)),
+                self.config.get('max_tokens_commit', 200)
+            )
+        except Exception:
+            message = None
+        return message or self.compress_commit(commit_message, commit_diff)
+
     @abstractmethod
     def generate_daily(self, logs: List[Dict], days: int = 1) -> str:
         """
@@ -39,6 +122,46 @@ class LLMProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def generate_report(self, period: str, period_label: str,
+                        dailies: List[Dict], logs: List[Dict]) -> str:
+        """
+        Generate a weekly or monthly summary.
+
+        Args:
+            period: 'week' or 'month'
+            period_label: Human readable period, e.g. "the week of 2024-12-09"
+            dailies: Daily entries in the period (dicts with daily_date, daily_message)
+            logs: Log entries in the period (dicts with timestamp, log_message, type, label)
+
+        Returns:
+            Formatted period summary
+        """
+        pass
+
+    def stream_chat(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+                    timeout: Optional[float] = None,
+                    usage: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Send one prompt and yield the reply in pieces as it is generated.
+
+        Args:
+            prompt: Full prompt text
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+            timeout: Request timeout in seconds
+            usage: If given, filled with 'input_tokens' and 'output_tokens'
+                as reported by the server once the reply is complete
+
+        Providers that cannot stream raise NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
+    def complete(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+                 timeout: Optional[float] = None) -> str:
+        """Send one prompt and return the full reply. Raises on failure."""
+        return ''.join(self.stream_chat(prompt, max_tokens, temperature, timeout)).strip()
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if the provider is accessible and configured correctly."""
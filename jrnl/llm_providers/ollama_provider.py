@@ -1,9 +1,10 @@
 """Ollama local LLM provider."""
 
+import json
 import requests
-from typing import Dict, List
-from .base import LLMProvider
-from .prompts import COMPRESS_COMMIT_PROMPT, GENERATE_DAILY_PROMPT
+from typing import Dict, Iterator, List, Optional
+from .base import LLMProvider, format_report_inputs
+from .prompts import COMPRESS_COMMIT_PROMPT, GENERATE_DAILY_PROMPT, GENERATE_REPORT_PROMPT
 
 
 class OllamaProvider(LLMProvider):
@@ -85,6 +86,74 @@ class OllamaProvider(LLMProvider):
         except Exception as e:
             raise RuntimeError(f"Failed to generate daily with Ollama: {type(e).__name__}: {e}")
 
+    def generate_report(self, period: str, period_label: str,
+                        dailies: List[Dict], logs: List[Dict]) -> str:
+        """Generate weekly/monthly summary using Ollama."""
+        prompt = GENERATE_REPORT_PROMPT.format(
+            period=period,
+            period_label=period_label,
+            **format_report_inputs(dailies, logs)
+        )
+
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.5,
+                        "num_predict": self.max_tokens_daily
+                    }
+                },
+                timeout=120
+            )
+            response.raise_for_status()
+            return response.json()['response'].strip()
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(f"Cannot connect to Ollama. Is it running at {self.base_url}?")
+        except requests.exceptions.Timeout:
+            raise RuntimeError("Ollama request timed out. Try a faster model or increase timeout.")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Ollama HTTP error: {e}")
+        except (KeyError, ValueError) as e:
+            raise RuntimeError(f"Failed to generate {period} summary with Ollama: {type(e).__name__}: {e}")
+
+    def stream_chat(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+                    timeout: Optional[float] = None,
+                    usage: Optional[Dict] = None) -> Iterator[str]:
+        """Yield the reply in pieces as Ollama generates it (one JSON object per line)."""
+        response = requests.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "options": {
+                    "temperature": temperature,
+                    "num_predict": max_tokens
+                }
+            },
+            timeout=timeout or 120,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    raise RuntimeError(chunk['error'])
+                if chunk.get('response'):
+                    yield chunk['response']
+                if chunk.get('done'):
+                    if usage is not None:
+                        usage['input_tokens'] = chunk.get('prompt_eval_count')
+                        usage['output_tokens'] = chunk.get('eval_count')
+                    return
+
     def test_connection(self) -> bool:
         """Test Ollama connection."""
         try:
@@ -0,0 +1,170 @@
+"""Provider for OpenAI-compatible chat completion servers (llama.cpp, vLLM, LM Studio, ...)."""
+
+import json
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .base import LLMProvider, format_report_inputs
+from .prompts import COMPRESS_COMMIT_PROMPT, GENERATE_DAILY_PROMPT, GENERATE_REPORT_PROMPT
+
+
+class OpenAICompatProvider(LLMProvider):
+    """
+    Talks to any server implementing `POST /v1/chat/completions`.
+
+    One pooled session is shared by all calls, sized to max_concurrency so
+    concurrent requests reuse keep-alive connections; servers like vLLM and
+    llama.cpp (with --parallel) batch those requests together.
+    """
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        url = config.get('url', 'http://localhost:8080').rstrip('/')
+        # Accept base URLs given with or without the /v1 suffix
+        self.base_url = url[:-3] if url.endswith('/v1') else url
+        self.api_key = config.get('api_key', '')
+        self.model = config.get('model', '')
+        self.max_tokens_commit = config.get('max_tokens_commit', 200)
+        self.max_tokens_daily = config.get('max_tokens_daily', 500)
+        # `jrnl config set` stores non-numeric values as strings
+        self.stream = str(config.get('stream', False)).lower() in ('1', 'true', 'yes', 'on')
+        self.max_concurrency = max(1, int(config.get('max_concurrency', 8)))
+        self.timeout = config.get('timeout', 60)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if self.api_key:
+            self.session.headers['Authorization'] = f"Bearer {self.api_key}"
+
+    def _payload(self, prompt: str, max_tokens: int, temperature: float, stream: bool) -> Dict:
+        payload = {
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': max_tokens,
+            'temperature': temperature,
+            'stream': stream
+        }
+        if self.model:
+            payload['model'] = self.model  # Single-model servers ignore or don't need it
+        return payload
+
+    def stream_chat(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+                    timeout: Optional[float] = None,
+                    usage: Optional[Dict] = None) -> Iterator[str]:
+        """Yield the reply in pieces as the server generates it (server-sent events)."""
+        payload = self._payload(prompt, max_tokens, temperature, stream=True)
+        if usage is not None:
+            # Token counts arrive in a final chunk with no choices
+            payload['stream_options'] = {'include_usage': True}
+        response = self.session.post(
+            f"{self.base_url}/v1/chat/completions",
+            json=payload,
+            timeout=timeout or self.timeout,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(b'data:'):
+                    continue
+                data = line[5:].strip()
+                if data == b'[DONE]':
+                    return
+                chunk = json.loads(data)
+                if usage is not None and chunk.get('usage'):
+                    usage['input_tokens'] = chunk['usage'].get('prompt_tokens')
+                    usage['output_tokens'] = chunk['usage'].get('completion_tokens')
+                for choice in chunk.get('choices') or []:
+                    text = (choice.get('delta') or {}).get('content')
+                    if text:
+                        yield text
+
+    def chat(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+             timeout: Optional[float] = None) -> str:
+        """Send one prompt and return the full reply."""
+        if self.stream:
+            return ''.join(self.stream_chat(prompt, max_tokens, temperature, timeout)).strip()
+
+        response = self.session.post(
+            f"{self.base_url}/v1/chat/completions",
+            json=self._payload(prompt, max_tokens, temperature, stream=False),
+            timeout=timeout or self.timeout
+        )
+        response.raise_for_status()
+        return response.json()['choices'][0]['message']['content'].strip()
+
+    def complete(self, prompt: str, max_tokens: int, temperature: float = 0.3,
+                 timeout: Optional[float] = None) -> str:
+        return self.chat(prompt, max_tokens, temperature, timeout)
+
+    def compress_commit(self, commit_message: str, commit_diff: str) -> str:
+        """Compress commit using the chat completions endpoint."""
+        prompt = COMPRESS_COMMIT_PROMPT.format(
+            commit_message=commit_message,
+            commit_diff=commit_diff
+        )
+
+        try:
+            return self.chat(prompt, self.max_tokens_commit, temperature=0.3)
+        except requests.exceptions.ConnectionError:
+            return f"[OpenAI-Compat Not Running] {commit_message}"
+        except requests.exceptions.Timeout:
+            return f"[OpenAI-Compat Timeout] {commit_message}"
+        except requests.exceptions.RequestException:
+            return f"[OpenAI-Compat Error] {commit_message}"
+        except Exception:
+            return f"[LLM Error] {commit_message}"
+
+    def generate_daily(self, logs: List[Dict], days: int = 1) -> str:
+        """Generate daily standup using the chat completions endpoint."""
+        log_text = "\n".join([
+            f"- [{log['type']}] {log['log_message']}"
+            for log in logs
+        ])
+
+        prompt = GENERATE_DAILY_PROMPT.format(
+            days=days,
+            logs=log_text
+        )
+
+        try:
+            return self.chat(prompt, self.max_tokens_daily, temperature=0.5, timeout=max(self.timeout, 120))
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(f"Cannot connect to the OpenAI-compatible server at {self.base_url}. Is it running?")
+        except requests.exceptions.Timeout:
+            raise RuntimeError("OpenAI-compatible server timed out. Try a faster model or increase timeout.")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"OpenAI-compatible server HTTP error: {e}")
+        except (KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Unexpected response from OpenAI-compatible server: {type(e).__name__}: {e}")
+
+    def generate_report(self, period: str, period_label: str,
+                        dailies: List[Dict], logs: List[Dict]) -> str:
+        """Generate weekly/monthly summary using the chat completions endpoint."""
+        prompt = GENERATE_REPORT_PROMPT.format(
+            period=period,
+            period_label=period_label,
+            **format_report_inputs(dailies, logs)
+        )
+
+        try:
+            return self.chat(prompt, self.max_tokens_daily, temperature=0.5, timeout=max(self.timeout, 120))
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(f"Cannot connect to the OpenAI-compatible server at {self.base_url}. Is it running?")
+        except requests.exceptions.Timeout:
+            raise RuntimeError("OpenAI-compatible server timed out. Try a faster model or increase timeout.")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"OpenAI-compatible server HTTP error: {e}")
+        except (KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Failed to generate {period} summary: {type(e).__name__}: {e}")
+
+    def test_connection(self) -> bool:
+        """Test the server by listing its models."""
+        try:
+            response = self.session.get(f"{self.base_url}/v1/models", timeout=5)
+            return response.status_code == 200
+        except Exception:
+            return False
@@ -22,6 +22,37 @@ Examples:
 
 Your response:"""
 
+COMPRESS_CHUNK_PROMPT = """You are helping a developer track their work for daily standups.
+
+This is part {index} of {total} of one large git commit.
+
+COMMIT MESSAGE:
+{commit_message}
+
+FILES IN THIS PART:
+{files}
+
+DIFF OF THIS PART:
+{commit_diff}
+
+In one sentence (max 150 chars), say what changed in these files. Mention any TODO comments added. Use past tense.
+
+Your response:"""
+
+COMBINE_CHUNKS_PROMPT = """You are helping a developer track their work for daily standups.
+
+A large git commit changed {file_count} files. Each part of it was summarized separately.
+
+COMMIT MESSAGE:
+{commit_message}
+
+PART SUMMARIES:
+{summaries}
+
+Compress this into a single concise paragraph (max 300 chars) that describes what work was completed across the whole commit. Focus on WHAT was done, not HOW. Use past tense. This will be used in a standup summary.
+
+Your response:"""
+
 GENERATE_DAILY_PROMPT = """You are helping a developer prepare for their daily standup meeting.
 
 Generate a standup summary from the following work logs covering the past {days} day(s):
@@ -36,3 +67,22 @@ Create a compact paragraph (3-5 sentences) covering:
 Keep it professional but conversational. Use past tense for completed work.
 
 Your standup summary:"""
+
+GENERATE_REPORT_PROMPT = """You are helping a developer prepare a {period} summary for a sprint review.
+
+Summarize the work for {period_label} from the standup summaries and work logs below.
+
+STANDUP SUMMARIES:
+{dailies}
+
+WORK LOGS:
+{logs}
+
+Write 1-3 short paragraphs covering:
+1. The main themes and outcomes of the {period} (group related items, don't list every commit)
+2. Notable fixes, releases or decisions
+3. Recurring obstacles or open threads carried into the next {period}
+
+Keep it factual and professional. Use past tense.
+
+Your {period} summary:"""
@@ -0,0 +1,174 @@
+"""Record/replay LLM provider for deterministic offline runs."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..database.models import is_degraded
+from .base import LLMProvider, format_report_inputs
+from .prompts import COMPRESS_COMMIT_PROMPT, GENERATE_DAILY_PROMPT, GENERATE_REPORT_PROMPT
+
+MODES = ('replay', 'record', 'auto')
+
+
+class ReplayProvider(LLMProvider):
+    """
+    Replays provider responses from a cassette file.
+
+    In 'record' mode every call goes to the upstream provider and the prompt
+    hash, response and latency are appended to the cassette (JSON Lines).
+    Failure placeholders and calls that raise are never recorded.
+    'replay' answers only from the cassette; 'auto' replays hits and records
+    misses. Replayed calls sleep for the recorded latency unless
+    latency is 'none'.
+    """
+
+    # get_provider passes the full config so the upstream provider can be built
+    wraps_provider = True
+
+    def __init__(self, config: Dict, root_config: Optional[Dict] = None):
+        super().__init__(config)
+        self.mode = config.get('mode', 'replay')
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown replay mode: {self.mode} (use one of: {', '.join(MODES)})")
+
+        self.cassette_path = Path(os.path.expanduser(config.get('cassette', '~/.jrnl/cassettes/default.jsonl')))
+        self.upstream_name = config.get('upstream', 'anthropic')
+        self.replay_latency = config.get('latency', 'original') != 'none'
+        self.root_config = root_config or {}
+
+        self._upstream = None
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def upstream(self) -> LLMProvider:
+        """The real provider used for recording, built on first use."""
+        if self._upstream is None:
+            from . import get_provider
+            if self.upstream_name == 'replay':
+                raise ValueError("Replay provider cannot use itself as upstream")
+            self._upstream = get_provider(dict(self.root_config, active_llm_provider=self.upstream_name))
+        return self._upstream
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            entries = {}
+            try:
+                with open(self.cassette_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Partially written line from an interrupted recording
+                        if is_degraded(entry.get('response') or ''):
+                            continue  # Placeholder recorded before they were skipped
+                        entries[entry['key']] = entry
+            except FileNotFoundError:
+                pass
+            self._entries = entries
+        return self._entries
+
+    def _record(self, entry: Dict):
+        self.cassette_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cassette_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._entries[entry['key']] = entry
+
+    def _call(self, kind: str, prompt: str, upstream_call: Callable[[], str]) -> Optional[str]:
+        """Return a replayed or freshly recorded response, or None on a replay miss."""
+        key = hashlib.sha256(f"{kind}\0{prompt}".encode('utf-8')).hexdigest()
+
+        if self.mode != 'record':
+            with self._lock:
+                entry = self._load().get(key)
+            if entry is not None:
+                if self.replay_latency and entry.get('latency'):
+                    time.sleep(entry['latency'])
+                return entry['response']
+            if self.mode == 'replay':
+                return None
+
+        # A call that raises propagates before anything is recorded
+        start = time.perf_counter()
+        response = upstream_call()
+        latency = time.perf_counter() - start
+
+        # A failure placeholder would replay an outage as a permanent answer
+        if is_degraded(response):
+            return response
+
+        with self._lock:
+            self._load()
+            self._record({
+                'key': key,
+                'kind': kind,
+                'upstream': self.upstream_name,
+                'latency': round(latency, 4),
+                'recorded_at': datetime.now(timezone.utc).isoformat(),
+                'response': response,
+            })
+        return response
+
+    def compress_commit(self, commit_message: str, commit_diff: str) -> str:
+        """Compress commit from the cassette."""
+        prompt = COMPRESS_COMMIT_PROMPT.format(
+            commit_message=commit_message,
+            commit_diff=commit_diff
+        )
+        response = self._call('compress_commit', prompt,
+                              lambda: self.upstream.compress_commit(commit_message, commit_diff))
+        if response is None:
+            return f"[Replay Miss] {commit_message}"
+        return response
+
+    def compress_large_commit(self, commit_message: str, commit_diff: str,
+                              chunks: Sequence[Tuple[str, str]]) -> str:
+        """Compress a large commit from the cassette, keyed by all of its parts."""
+        prompt = "\0".join([commit_message] + [f"{files}\0{diff}" for files, diff in chunks])
+        response = self._call('compress_large_commit', prompt,
+                              lambda: self.upstream.compress_large_commit(commit_message, commit_diff, chunks))
+        if response is None:
+            return f"[Replay Miss] {commit_message}"
+        return response
+
+    def generate_daily(self, logs: List[Dict], days: int = 1) -> str:
+        """Generate daily standup from the cassette."""
+        log_text = "\n".join([
+            f"- [{log['type']}] {log['log_message']}"
+            for log in logs
+        ])
+        prompt = GENERATE_DAILY_PROMPT.format(days=days, logs=log_text)
+
+        response = self._call('generate_daily', prompt,
+                              lambda: self.upstream.generate_daily(logs, days))
+        if response is None:
+            raise RuntimeError(f"No recorded standup for these logs in cassette {self.cassette_path}")
+        return response
+
+    def generate_report(self, period: str, period_label: str,
+                        dailies: List[Dict], logs: List[Dict]) -> str:
+        """Generate weekly/monthly summary from the cassette."""
+        prompt = GENERATE_REPORT_PROMPT.format(
+            period=period,
+            period_label=period_label,
+            **format_report_inputs(dailies, logs)
+        )
+        response = self._call('generate_report', prompt,
+                              lambda: self.upstream.generate_report(period, period_label, dailies, logs))
+        if response is None:
+            raise RuntimeError(f"No recorded {period} summary for these entries in cassette {self.cassette_path}")
+        return response
+
+    def test_connection(self) -> bool:
+        """Replay needs a cassette; recording needs the upstream provider."""
+        if self.mode == 'replay':
+            return self.cassette_path.exists()
+        return self.upstream.test_connection()
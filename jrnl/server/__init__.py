@@ -0,0 +1,6 @@
+"""Team journal server: collects logs pushed by team members and builds team standups."""
+
+from .store import TeamStore
+from .app import TeamServer
+
+__all__ = ['TeamStore', 'TeamServer']
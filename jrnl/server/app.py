@@ -0,0 +1,292 @@
+"""
+HTTP API for the team journal server.
+
+    GET  /api/v1/health
+    POST /api/v1/ingest                      {"user", "logs": [...], "dailies": [...]}
+    GET  /api/v1/users
+    GET  /api/v1/users/<user>/logs           ?since=&until=&limit=
+    GET  /api/v1/users/<user>/summary        ?date=YYYY-MM-DD
+    GET  /api/v1/team/logs                   ?since=&until=&limit=
+    GET  /api/v1/team/standup                ?date=YYYY-MM-DD (default: today, UTC)
+
+When a token is configured every request except the health check must send
+`Authorization: Bearer <token>`.
+"""
+
+import hmac
+import json
+import re
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .store import TeamStore, LOG_FIELDS, DAILY_FIELDS
+from .summaries import SummaryRefresher, team_standup, user_day_summary
+
+MAX_BODY_BYTES = 32 * 1024 * 1024
+MAX_BATCH_ROWS = 50000
+MAX_LIMIT = 5000
+
+USER_PATH_RE = re.compile(r'^/api/v1/users/([^/]+)/(logs|summary)$')
+
+
+class BadRequest(Exception):
+    """Client error reported as HTTP 400."""
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _parse_day(value: Optional[str]) -> str:
+    if not value:
+        return _today()
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise BadRequest(f"Invalid date: {value} (expected YYYY-MM-DD)")
+
+
+def _parse_limit(value: Optional[str], default: int = 500) -> int:
+    if not value:
+        return default
+    if not value.isdigit():
+        raise BadRequest(f"Invalid limit: {value}")
+    return min(int(value), MAX_LIMIT)
+
+
+def _validate_rows(rows, required, kind):
+    if not isinstance(rows, list):
+        raise BadRequest(f"'{kind}' must be a list")
+    if len(rows) > MAX_BATCH_ROWS:
+        raise BadRequest(f"Too many {kind} in one batch (max {MAX_BATCH_ROWS})")
+    for row in rows:
+        if not isinstance(row, dict):
+            raise BadRequest(f"Each entry in '{kind}' must be an object")
+        missing = [field for field in required if not isinstance(row.get(field), str)]
+        if missing:
+            raise BadRequest(f"Entry in '{kind}' is missing {', '.join(missing)}")
+
+
+class TeamRequestHandler(BaseHTTPRequestHandler):
+    """Request handler; state lives on the server (`store`, `provider`, ...)."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            raise BadRequest(f"Request body too large (max {MAX_BODY_BYTES} bytes)")
+        raw = self.rfile.read(length) if length else b''
+        try:
+            payload = json.loads(raw or b'{}')
+        except ValueError:
+            raise BadRequest("Request body is not valid JSON")
+        if not isinstance(payload, dict):
+            raise BadRequest("Request body must be a JSON object")
+        return payload
+
+    def _authorized(self) -> bool:
+        token = self.server.token
+        if not token:
+            return True
+        header = self.headers.get('Authorization', '')
+        return hmac.compare_digest(header.encode(), f"Bearer {token}".encode())
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        if url.path != '/api/v1/health' and not self._authorized():
+            # Drain the body so the connection can be reused
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            self._send_json(401, {'error': 'unauthorized'})
+            return
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            status, payload = self._route(method, url.path, query)
+        except BadRequest as e:
+            status, payload = 400, {'error': str(e)}
+        except sqlite3.Error as e:
+            status, payload = 500, {'error': f"Database error: {e}"}
+        except RuntimeError as e:  # From LLM providers
+            status, payload = 502, {'error': str(e)}
+        except ValueError as e:  # Provider not configured (missing API key, unknown provider)
+            status, payload = 503, {'error': str(e)}
+        except Exception as e:
+            status, payload = 500, {'error': f"Internal error: {type(e).__name__}: {e}"}
+        self._send_json(status, payload)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _route(self, method: str, path: str, query: dict):
+        server = self.server
+        store: TeamStore = server.store
+
+        if method == 'POST':
+            if path == '/api/v1/ingest':
+                return 200, self._ingest()
+            return 404, {'error': 'not found'}
+
+        if path == '/api/v1/health':
+            return 200, {'status': 'ok'}
+        if path == '/api/v1/users':
+            return 200, {'users': store.list_users()}
+        if path == '/api/v1/team/logs':
+            return 200, {'logs': store.get_logs(
+                since=query.get('since'), until=query.get('until'),
+                limit=_parse_limit(query.get('limit'))
+            )}
+        if path == '/api/v1/team/standup':
+            day = _parse_day(query.get('date'))
+            return 200, team_standup(store, server.get_provider(), day, server.max_workers)
+
+        match = USER_PATH_RE.match(path)
+        if match:
+            user, resource = unquote(match.group(1)), match.group(2)
+            if resource == 'logs':
+                return 200, {'user': user, 'logs': store.get_logs(
+                    user=user, since=query.get('since'), until=query.get('until'),
+                    limit=_parse_limit(query.get('limit'))
+                )}
+            day = _parse_day(query.get('date'))
+            summary = user_day_summary(store, server.get_provider(), user, day)
+            return 200, {'user': user, 'date': day, 'summary': summary}
+
+        return 404, {'error': 'not found'}
+
+    def _ingest(self) -> dict:
+        payload = self._read_json()
+        user = payload.get('user')
+        if not isinstance(user, str) or not user.strip():
+            raise BadRequest("'user' is required")
+        logs = payload.get('logs', [])
+        dailies = payload.get('dailies', [])
+        _validate_rows(logs, ('label', 'timestamp', 'log_message'), 'logs')
+        _validate_rows(dailies, ('daily_date', 'daily_message', 'timestamp'), 'dailies')
+
+        inserted, updated, dailies_stored, touched = self.server.store.ingest(
+            user.strip(),
+            ({field: log.get(field) for field in LOG_FIELDS} for log in logs),
+            ({field: daily.get(field) for field in DAILY_FIELDS} for daily in dailies)
+        )
+        if self.server.refresher:
+            self.server.refresher.mark(touched)
+        return {
+            'logs_received': len(logs),
+            'logs_inserted': inserted,
+            'logs_updated': updated,
+            'dailies_stored': dailies_stored
+        }
+
+
+class TeamHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Hundreds of clients may connect at once when a team pushes together
+    request_queue_size = 1024
+
+
+class TeamServer:
+    """Team journal server that can be run in the foreground or started in a thread."""
+
+    def __init__(self, db_path: Path, host: str = '127.0.0.1', port: int = 8787,
+                 token: Optional[str] = None, provider_factory=None,
+                 refresh_interval: Optional[float] = 60.0, max_workers: int = 4,
+                 quiet: bool = False):
+        """
+        Args:
+            db_path: Team database file (created in WAL mode)
+            token: Shared bearer token required from clients, if set
+            provider_factory: Callable returning the LLM provider for summaries;
+                called on first use so the server starts without one configured
+            refresh_interval: Seconds between background summary refreshes,
+                or None to only summarize on request
+        """
+        self.store = TeamStore(db_path)
+        self._provider_factory = provider_factory
+        self._provider = None
+        self._provider_lock = threading.Lock()
+
+        self.httpd = TeamHTTPServer((host, port), TeamRequestHandler)
+        self.httpd.store = self.store
+        self.httpd.token = token
+        self.httpd.quiet = quiet
+        self.httpd.max_workers = max_workers
+        self.httpd.get_provider = self.get_provider
+        self.httpd.refresher = None
+        if refresh_interval and provider_factory:
+            self.httpd.refresher = SummaryRefresher(
+                self.store, _LazyProvider(self), refresh_interval, max_workers
+            )
+        self.thread = None
+
+    def get_provider(self):
+        with self._provider_lock:
+            if self._provider is None:
+                if self._provider_factory is None:
+                    raise RuntimeError("No LLM provider configured for summaries")
+                self._provider = self._provider_factory()
+            return self._provider
+
+    @property
+    def refresher(self) -> Optional[SummaryRefresher]:
+        return self.httpd.refresher
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        if self.refresher:
+            self.refresher.start()
+        try:
+            self.httpd.serve_forever()
+        finally:
+            if self.refresher:
+                self.refresher.stop()
+            self.httpd.server_close()
+
+    def start(self) -> 'TeamServer':
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        if self.thread:
+            self.thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _LazyProvider:
+    """Defers provider creation until the refresher first needs it."""
+
+    def __init__(self, server: TeamServer):
+        self._server = server
+
+    def generate_daily(self, logs, days: int = 1) -> str:
+        return self._server.get_provider().generate_daily(logs=logs, days=days)
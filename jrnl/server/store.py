@@ -0,0 +1,236 @@
+"""SQLite store for the team journal server."""
+
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+TEAM_SCHEMA = """
+CREATE TABLE IF NOT EXISTS team_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user TEXT NOT NULL,
+    label TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    log_message TEXT NOT NULL,
+    type TEXT NOT NULL,
+    repo TEXT,
+    received_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user, label)
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_logs_timestamp ON team_logs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_team_logs_user_timestamp ON team_logs(user, timestamp);
+
+CREATE TABLE IF NOT EXISTS team_dailies (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user TEXT NOT NULL,
+    daily_date TEXT NOT NULL,
+    daily_message TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    UNIQUE(user, daily_date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_dailies_date ON team_dailies(daily_date);
+
+-- One summary per user per UTC day, reused by every team standup for that day
+CREATE TABLE IF NOT EXISTS user_day_summaries (
+    user TEXT NOT NULL,
+    day TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    source_count INTEGER NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (user, day)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_team_logs_insert_summary AFTER INSERT ON team_logs
+BEGIN
+    UPDATE user_day_summaries SET stale = 1
+    WHERE user = NEW.user AND day = substr(NEW.timestamp, 1, 10);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_team_logs_update_summary AFTER UPDATE ON team_logs
+BEGIN
+    UPDATE user_day_summaries SET stale = 1
+    WHERE user = NEW.user AND day IN (substr(OLD.timestamp, 1, 10), substr(NEW.timestamp, 1, 10));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_team_dailies_insert_summary AFTER INSERT ON team_dailies
+BEGIN
+    UPDATE user_day_summaries SET stale = 1
+    WHERE user = NEW.user AND day = NEW.daily_date;
+END;
+"""
+
+LOG_FIELDS = ('label', 'timestamp', 'log_message', 'type', 'repo')
+DAILY_FIELDS = ('daily_date', 'daily_message', 'timestamp')
+
+
+class TeamStore:
+    """
+    Team journal database in WAL mode.
+
+    Each thread gets its own connection so readers never wait on each
+    other; writes go through one lock so concurrent pushes queue in-process
+    instead of spinning on SQLITE_BUSY.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        conn = self._connect()
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(TEAM_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def ingest(self, user: str, logs: Iterable[Dict],
+               dailies: Iterable[Dict]) -> Tuple[int, int, int, Set[Tuple[str, str]]]:
+        """
+        Store a batch pushed by one client in a single transaction.
+
+        Logs are upserted by (user, label), so a log the client repaired
+        replaces the copy sent earlier and marks that day's summary stale.
+        Dailies replace the user's daily for that date. Returns (logs
+        inserted, logs updated, dailies stored, touched (user, day) pairs).
+        """
+        log_rows = [
+            (user, log['label'], log['timestamp'], log['log_message'],
+             log.get('type') or 'manual', log.get('repo'))
+            for log in logs
+        ]
+        daily_rows = [
+            (user, daily['daily_date'], daily['daily_message'], daily['timestamp'])
+            for daily in dailies
+        ]
+
+        conn = self.conn
+        with self._write_lock:
+            with conn:
+                # rowcount, unlike total_changes, leaves out rows the summary triggers touch
+                logs_inserted = conn.executemany(
+                    '''INSERT OR IGNORE INTO team_logs
+                       (user, label, timestamp, log_message, type, repo)
+                       VALUES (?, ?, ?, ?, ?, ?)''',
+                    log_rows
+                ).rowcount
+                logs_updated = conn.executemany(
+                    '''UPDATE team_logs SET timestamp = ?, log_message = ?, type = ?, repo = ?
+                       WHERE user = ? AND label = ?
+                         AND (timestamp != ? OR log_message != ? OR type != ? OR repo IS NOT ?)''',
+                    [(timestamp, message, log_type, repo, row_user, label, timestamp, message, log_type, repo)
+                     for row_user, label, timestamp, message, log_type, repo in log_rows]
+                ).rowcount
+                conn.executemany(
+                    '''INSERT OR REPLACE INTO team_dailies
+                       (user, daily_date, daily_message, timestamp)
+                       VALUES (?, ?, ?, ?)''',
+                    daily_rows
+                )
+
+        touched = {(user, row[2][:10]) for row in log_rows}
+        touched.update((user, row[1]) for row in daily_rows)
+        return logs_inserted, logs_updated, len(daily_rows), touched
+
+    def list_users(self) -> List[Dict]:
+        cursor = self.conn.execute(
+            '''SELECT user, COUNT(*) AS logs, MAX(timestamp) AS last_log
+               FROM team_logs GROUP BY user ORDER BY user'''
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_logs(self, user: Optional[str] = None, since: Optional[str] = None,
+                 until: Optional[str] = None, limit: int = 500) -> List[Dict]:
+        """Logs newest first, optionally for one user and a [since, until) range."""
+        clauses, params = [], []
+        if user is not None:
+            clauses.append('user = ?')
+            params.append(user)
+        if since:
+            clauses.append('timestamp >= ?')
+            params.append(since)
+        if until:
+            clauses.append('timestamp < ?')
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        cursor = self.conn.execute(
+            f'''SELECT user, label, timestamp, log_message, type, repo FROM team_logs
+                {where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?''',
+            params + [limit]
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_daily(self, user: str, day: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            'SELECT daily_date, daily_message, timestamp FROM team_dailies WHERE user = ? AND daily_date = ?',
+            (user, day)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def users_active_on(self, day: str) -> List[str]:
+        """Users with logs or a daily on a UTC day."""
+        cursor = self.conn.execute(
+            '''SELECT user FROM team_logs WHERE timestamp >= ? AND timestamp < ?
+               UNION
+               SELECT user FROM team_dailies WHERE daily_date = ?
+               ORDER BY user''',
+            (day, next_day(day), day)
+        )
+        return [row['user'] for row in cursor.fetchall()]
+
+    def get_summary(self, user: str, day: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            'SELECT summary, source_count, stale, timestamp FROM user_day_summaries WHERE user = ? AND day = ?',
+            (user, day)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def put_summary(self, user: str, day: str, summary: str, source_count: int,
+                    timestamp: str, from_logs: bool = False):
+        """
+        Store a user-day summary.
+
+        For summaries generated from logs, the row stays stale if more logs
+        for that day arrived while the summary was being generated.
+        """
+        conn = self.conn
+        with self._write_lock:
+            with conn:
+                stale = 0
+                if from_logs:
+                    current = conn.execute(
+                        'SELECT COUNT(*) FROM team_logs WHERE user = ? AND timestamp >= ? AND timestamp < ?',
+                        (user, day, next_day(day))
+                    ).fetchone()[0]
+                    stale = int(current != source_count)
+                conn.execute(
+                    '''INSERT OR REPLACE INTO user_day_summaries
+                       (user, day, summary, source_count, stale, timestamp)
+                       VALUES (?, ?, ?, ?, ?, ?)''',
+                    (user, day, summary, source_count, stale, timestamp)
+                )
+
+
+def next_day(day: str) -> str:
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
@@ -0,0 +1,125 @@
+"""Per-user day summaries and the team standups built from them."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from ..database.models import is_degraded
+from ..utils.date_utils import get_utc_now
+from .store import TeamStore, next_day
+
+# Only days this recent are summarized in the background; older days (e.g.
+# from a first push of someone's history) are summarized on request
+REFRESH_RECENT_DAYS = 2
+
+
+def user_day_summary(store: TeamStore, provider, user: str, day: str) -> Optional[str]:
+    """
+    Return a user's summary for a UTC day, generating it if missing or stale.
+
+    A daily the user pushed for that date is used as-is; otherwise the
+    user's logs for the day go through the provider once and the result is
+    stored. Returns None if the user has nothing for the day; raises
+    RuntimeError if the provider fails, leaving nothing cached.
+    """
+    cached = store.get_summary(user, day)
+    if cached and not cached['stale']:
+        return cached['summary']
+
+    daily = store.get_daily(user, day)
+    if daily:
+        store.put_summary(user, day, daily['daily_message'], 1, get_utc_now())
+        return daily['daily_message']
+
+    logs = store.get_logs(user=user, since=day, until=next_day(day), limit=10000)
+    if not logs:
+        return None
+    logs.reverse()  # Oldest first, like `jrnl daily`
+    summary = provider.generate_daily(logs=logs, days=1)
+    if is_degraded(summary):
+        # Providers may report failure as an error placeholder; caching it
+        # would serve the error as this user's summary from now on
+        raise RuntimeError(summary)
+    store.put_summary(user, day, summary, len(logs), get_utc_now(), from_logs=True)
+    return summary
+
+
+def team_standup(store: TeamStore, provider, day: str, max_workers: int = 4) -> Dict:
+    """
+    Assemble the team standup for a UTC day from per-user summaries.
+
+    Only missing or stale summaries reach the provider, several at a time;
+    the team view itself is built without another LLM call.
+    """
+    users = store.users_active_on(day)
+
+    def summarize(user):
+        return user, user_day_summary(store, provider, user, day)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        results = list(pool.map(summarize, users))
+
+    sections = [{'user': user, 'summary': summary} for user, summary in results if summary]
+    text = "\n\n".join(f"## {s['user']}\n{s['summary']}" for s in sections)
+    return {'date': day, 'users': sections, 'standup': text}
+
+
+class SummaryRefresher:
+    """
+    Background thread that keeps recent user-day summaries fresh.
+
+    Ingestion marks (user, day) pairs dirty; every `interval` seconds the
+    pending set is summarized, so a burst of pushes from one person costs a
+    single provider call and standup requests find summaries ready.
+    """
+
+    def __init__(self, store: TeamStore, provider, interval: float = 60.0, max_workers: int = 4):
+        self.store = store
+        self.provider = provider
+        self.interval = interval
+        self.max_workers = max_workers
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def mark(self, pairs):
+        """Queue (user, day) pairs touched by an ingest."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=REFRESH_RECENT_DAYS)).date().isoformat()
+        with self._lock:
+            self._pending.update(pair for pair in pairs if pair[1] >= cutoff)
+
+    def start(self) -> 'SummaryRefresher':
+        self._thread = threading.Thread(target=self._run, name='summary-refresher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def refresh_pending(self) -> List[tuple]:
+        """Summarize everything queued so far. Returns the pairs processed."""
+        with self._lock:
+            pairs = sorted(self._pending)
+            self._pending.clear()
+        if not pairs:
+            return pairs
+
+        def refresh(pair):
+            user, day = pair
+            try:
+                user_day_summary(self.store, self.provider, user, day)
+            except Exception:
+                # Leave it stale; the next ingest or a standup request retries
+                pass
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            list(pool.map(refresh, pairs))
+        return pairs
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.refresh_pending()
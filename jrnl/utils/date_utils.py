@@ -1,7 +1,7 @@
 """Date and time utilities."""
 
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 
 def get_utc_now() -> str:
@@ -28,11 +28,54 @@ def get_datetime_ago(days: int = 0, hours: int = 0) -> str:
     return dt.isoformat()
 
 
-def format_relative_time(timestamp: str) -> str:
-    """Format timestamp as relative time (e.g., '2 hours ago')."""
+def get_period_bounds(period_type: str, ref: Optional[date] = None, ago: int = 0) -> Tuple[str, str]:
+    """
+    Get (start, end) dates of the week or month containing ref, shifted back by `ago` periods.
+
+    Weeks start on Monday. Start is inclusive, end exclusive, both YYYY-MM-DD.
+    """
+    ref = ref or date.today()
+    if period_type == 'week':
+        start = ref - timedelta(days=ref.weekday()) - timedelta(weeks=ago)
+        end = start + timedelta(weeks=1)
+    elif period_type == 'month':
+        month_index = ref.year * 12 + (ref.month - 1) - ago
+        start = date(month_index // 12, month_index % 12 + 1, 1)
+        end = date((month_index + 1) // 12, (month_index + 1) % 12 + 1, 1)
+    else:
+        raise ValueError(f"Unknown period type: {period_type}")
+    return start.isoformat(), end.isoformat()
+
+
+DURATION_UNITS = {'d': 1, 'w': 7, 'm': 30, 'y': 365}
+
+
+def parse_duration_days(text: str) -> int:
+    """
+    Parse a duration like '180d', '12w', '6m' or '1y' into days.
+
+    A bare number is read as days. Raises ValueError on anything else.
+    """
+    text = text.strip().lower()
+    if text.isdigit():
+        return int(text)
+    number, unit = text[:-1], text[-1:]
+    if unit not in DURATION_UNITS or not number.isdigit():
+        raise ValueError(f"Invalid duration: {text!r} (use e.g. 180d, 12w, 6m, 1y)")
+    return int(number) * DURATION_UNITS[unit]
+
+
+def format_relative_time(timestamp: str, now: Optional[datetime] = None) -> str:
+    """
+    Format timestamp as relative time (e.g., '2 hours ago').
+
+    Pass a shared timezone-aware `now` when formatting many rows to avoid
+    a clock read per row.
+    """
     try:
         dt = parse_iso_datetime(timestamp)
-        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
+        if now is None:
+            now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
 
         # Make both timezone-aware or both naive
         if dt.tzinfo is None:
@@ -1,12 +1,14 @@
 """Output formatting utilities."""
 
+from datetime import datetime
+from typing import Optional, Union
 from .date_utils import format_relative_time
-from ..database.models import Log
+from ..database.models import Log, LogRow
 
 
-def format_log_entry(log: Log) -> str:
+def format_log_entry(log: Union[Log, LogRow], now: Optional[datetime] = None) -> str:
     """Format a log entry for display."""
-    time_str = format_relative_time(log.timestamp)
+    time_str = format_relative_time(log.timestamp, now)
     type_badge = "[GIT]" if log.type == "git-hook" else "[MAN]"
 
     return f"{type_badge} {time_str:20} {log.label:10} {log.log_message}"
@@ -17,6 +19,28 @@ def format_daily_header(date_str: str) -> str:
     return f"\n{'='*60}\nSTANDUP - {date_str}\n{'='*60}\n"
 
 
+def format_report_header(period_type: str, start: str, end: str) -> str:
+    """Format a header for weekly/monthly report output."""
+    from datetime import date, timedelta
+    last_day = (date.fromisoformat(end) - timedelta(days=1)).isoformat()
+    return f"\n{'='*60}\n{period_type.upper()}LY REPORT - {start} to {last_day}\n{'='*60}\n"
+
+
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+
+
+def format_sparkline(values) -> str:
+    """Render numbers as a one-line bar chart. Zero is a space."""
+    peak = max(values, default=0)
+    if peak <= 0:
+        return ' ' * len(values)
+    scale = len(SPARK_CHARS) - 1
+    return ''.join(
+        SPARK_CHARS[round(value / peak * scale)] if value > 0 else ' '
+        for value in values
+    )
+
+
 def format_success(message: str) -> str:
     """Format a success message."""
     return f"✓ {message}"
@@ -0,0 +1,127 @@
+"""
+MinHash signatures for spotting near-duplicate log messages.
+
+Each message is reduced to a set of features (normalized words and word
+pairs) and summarized as NUM_PERM minimum hash values. The fraction of
+positions where two signatures agree estimates the Jaccard similarity of
+their feature sets, so "Fixed typo in README" and "Fix typo in README"
+match while "Fixed typo in README" and "Addressed review comments" don't.
+
+Signatures are computed once when a log is written and stored with it;
+collapsing a day's logs then only compares stored bytes.
+"""
+
+import hashlib
+import random
+import re
+import struct
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+NUM_PERM = 64
+
+# Signatures are split into bands of BAND_ROWS values and only clusters
+# sharing bands with a new signature are compared against it
+BAND_ROWS = 2
+
+# Estimated Jaccard similarity at or above which two messages are collapsed
+DEFAULT_THRESHOLD = 0.6
+
+SIGNATURE_FORMAT = f'<{NUM_PERM}I'
+
+_PRIME = (1 << 61) - 1
+_MASK = 0xFFFFFFFF
+_rng = random.Random(0x6A726E6C)  # Fixed seed: stored signatures must stay comparable
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_STOPWORDS = frozenset(('a', 'an', 'the', 'to', 'in', 'on', 'of', 'for', 'and', 'with'))
+_SUFFIXES = ('ing', 'ed', 'es', 's')
+
+
+def _stem(word: str) -> str:
+    """Crude suffix stripping so "Fixed", "Fixes" and "Fix" share a feature."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith('ss'):
+            word = word[:-len(suffix)]
+            break
+    return word[:-1] if len(word) > 3 and word.endswith('e') else word
+
+
+def features(text: str) -> set:
+    """Normalized words and adjacent word pairs of a message."""
+    words = [_stem(w) for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS]
+    found = set(words)
+    found.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return found or {text.strip().lower()}
+
+
+def signature(text: str) -> bytes:
+    """MinHash signature of a message, packed as NUM_PERM little-endian uint32s."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+        for feature in features(text)
+    ]
+    values = [min(((a * h + b) % _PRIME) & _MASK for h in hashes) for a, b in _PERMUTATIONS]
+    return struct.pack(SIGNATURE_FORMAT, *values)
+
+
+def similarity(sig_a: bytes, sig_b: bytes) -> float:
+    """Estimated Jaccard similarity of the messages behind two signatures."""
+    a = struct.unpack(SIGNATURE_FORMAT, sig_a)
+    b = struct.unpack(SIGNATURE_FORMAT, sig_b)
+    return sum(map(int.__eq__, a, b)) / NUM_PERM
+
+
+def cluster(signatures: Sequence[bytes], threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """
+    Group near-duplicate signatures.
+
+    Each signature joins the most similar earlier cluster whose first member
+    is at least threshold-similar, or starts a new one. Returns clusters of
+    indexes, ordered by their first member.
+    """
+    values = [struct.unpack(SIGNATURE_FORMAT, sig) for sig in signatures]
+    # Matching bands track similarity (a pair at similarity s is expected to
+    # share NUM_PERM / BAND_ROWS * s ** BAND_ROWS bands); candidates with
+    # well under the expected count for the threshold are not worth comparing
+    min_bands = max(1, int(NUM_PERM // BAND_ROWS * threshold ** BAND_ROWS / 2))
+
+    clusters: List[List[int]] = []
+    buckets: Dict[tuple, List[int]] = {}
+    for index, sig in enumerate(values):
+        bands = [(i, sig[i:i + BAND_ROWS]) for i in range(0, NUM_PERM, BAND_ROWS)]
+        shared = Counter(c for band in bands for c in buckets.get(band, ()))
+        best, best_score = None, 0.0
+        for c, count in sorted(shared.items()):
+            if count < min_bands:
+                continue
+            score = sum(map(int.__eq__, values[clusters[c][0]], sig)) / NUM_PERM
+            if score >= threshold and (best is None or score > best_score):
+                best, best_score = c, score
+        if best is None:
+            best = len(clusters)
+            clusters.append([])
+            for band in bands:
+                buckets.setdefault(band, []).append(best)
+        clusters[best].append(index)
+    return clusters
+
+
+def collapse_similar_logs(logs: List[Dict], signatures: Sequence[Optional[bytes]],
+                          threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Collapse near-duplicate log dicts into one entry per cluster.
+
+    The first log of a cluster stands for it; when the cluster has more
+    than one member its message gets an "(xN)" count. Logs without a
+    signature get one computed on the fly.
+    """
+    sigs = [sig or signature(log['log_message']) for log, sig in zip(logs, signatures)]
+    collapsed = []
+    for members in cluster(sigs, threshold):
+        first = dict(logs[members[0]])
+        if len(members) > 1:
+            first['log_message'] = f"{first['log_message']} (x{len(members)})"
+        collapsed.append(first)
+    return collapsed
@@ -0,0 +1,61 @@
+"""Pipe long output through the user's pager."""
+
+import os
+import shlex
+import subprocess
+import sys
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+DEFAULT_PAGER = 'less -FRX'
+
+
+def _print_line(line: str = '') -> bool:
+    print(line)
+    return True
+
+
+@contextmanager
+def paged_output(enabled: bool = True) -> Iterator[Callable[[str], bool]]:
+    """
+    Yield a write-line function that streams into $PAGER.
+
+    The function returns False once the reader has quit the pager, so callers
+    can stop producing rows instead of draining the whole query.
+
+    Falls back to plain stdout when disabled, when stdout is not a TTY, or
+    when the pager cannot be started. Lines are written as they are produced
+    so the first screen appears before the whole result set is read.
+    """
+    pager_cmd = os.environ.get('PAGER', DEFAULT_PAGER)
+    if not enabled or not sys.stdout.isatty() or not pager_cmd or pager_cmd == 'cat':
+        yield _print_line
+        return
+
+    try:
+        proc = subprocess.Popen(shlex.split(pager_cmd), stdin=subprocess.PIPE, text=True)
+    except (OSError, ValueError):
+        yield _print_line
+        return
+
+    closed = False
+
+    def write_line(line: str = '') -> bool:
+        nonlocal closed
+        if closed:
+            return False
+        try:
+            proc.stdin.write(line + '\n')
+        except BrokenPipeError:
+            # User quit the pager early
+            closed = True
+        return not closed
+
+    try:
+        yield write_line
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
@@ -0,0 +1,140 @@
+"""
+Lightweight per-phase tracing.
+
+Enabled with `jrnl --profile ...` or the JRNL_TRACE environment variable.
+Spans are recorded as Chrome trace events (open the file in chrome://tracing
+or https://ui.perfetto.dev) and summarized as one line per run in
+~/.jrnl/logs/trace.log. When tracing is off, span() returns a shared no-op
+context manager, so instrumented code pays one function call and a flag check.
+Only the last MAX_EVENTS events are kept, so a long-running traced process
+(the hook worker, an embedding backfill) holds a bounded amount of memory.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, Optional
+
+TRACE_DIR = Path.home() / '.jrnl' / 'logs'
+SUMMARY_FILE = TRACE_DIR / 'trace.log'
+
+# Oldest events are dropped beyond this many
+MAX_EVENTS = 100000
+
+_enabled = False
+_events: Deque[Dict] = deque(maxlen=MAX_EVENTS)
+_dropped = 0
+_origin = 0.0
+_NOOP = nullcontext()
+
+
+def enable():
+    """Start recording spans for this process."""
+    global _enabled, _origin, _dropped
+    if not _enabled:
+        _enabled = True
+        _origin = time.perf_counter()
+        _events.clear()
+        _dropped = 0
+
+
+def is_enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _enabled
+
+
+def env_requested() -> bool:
+    """Whether JRNL_TRACE asks for tracing."""
+    return os.environ.get('JRNL_TRACE', '').lower() not in ('', '0', 'false', 'no')
+
+
+def _now_us() -> float:
+    return (time.perf_counter() - _origin) * 1e6
+
+
+def _append(event: Dict):
+    global _dropped
+    if len(_events) == _events.maxlen:
+        _dropped += 1
+    _events.append(event)
+
+
+@contextmanager
+def _record(name: str, cat: str, args: Dict):
+    start = _now_us()
+    try:
+        yield
+    except (Exception, KeyboardInterrupt) as e:
+        args = dict(args, error=type(e).__name__)
+        raise
+    finally:
+        _append({
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': start,
+            'dur': _now_us() - start,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+
+def span(name: str, cat: str = 'jrnl', **args):
+    """Context manager timing a phase. `cat` groups spans in the summary line."""
+    if not _enabled:
+        return _NOOP
+    return _record(name, cat, args)
+
+
+def instant(name: str, cat: str = 'jrnl', **args):
+    """Record a point-in-time event such as an error."""
+    if _enabled:
+        _append({
+            'name': name, 'cat': cat, 'ph': 'i', 's': 't', 'ts': _now_us(),
+            'pid': os.getpid(), 'tid': threading.get_ident(), 'args': args,
+        })
+
+
+def summary_line(label: str) -> str:
+    """One line with total wall time and time per category (top-level spans per thread)."""
+    spans = [e for e in _events if e['ph'] == 'X']
+    total = max((e['ts'] + e['dur'] for e in spans), default=0.0) / 1e6
+
+    # Sum each category once per thread, ignoring spans nested inside a span of the same category
+    per_cat: Dict[str, float] = {}
+    open_until: Dict[tuple, float] = {}
+    for e in sorted(spans, key=lambda e: (e['ts'], -e['dur'])):
+        key = (e['tid'], e['cat'])
+        if e['ts'] < open_until.get(key, -1.0):
+            continue
+        open_until[key] = e['ts'] + e['dur']
+        per_cat[e['cat']] = per_cat.get(e['cat'], 0.0) + e['dur'] / 1e6
+
+    parts = ' '.join(f"{cat}={seconds:.3f}s" for cat, seconds in sorted(per_cat.items(), key=lambda i: -i[1]))
+    if _dropped:
+        parts += f" dropped={_dropped}"
+    return f"{datetime.now().isoformat()} {label} total={total:.3f}s {parts}".rstrip()
+
+
+def write_trace(label: str) -> Optional[Path]:
+    """Write the Chrome trace file and append the summary line. Returns the trace path."""
+    if not _enabled:
+        return None
+    try:
+        TRACE_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        path = TRACE_DIR / f"trace-{stamp}-{os.getpid()}.json"
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': list(_events), 'displayTimeUnit': 'ms',
+                       'otherData': {'command': label, 'droppedEvents': _dropped}}, f)
+        with open(SUMMARY_FILE, 'a') as f:
+            f.write(summary_line(label) + '\n')
+        return path
+    except OSError:
+        return None  # Tracing must never break a command
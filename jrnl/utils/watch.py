@@ -0,0 +1,130 @@
+"""Block until the journal database changes."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sqlite3
+import struct
+import time
+from pathlib import Path
+from typing import Optional
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+# data_version polling backoff bounds, in seconds
+POLL_MIN = 0.1
+POLL_MAX = 2.0
+
+
+class DatabaseWatcher:
+    """
+    Waits for commits to a SQLite database from other processes.
+
+    On Linux, blocks on inotify events for the database file and its
+    -journal/-wal siblings (the directory is watched, since those files come
+    and go). Elsewhere, polls `PRAGMA data_version` on a long-lived
+    connection with exponential backoff. Either way the process sleeps while
+    nothing is written.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._fd: Optional[int] = self._open_inotify()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._version: Optional[int] = None
+        self._poll_interval = POLL_MIN
+        if self._fd is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._version = self._data_version()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    def _open_inotify(self) -> Optional[int]:
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            return None
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            init = libc.inotify_init1
+            add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return None  # Not Linux
+
+        fd = init(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if add_watch(fd, str(self.db_path.parent).encode(), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _data_version(self) -> int:
+        return self._conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the database may have changed. Returns False on timeout."""
+        if self._fd is not None:
+            return self._wait_inotify(timeout)
+        return self._wait_poll(timeout)
+
+    def _wait_inotify(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        prefix = self.db_path.name
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return False
+
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+
+            # Only react to the database and its journal/WAL files
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                _, _, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                start = offset + EVENT_HEADER.size
+                name = data[start:start + name_len].rstrip(b'\0').decode(errors='replace')
+                offset = start + name_len
+                if name.startswith(prefix):
+                    return True
+
+    def _wait_poll(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            version = self._data_version()
+            if version != self._version:
+                self._version = version
+                self._poll_interval = POLL_MIN
+                return True
+
+            sleep_for = self._poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sleep_for = min(sleep_for, remaining)
+            time.sleep(sleep_for)
+            self._poll_interval = min(self._poll_interval * 2, POLL_MAX)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,109 @@
+"""Commit classifier on small throwaway repositories."""
+
+import os
+import subprocess
+
+import pytest
+
+from jrnl.git_integration.classifier import classify_commit
+
+
+@pytest.fixture
+def repo(tmp_path):
+    def git(*args):
+        subprocess.run(['git', '-C', str(tmp_path)] + list(args), check=True, capture_output=True)
+
+    git('init', '-q')
+    git('config', 'user.email', 'dev@example.com')
+    git('config', 'user.name', 'Dev')
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'a.py').write_text('x = 1\n')
+    (tmp_path / 'pkg' / '__init__.py').write_text('__version__ = "1.0"\nimport os\n')
+    (tmp_path / 'pyproject.toml').write_text('version = "1.0"\n')
+    git('add', '.')
+    git('commit', '-qm', 'Initial commit')
+
+    def commit(subject):
+        git('add', '-A')
+        git('commit', '-qm', subject)
+        head = subprocess.run(['git', '-C', str(tmp_path), 'rev-parse', 'HEAD'],
+                              check=True, capture_output=True, text=True).stdout.strip()
+        return classify_commit(str(tmp_path), head, subject)
+
+    return tmp_path, commit
+
+
+def test_mode_only_change(repo):
+    path, commit = repo
+    os.chmod(path / 'a.py', 0o755)
+    assert commit('Make script executable') == 'Changed file mode of a.py'
+
+
+def test_whitespace_with_mode_change_goes_to_llm(repo):
+    path, commit = repo
+    os.chmod(path / 'a.py', 0o755)
+    (path / 'a.py').write_text('x = 1  \n')
+    assert commit('Tidy') is None
+
+
+def test_whitespace_only(repo):
+    path, commit = repo
+    (path / 'a.py').write_text('x = 1  \n')
+    assert commit('Tidy') == 'Whitespace-only changes in 1 file'
+
+
+def test_version_bump_in_package_init(repo):
+    path, commit = repo
+    (path / 'pkg' / '__init__.py').write_text('__version__ = "1.1"\nimport os\n')
+    (path / 'pyproject.toml').write_text('version = "1.1"\n')
+    assert commit('Release 1.1') == 'Bumped version to 1.1'
+
+
+def test_code_change_in_package_init_is_not_a_bump(repo):
+    path, commit = repo
+    (path / 'pkg' / '__init__.py').write_text('__version__ = "1.1"\nimport os\nimport sys\n')
+    (path / 'pyproject.toml').write_text('version = "1.1"\n')
+    assert commit('Release 1.1') is None
+
+
+def test_release_version_comes_from_diff(repo):
+    path, commit = repo
+    (path / 'pyproject.toml').write_text('version = "1.2.0"\n')
+    (path / 'CHANGELOG.md').write_text('## 1.2.0\n- Things\n')
+    assert commit('Prepare release') == 'Bumped version to 1.2.0'
+
+
+def test_dependency_bump_is_not_a_release(repo):
+    path, commit = repo
+    (path / 'package.json').write_text('{\n  "version": "2.0.0",\n  "dependencies": {"lodash": "^4.17.20"}\n}\n')
+    (path / 'package-lock.json').write_text('{"packages": {"node_modules/lodash": {"version": "4.17.20"}}}\n')
+    commit('Add package.json')
+    (path / 'package.json').write_text('{\n  "version": "2.0.0",\n  "dependencies": {"lodash": "^4.17.21"}\n}\n')
+    (path / 'package-lock.json').write_text('{"packages": {"node_modules/lodash": {"version": "4.17.21"}}}\n')
+    assert commit('Bump lodash from 4.17.20 to 4.17.21') is None
+
+
+def test_release_with_lockfile_goes_to_llm(repo):
+    path, commit = repo
+    (path / 'package.json').write_text('{\n  "version": "2.0.0"\n}\n')
+    (path / 'package-lock.json').write_text('{"version": "2.0.0"}\n')
+    commit('Add package.json')
+    (path / 'package.json').write_text('{\n  "version": "2.1.0"\n}\n')
+    (path / 'package-lock.json').write_text('{"version": "2.1.0"}\n')
+    assert commit('2.1.0') is None
+
+
+def test_formatter_run(repo):
+    path, commit = repo
+    (path / 'a.py').write_text("call(first, second, third)\n")
+    commit('Add call')
+    (path / 'a.py').write_text('call(\n    first,\n    second,\n    third,\n)\n')
+    assert commit('Format with black') == 'Reformatted 1 file'
+
+
+def test_format_subject_with_code_change_goes_to_llm(repo):
+    path, commit = repo
+    (path / 'a.py').write_text('def show(amount):\n    return str(amount)\n')
+    commit('Add show')
+    (path / 'a.py').write_text('def show(amount):\n    return f"{amount:,}"\n')
+    assert commit('Format currency amounts with thousands separators') is None
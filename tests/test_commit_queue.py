@@ -0,0 +1,190 @@
+"""Hook queue and worker: batching, dedupe and rewrite handling."""
+
+import subprocess
+import threading
+
+import pytest
+
+from jrnl.commands import worker
+from jrnl.config import Config
+from jrnl.database import connection
+from jrnl.database.models import Log
+from jrnl.database.operations import get_all_logs, get_log_by_label, insert_log
+from jrnl.git_integration import commit_queue
+
+
+class FakeProvider:
+    """Stand-in LLM provider that records the commits it compresses."""
+
+    def __init__(self):
+        self.messages = []
+        self._lock = threading.Lock()
+
+    def compress_commit(self, commit_message, commit_diff):
+        with self._lock:
+            self.messages.append(commit_message)
+        return f"Summary of {commit_message.splitlines()[0]}"
+
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(connection, 'DB_PATH', tmp_path / 'jrnl.db')
+    monkeypatch.setattr(connection, '_schema_ready', False)
+    monkeypatch.setattr(Config, 'CONFIG_PATH', tmp_path / 'config.json')
+    queue_dir = tmp_path / 'queue'
+    monkeypatch.setattr(commit_queue, 'QUEUE_DIR', queue_dir)
+    monkeypatch.setattr(commit_queue, 'PENDING_FILE', queue_dir / 'pending')
+    monkeypatch.setattr(commit_queue, 'DEFERRED_FILE', queue_dir / 'deferred')
+    monkeypatch.setattr(commit_queue, 'LOCK_FILE', queue_dir / 'worker.lock')
+    monkeypatch.setattr(commit_queue, 'PID_FILE', queue_dir / 'worker.pid')
+    monkeypatch.setattr(commit_queue, 'SETTLE_SECONDS', 0)
+    queue_dir.mkdir()
+
+    provider = FakeProvider()
+    monkeypatch.setattr(worker, 'get_provider', lambda config: provider)
+    return provider
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / 'repo'
+    path.mkdir()
+
+    def git(*args):
+        return subprocess.run(['git', '-C', str(path)] + list(args),
+                              check=True, capture_output=True, text=True).stdout.strip()
+
+    git('init', '-q')
+    git('config', 'user.email', 'dev@example.com')
+    git('config', 'user.name', 'Dev')
+
+    def commit(subject):
+        (path / 'notes.txt').write_text(subject + '\n')
+        git('add', '-A')
+        git('commit', '-qm', subject)
+        return git('rev-parse', 'HEAD')
+
+    return path, git, commit
+
+
+def _queue(*entries):
+    with open(commit_queue.PENDING_FILE, 'a') as f:
+        for entry in entries:
+            f.write('\t'.join(entry) + '\n')
+
+
+def _labels():
+    return sorted(log.label for log in get_all_logs(limit=100))
+
+
+def test_parse_lines_dedupes_and_drops_malformed():
+    batch = commit_queue.parse_lines([
+        'commit\t/r\taaa', 'commit\t/r\taaa', 'commit\t/r', 'bogus',
+        'rebase-commit\t/r\tbbb', 'rewrite\t/r\tccc\tbbb',
+    ])
+    assert batch.commits == [('/r', 'aaa')]
+    assert batch.rebase_commits == [('/r', 'bbb')]
+    assert batch.rewrites == [('/r', 'ccc', 'bbb')]
+
+
+def test_take_batch_includes_deferred(journal):
+    assert commit_queue.take_batch() is None
+
+    commit_queue.defer([('/r', 'aaa')])
+    assert commit_queue.take_batch() is None  # Deferred work waits for new hook output
+
+    _queue(('commit', '/r', 'bbb'))
+    batch = commit_queue.take_batch()
+    assert batch.commits == [('/r', 'bbb')]
+    assert batch.rebase_commits == [('/r', 'aaa')]
+    assert not commit_queue.has_pending()
+    assert not commit_queue.DEFERRED_FILE.exists()
+
+
+def test_rebase_in_progress(repo):
+    path, git, commit = repo
+    git_dir = path / '.git'
+    assert not commit_queue.rebase_in_progress(str(path))
+
+    (git_dir / 'rebase-merge').mkdir()
+    assert commit_queue.rebase_in_progress(str(path))
+    (git_dir / 'rebase-merge').rmdir()
+
+    # git am uses rebase-apply too, marked by an "applying" file
+    (git_dir / 'rebase-apply').mkdir()
+    assert commit_queue.rebase_in_progress(str(path))
+    (git_dir / 'rebase-apply' / 'applying').touch()
+    assert not commit_queue.rebase_in_progress(str(path))
+
+
+def test_drain_compresses_each_commit_once(journal, repo):
+    path, git, commit = repo
+    first, second = commit('Add parser'), commit('Fix parser')
+    _queue(('commit', str(path), first), ('commit', str(path), second), ('commit', str(path), first))
+
+    worker.drain(max_workers=2)
+    assert _labels() == sorted([first[:8], second[:8]])
+    assert sorted(journal.messages) == ['Add parser', 'Fix parser']
+
+    # A repeated hook for a logged commit costs no LLM call
+    _queue(('commit', str(path), first))
+    worker.drain(max_workers=2)
+    assert len(journal.messages) == 2
+
+
+def test_rewrite_keeps_existing_summary(journal, repo):
+    path, git, commit = repo
+    old = commit('Add parser')
+    insert_log(Log(timestamp='2024-01-01T00:00:00', log_message='Added the parser',
+                   type='git-hook', label=old[:8], repo=str(path)))
+    git('commit', '-q', '--amend', '-m', 'Add parser (amended)')
+    new = git('rev-parse', 'HEAD')
+
+    _queue(('rebase-commit', str(path), new), ('rewrite', str(path), old, new))
+    worker.drain(max_workers=1)
+    assert _labels() == [new[:8]]
+    assert get_log_by_label(new[:8]).log_message == 'Added the parser'
+    assert journal.messages == []
+
+
+def test_squash_keeps_one_log(journal, repo):
+    path, git, commit = repo
+    first, second = commit('Add parser'), commit('Fix parser')
+    for sha, message in ((first, 'Added the parser'), (second, 'Fixed the parser')):
+        insert_log(Log(timestamp='2024-01-01T00:00:00', log_message=message,
+                       type='git-hook', label=sha[:8], repo=str(path)))
+    squashed = commit('Parser')
+
+    _queue(('rewrite', str(path), first, squashed), ('rewrite', str(path), second, squashed))
+    worker.drain(max_workers=1)
+    assert _labels() == [squashed[:8]]
+    assert get_log_by_label(squashed[:8]).log_message == 'Added the parser; Fixed the parser'
+
+
+def test_rebase_commit_waits_for_rebase_to_finish(journal, repo):
+    path, git, commit = repo
+    commit('Base')
+    (path / '.git' / 'rebase-merge').mkdir()
+    made_at_stop = commit('Split out helper')
+
+    _queue(('rebase-commit', str(path), made_at_stop))
+    worker.drain(max_workers=1)
+    assert _labels() == []
+    assert commit_queue.DEFERRED_FILE.exists()
+
+    # Not in the post-rewrite mapping, so it is logged once the rebase is done
+    (path / '.git' / 'rebase-merge').rmdir()
+    _queue(('rewrite', str(path), 'f' * 40, 'e' * 40))
+    worker.drain(max_workers=1)
+    assert _labels() == [made_at_stop[:8]]
+
+
+def test_aborted_rebase_commit_is_dropped(journal, repo):
+    path, git, commit = repo
+    commit('Base')
+    abandoned = commit('Picked during rebase')
+    git('reset', '-q', '--hard', 'HEAD~1')
+
+    _queue(('rebase-commit', str(path), abandoned))
+    worker.drain(max_workers=1)
+    assert _labels() == []
@@ -0,0 +1,64 @@
+"""Embedding index kept in step with the log_embeddings table."""
+
+import pytest
+
+from jrnl.database import connection
+from jrnl.database.models import Log
+from jrnl.database.operations import get_log_by_label, insert_log, update_log_messages
+from jrnl.embeddings import index as index_module
+from jrnl.embeddings.base import Embedder
+from jrnl.embeddings.index import EmbeddingIndex
+
+pytest.importorskip('numpy')
+
+WORDS = ['parser', 'login', 'error']
+
+
+class KeywordEmbedder(Embedder):
+    """Embeds a text as its counts of a few keywords."""
+
+    def embed(self, texts):
+        return [[text.count(word) + 0.01 for word in WORDS] for text in texts]
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setattr(connection, 'DB_PATH', tmp_path / 'jrnl.db')
+    monkeypatch.setattr(connection, '_schema_ready', False)
+    monkeypatch.setattr(index_module, 'INDEX_DIR', tmp_path / 'embeddings')
+    return EmbeddingIndex(KeywordEmbedder({'model': 'keywords'}))
+
+
+def _add(label, message):
+    insert_log(Log(timestamp='2024-05-01T10:00:00+00:00', log_message=message, type='manual', label=label))
+    return get_log_by_label(label).id
+
+
+def _top(index, query):
+    return index.search(query, k=1)[0][0]
+
+
+def test_new_logs_are_appended(index):
+    parser = _add('a', 'Fixed the parser')
+    _add('b', 'Fixed login')
+    index.update()
+    assert _top(index, 'parser') == parser
+
+    error = _add('c', 'Login error')
+    index.update()
+    assert _top(index, 'login error') == error
+    assert index.sync()['count'] == 3
+
+
+def test_reembedded_log_replaces_stale_vector(index):
+    repaired = _add('a', '[LLM Error] error error')
+    _add('b', 'Fixed login')
+    index.update()
+    assert _top(index, 'error') == repaired
+
+    # Repair drops the vector and the next update re-embeds the same log id
+    update_log_messages([(repaired, 'Rewrote the parser')])
+    assert index.update() == 1
+    assert index.sync()['count'] == 2
+    assert _top(index, 'parser') == repaired
+    assert index.search('error', k=2)[0][1] < 0.9
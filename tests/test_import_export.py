@@ -0,0 +1,56 @@
+"""Import record validation and export/import round trips."""
+
+import io
+
+import pytest
+
+from jrnl.commands.export_cmd import write_logs
+from jrnl.commands.import_cmd import ImportStats, read_csv, read_jsonl, to_log
+from jrnl.database import connection
+from jrnl.database.models import Log
+from jrnl.database.operations import insert_log
+
+
+def _record(**fields):
+    return dict({'timestamp': '2024-05-01T10:00:00+00:00', 'log_message': 'Did a thing',
+                 'type': 'manual', 'label': 'abc12345'}, **fields)
+
+
+@pytest.mark.parametrize('timestamp', ['yesterday', '2024-13-01T00:00:00', '10:00'])
+def test_invalid_timestamp_rejected(timestamp):
+    assert to_log(_record(timestamp=timestamp)) is None
+
+
+@pytest.mark.parametrize('timestamp, stored', [
+    ('2024-05-01T10:00:00+00:00', '2024-05-01T10:00:00+00:00'),
+    ('2024-05-01T10:00:00Z', '2024-05-01T10:00:00+00:00'),
+    ('2024-05-01T12:00:00+02:00', '2024-05-01T10:00:00+00:00'),
+    ('2024-05-01T10:00:00', '2024-05-01T10:00:00+00:00'),
+])
+def test_timestamp_normalized_to_utc(timestamp, stored):
+    assert to_log(_record(timestamp=timestamp)).timestamp == stored
+
+
+def test_repo_is_optional():
+    assert to_log(_record()).repo is None
+    assert to_log(_record(repo='')).repo is None
+    assert to_log(_record(repo='/src/app')).repo == '/src/app'
+    assert to_log(_record(repo=['/src/app'])) is None
+
+
+@pytest.mark.parametrize('fmt', ['jsonl', 'csv'])
+def test_round_trip_keeps_repo(tmp_path, monkeypatch, fmt):
+    monkeypatch.setattr(connection, 'DB_PATH', tmp_path / 'jrnl.db')
+    monkeypatch.setattr(connection, '_schema_ready', False)
+    insert_log(Log(timestamp='2024-05-01T10:00:00+00:00', log_message='Fixed the parser',
+                   type='git-hook', label='abc12345', repo='/src/app'))
+    insert_log(Log(timestamp='2024-05-01T11:00:00+00:00', log_message='Standup notes',
+                   type='manual', label='manual01'))
+
+    stream = io.StringIO()
+    assert write_logs(stream, fmt) == 2
+    stream.seek(0)
+    stats = ImportStats()
+    logs = list(read_csv(stream, stats) if fmt == 'csv' else read_jsonl(stream, stats))
+    assert [(log.label, log.repo) for log in logs] == [('abc12345', '/src/app'), ('manual01', None)]
+    assert stats.skipped == 0
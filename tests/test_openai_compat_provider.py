@@ -0,0 +1,97 @@
+"""OpenAI-compatible provider against the local fake LLM server."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.fake_llm_server import FakeLLMServer, fake_summary
+from jrnl.llm_providers.openai_compat_provider import OpenAICompatProvider
+from jrnl.llm_providers.prompts import COMPRESS_COMMIT_PROMPT
+
+
+@pytest.fixture
+def fake_server():
+    with FakeLLMServer() as server:
+        yield server
+
+
+def _provider(url, **config):
+    return OpenAICompatProvider(dict({'url': url, 'model': 'fake', 'timeout': 10}, **config))
+
+
+def _expected(message, diff):
+    return fake_summary(COMPRESS_COMMIT_PROMPT.format(commit_message=message, commit_diff=diff))
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_compress_commit(fake_server, stream):
+    provider = _provider(fake_server.url, stream=stream)
+    summary = provider.compress_commit('Fix login bug', '+ fixed = True')
+    assert summary == _expected('Fix login bug', '+ fixed = True')
+
+
+def test_base_url_with_v1_suffix(fake_server):
+    provider = _provider(f"{fake_server.url}/v1")
+    assert provider.test_connection()
+    assert provider.compress_commit('Fix', '') == _expected('Fix', '')
+
+
+def test_stream_chat_yields_pieces_and_usage(fake_server):
+    provider = _provider(fake_server.url)
+    usage = {}
+    pieces = list(provider.stream_chat('hello world', 50, usage=usage))
+    assert len(pieces) > 1
+    assert ''.join(pieces) == fake_summary('hello world')
+    assert usage['input_tokens'] == len('hello world') // 4
+    assert usage['output_tokens'] == len(pieces)
+
+
+def test_stream_setting_accepts_config_strings(fake_server):
+    # `jrnl config set` stores values as strings
+    assert _provider(fake_server.url, stream='true').stream
+    assert not _provider(fake_server.url, stream='false').stream
+
+
+def test_concurrent_calls_share_session(fake_server):
+    provider = _provider(fake_server.url, max_concurrency=4)
+    commits = [(f"Commit {i}", f"+ line {i}") for i in range(12)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        summaries = list(pool.map(lambda commit: provider.compress_commit(*commit), commits))
+    assert summaries == [_expected(*commit) for commit in commits]
+    assert fake_server.config.requests == 12
+
+
+def test_server_error_returns_placeholder():
+    with FakeLLMServer(error_rate=1.0) as server:
+        provider = _provider(server.url)
+        assert provider.compress_commit('Fix login bug', '') == '[OpenAI-Compat Error] Fix login bug'
+        with pytest.raises(RuntimeError):
+            provider.generate_daily([{'type': 'manual', 'log_message': 'x'}])
+
+
+def test_server_down_returns_placeholder():
+    server = FakeLLMServer().start()
+    url = server.url
+    server.stop()
+    provider = _provider(url)
+    assert provider.compress_commit('Fix login bug', '') == '[OpenAI-Compat Not Running] Fix login bug'
+    assert not provider.test_connection()
+
+
+def test_large_commit_combines_part_summaries(fake_server):
+    provider = _provider(fake_server.url)
+    chunks = [('a.py', '+ a = 1'), ('b.py', '+ b = 2'), ('c.py', '+ c = 3')]
+    summary = provider.compress_large_commit('Big change', '+ a = 1', chunks)
+    assert summary.startswith('Completed work item')
+    assert fake_server.config.requests == len(chunks) + 1  # Parts, then the combine step
+
+
+def test_large_commit_bounded_by_provider_timeout():
+    with FakeLLMServer(latency=3.0) as server:
+        provider = _provider(server.url, timeout=0.5)
+        start = time.monotonic()
+        summary = provider.compress_large_commit('Big change', '', [('a.py', '+ a'), ('b.py', '+ b')])
+        # Parts and the fallback each give up after the configured timeout
+        assert time.monotonic() - start < 2.5
+        assert summary.startswith('[OpenAI-Compat')
@@ -0,0 +1,82 @@
+"""Repairing placeholder logs, and keeping placeholders out of standups."""
+
+import subprocess
+
+import pytest
+
+from jrnl.api import Journal
+from jrnl.commands.repair import recompress
+from jrnl.config import Config
+from jrnl.database.models import Log
+from jrnl.utils.date_utils import get_utc_now
+
+
+class RecordingProvider:
+    """Stand-in LLM provider that echoes what it was given."""
+
+    def __init__(self):
+        self.daily_logs = None
+
+    def compress_commit(self, commit_message, commit_diff):
+        return f"Compressed {commit_message.strip()} with {len(commit_diff)} diff chars"
+
+    def generate_daily(self, logs, days=1):
+        self.daily_logs = logs
+        return 'Standup'
+
+
+@pytest.fixture
+def commit(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'CONFIG_PATH', tmp_path / 'config.json')
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+
+    def git(*args):
+        return subprocess.run(['git', '-C', str(repo)] + list(args),
+                              check=True, capture_output=True, text=True).stdout.strip()
+
+    git('init', '-q')
+    git('config', 'user.email', 'dev@example.com')
+    git('config', 'user.name', 'Dev')
+    (repo / 'login.py').write_text('def login():\n    return check_password()\n')
+    git('add', '-A')
+    git('commit', '-qm', 'Fix login')
+    return str(repo), git('rev-parse', 'HEAD')
+
+
+def _degraded(label, repo=None):
+    return Log(timestamp='2024-05-01T10:00:00+00:00', log_message='[LLM Error] Fix login',
+               type='git-hook', label=label, repo=repo)
+
+
+def test_log_without_repo_uses_fallback(commit):
+    repo, sha = commit
+    summary = recompress(_degraded(sha[:8]), RecordingProvider(), [repo])
+    assert summary.startswith('Compressed Fix login with')
+    assert not summary.endswith(' 0 diff chars')
+
+
+def test_stale_repo_path_uses_fallback(commit, tmp_path):
+    repo, sha = commit
+    summary = recompress(_degraded(sha[:8], repo=str(tmp_path / 'moved')), RecordingProvider(), [repo])
+    assert not summary.endswith(' 0 diff chars')
+
+
+def test_unknown_commit_compresses_message_alone(commit):
+    repo, _ = commit
+    summary = recompress(_degraded('00000000'), RecordingProvider(), [repo])
+    assert summary == 'Compressed Fix login with 0 diff chars'
+
+
+def test_standup_prompt_has_no_placeholders(tmp_path):
+    provider = RecordingProvider()
+    with Journal(tmp_path / 'jrnl.db', config={'collapse_similar_logs': False}) as journal:
+        journal.add_many([
+            Log(timestamp=get_utc_now(), log_message='[LLM Error] Fix login', type='git-hook', label='abc12345'),
+            'Reviewed the billing migration',
+        ])
+        journal.generate_daily(provider=provider, save=False)
+
+    assert sorted(log['log_message'] for log in provider.daily_logs) == [
+        'Fix login', 'Reviewed the billing migration'
+    ]
@@ -0,0 +1,59 @@
+"""Replay provider recording against a stand-in upstream."""
+
+import pytest
+
+from jrnl.llm_providers.replay_provider import ReplayProvider
+
+
+class FlakyUpstream:
+    """Upstream that fails until told otherwise."""
+
+    def __init__(self):
+        self.reply = '[LLM Error] Fix login bug'
+        self.calls = 0
+
+    def compress_commit(self, commit_message, commit_diff):
+        self.calls += 1
+        if self.reply is None:
+            raise RuntimeError("connection reset")
+        return self.reply
+
+
+@pytest.fixture
+def make_provider(tmp_path):
+    def make(mode='auto'):
+        provider = ReplayProvider({'mode': mode, 'cassette': str(tmp_path / 'cassette.jsonl'), 'latency': 'none'})
+        provider._upstream = upstream
+        return provider
+
+    upstream = FlakyUpstream()
+    make.upstream = upstream
+    make.cassette = tmp_path / 'cassette.jsonl'
+    return make
+
+
+def test_placeholder_not_recorded(make_provider):
+    provider = make_provider('auto')
+    assert provider.compress_commit('Fix login bug', '') == '[LLM Error] Fix login bug'
+    assert not make_provider.cassette.exists()
+
+    make_provider.upstream.reply = 'Fixed the login bug'
+    assert provider.compress_commit('Fix login bug', '') == 'Fixed the login bug'
+    assert provider.compress_commit('Fix login bug', '') == 'Fixed the login bug'
+    assert make_provider.upstream.calls == 2  # The third call was replayed
+
+
+def test_raising_call_not_recorded(make_provider):
+    make_provider.upstream.reply = None
+    provider = make_provider('record')
+    with pytest.raises(RuntimeError):
+        provider.compress_commit('Fix login bug', '')
+    assert not make_provider.cassette.exists()
+
+
+def test_recorded_placeholder_ignored_on_replay(make_provider):
+    make_provider.cassette.write_text(
+        '{"key": "x", "kind": "compress_commit", "latency": 0, "response": "[Ollama Timeout] Fix"}\n'
+    )
+    provider = make_provider('replay')
+    assert 'x' not in provider._load()
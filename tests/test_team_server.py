@@ -0,0 +1,172 @@
+"""Team server: ingest, dedupe and standup caching over real HTTP."""
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from jrnl.commands.push import push
+from jrnl.database import connection
+from jrnl.database.models import Log
+from jrnl.database.operations import get_log_by_label, insert_log, update_log_messages
+from jrnl.server.app import TeamServer
+
+
+class CountingProvider:
+    """Stand-in LLM provider that records how often it is asked for a daily."""
+
+    def __init__(self, reply='Worked on things'):
+        self.reply = reply
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_daily(self, logs, days=1):
+        with self._lock:
+            self.calls += 1
+        return f"{self.reply} ({len(logs)} logs)"
+
+
+def _today():
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _log(label, message='Did a thing'):
+    return {'label': label, 'timestamp': f"{_today()}T09:00:00+00:00",
+            'log_message': message, 'type': 'manual'}
+
+
+@pytest.fixture
+def provider():
+    return CountingProvider()
+
+
+@pytest.fixture
+def server(tmp_path, provider):
+    with TeamServer(tmp_path / 'team.db', port=0, provider_factory=lambda: provider,
+                    refresh_interval=None, quiet=True) as team_server:
+        yield team_server
+
+
+def _ingest(server, user, logs=(), dailies=()):
+    response = requests.post(f"{server.url}/api/v1/ingest",
+                             json={'user': user, 'logs': list(logs), 'dailies': list(dailies)},
+                             timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def test_ingest_dedupes_by_label(server):
+    first = _ingest(server, 'alice', [_log('a1'), _log('a2')])
+    assert first == {'logs_received': 2, 'logs_inserted': 2, 'logs_updated': 0, 'dailies_stored': 0}
+
+    again = _ingest(server, 'alice', [_log('a1'), _log('a3')])
+    assert again['logs_inserted'] == 1
+    assert again['logs_updated'] == 0
+
+    # The same label from another user is a different log
+    assert _ingest(server, 'bob', [_log('a1')])['logs_inserted'] == 1
+
+    logs = requests.get(f"{server.url}/api/v1/users/alice/logs", timeout=10).json()['logs']
+    assert sorted(log['label'] for log in logs) == ['a1', 'a2', 'a3']
+
+
+def test_ingest_rejects_bad_payload(server):
+    response = requests.post(f"{server.url}/api/v1/ingest", json={'logs': []}, timeout=10)
+    assert response.status_code == 400
+    assert 'user' in response.json()['error']
+
+
+def test_standup_cached_until_new_logs(server, provider):
+    _ingest(server, 'alice', [_log('a1')])
+    _ingest(server, 'bob', [_log('b1')])
+
+    standup = requests.get(f"{server.url}/api/v1/team/standup", timeout=10).json()
+    assert [section['user'] for section in standup['users']] == ['alice', 'bob']
+    assert provider.calls == 2
+
+    requests.get(f"{server.url}/api/v1/team/standup", timeout=10).raise_for_status()
+    assert provider.calls == 2  # Both summaries served from the cache
+
+    _ingest(server, 'alice', [_log('a2')])
+    standup = requests.get(f"{server.url}/api/v1/team/standup", timeout=10).json()
+    assert provider.calls == 3  # Only alice's summary was stale
+    assert standup['users'][0]['summary'].endswith('(2 logs)')
+
+
+def test_ingest_replaces_changed_log(server, provider):
+    _ingest(server, 'alice', [_log('a1', '[LLM Error] Fix login')])
+    requests.get(f"{server.url}/api/v1/users/alice/summary", timeout=10).raise_for_status()
+    assert provider.calls == 1
+
+    result = _ingest(server, 'alice', [_log('a1', 'Fixed the login bug')])
+    assert (result['logs_inserted'], result['logs_updated']) == (0, 1)
+    logs = requests.get(f"{server.url}/api/v1/users/alice/logs", timeout=10).json()['logs']
+    assert [log['log_message'] for log in logs] == ['Fixed the login bug']
+
+    # The cached summary was built from the placeholder
+    requests.get(f"{server.url}/api/v1/users/alice/summary", timeout=10).raise_for_status()
+    assert provider.calls == 2
+
+
+def test_push_resends_repaired_logs(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(connection, 'DB_PATH', tmp_path / 'jrnl.db')
+    monkeypatch.setattr(connection, '_schema_ready', False)
+    insert_log(Log(**_log('abc12345', '[LLM Error] Fix login')))
+    insert_log(Log(**_log('def67890', 'Wrote docs')))
+
+    with requests.Session() as session:
+        assert push(session, server.url, 'alice') == (2, 0)
+        assert push(session, server.url, 'alice') == (0, 0)
+
+        update_log_messages([(get_log_by_label('abc12345').id, 'Fixed the login bug')])
+        assert push(session, server.url, 'alice') == (1, 0)
+        assert push(session, server.url, 'alice') == (0, 0)
+
+    logs = requests.get(f"{server.url}/api/v1/users/alice/logs", timeout=10).json()['logs']
+    assert sorted(log['log_message'] for log in logs) == ['Fixed the login bug', 'Wrote docs']
+
+
+def test_pushed_daily_used_without_provider(server, provider):
+    daily = {'daily_date': _today(), 'daily_message': 'My own standup',
+             'timestamp': f"{_today()}T17:00:00+00:00"}
+    _ingest(server, 'alice', [_log('a1')], [daily])
+
+    body = requests.get(f"{server.url}/api/v1/users/alice/summary", timeout=10).json()
+    assert body['summary'] == 'My own standup'
+    assert provider.calls == 0
+
+
+def test_degraded_summary_not_cached(server, provider):
+    provider.reply = '[Anthropic Error] Failed to generate daily'
+    _ingest(server, 'alice', [_log('a1')])
+
+    response = requests.get(f"{server.url}/api/v1/users/alice/summary", timeout=10)
+    assert response.status_code == 502
+    assert server.store.get_summary('alice', _today()) is None
+
+    provider.reply = 'Recovered'
+    body = requests.get(f"{server.url}/api/v1/users/alice/summary", timeout=10).json()
+    assert body['summary'].startswith('Recovered')
+
+
+def test_unconfigured_provider_is_503(tmp_path):
+    def factory():
+        raise ValueError("Anthropic API key not configured")
+
+    with TeamServer(tmp_path / 'team.db', port=0, provider_factory=factory,
+                    refresh_interval=None, quiet=True) as team_server:
+        _ingest(team_server, 'alice', [_log('a1')])
+        response = requests.get(f"{team_server.url}/api/v1/team/standup", timeout=10)
+        assert response.status_code == 503
+        assert 'API key' in response.json()['error']
+
+
+def test_token_required(tmp_path):
+    with TeamServer(tmp_path / 'team.db', port=0, token='secret',
+                    refresh_interval=None, quiet=True) as team_server:
+        assert requests.get(f"{team_server.url}/api/v1/health", timeout=10).status_code == 200
+        assert requests.get(f"{team_server.url}/api/v1/users", timeout=10).status_code == 401
+        response = requests.get(f"{team_server.url}/api/v1/users", timeout=10,
+                                headers={'Authorization': 'Bearer secret'})
+        assert response.status_code == 200
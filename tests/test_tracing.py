@@ -0,0 +1,40 @@
+"""Tracing: bounded event buffer and spans around database work."""
+
+from collections import deque
+
+import pytest
+
+from jrnl.database import connection
+from jrnl.utils import tracing
+
+
+@pytest.fixture
+def traced(tmp_path, monkeypatch):
+    monkeypatch.setattr(connection, 'DB_PATH', tmp_path / 'jrnl.db')
+    monkeypatch.setattr(connection, '_schema_ready', False)
+    monkeypatch.setattr(tracing, '_events', deque(maxlen=5))
+    monkeypatch.setattr(tracing, '_dropped', 0)
+    monkeypatch.setattr(tracing, '_enabled', False)
+    tracing.enable()
+    yield tracing
+    monkeypatch.setattr(tracing, '_enabled', False)
+
+
+def test_buffer_keeps_latest_events(traced):
+    for i in range(8):
+        with traced.span(f'step{i}'):
+            pass
+    assert [e['name'] for e in traced._events] == ['step3', 'step4', 'step5', 'step6', 'step7']
+    assert 'dropped=3' in traced.summary_line('test')
+
+
+def test_connection_span_sees_exception(traced):
+    def failing_lookup():
+        with connection.get_connection() as conn:
+            conn.execute('SELECT 1')
+            raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        failing_lookup()
+    assert traced._events[-1]['name'] == 'failing_lookup'
+    assert traced._events[-1]['args'] == {'error': 'ValueError'}
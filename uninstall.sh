@@ -32,33 +32,46 @@ fi
 echo
 echo "Uninstalling JRNL..."
 
+# Remove JRNL from one hook
+remove_hook() {
+    HOOK_FILE="$1"
+    HOOK_NAME=$(basename "$HOOK_FILE")
+
+    if [ ! -f "$HOOK_FILE" ]; then
+        return
+    fi
+
+    # Remove JRNL-specific lines
+    if grep -q "JRNL" "$HOOK_FILE"; then
+        echo "Removing JRNL from $HOOK_NAME hook..."
+
+        # Create temp file without JRNL lines
+        grep -v "JRNL" "$HOOK_FILE" | \
+        grep -v "jrnl" | \
+        grep -v "disown" > "$HOOK_FILE.tmp"
+
+        # Check if hook is now empty (only shebang or empty)
+        if [ $(wc -l < "$HOOK_FILE.tmp") -le 2 ]; then
+            rm "$HOOK_FILE"
+            echo "✓ Removed empty $HOOK_NAME hook"
+        else
+            mv "$HOOK_FILE.tmp" "$HOOK_FILE"
+            chmod +x "$HOOK_FILE"
+            echo "✓ Removed JRNL from $HOOK_NAME hook"
+        fi
+
+        # Clean up temp file if it exists
+        rm -f "$HOOK_FILE.tmp"
+    fi
+}
+
 # Remove git hooks
 remove_git_hooks() {
     HOOKS_PATH=$(git config --global core.hooksPath 2>/dev/null || echo "")
 
-    if [ -n "$HOOKS_PATH" ] && [ -f "$HOOKS_PATH/post-commit" ]; then
-        echo "Removing JRNL from git hooks..."
-
-        # Remove JRNL-specific lines
-        if grep -q "JRNL" "$HOOKS_PATH/post-commit"; then
-            # Create temp file without JRNL lines
-            grep -v "JRNL" "$HOOKS_PATH/post-commit" | \
-            grep -v "jrnl" | \
-            grep -v "disown" > "$HOOKS_PATH/post-commit.tmp"
-
-            # Check if hook is now empty (only shebang or empty)
-            if [ $(wc -l < "$HOOKS_PATH/post-commit.tmp") -le 2 ]; then
-                rm "$HOOKS_PATH/post-commit"
-                echo "✓ Removed empty post-commit hook"
-            else
-                mv "$HOOKS_PATH/post-commit.tmp" "$HOOKS_PATH/post-commit"
-                chmod +x "$HOOKS_PATH/post-commit"
-                echo "✓ Removed JRNL from post-commit hook"
-            fi
-
-            # Clean up temp file if it exists
-            rm -f "$HOOKS_PATH/post-commit.tmp"
-        fi
+    if [ -n "$HOOKS_PATH" ]; then
+        remove_hook "$HOOKS_PATH/post-commit"
+        remove_hook "$HOOKS_PATH/post-rewrite"
     fi
 }
 